@@ -0,0 +1,326 @@
+"""Headless JSON API serving the parsed portfolio content.
+
+    python api.py [--host 0.0.0.0] [--port 8000]      (or: uvicorn api:app)
+
+A small ASGI app over the same loaders and parsers as app.py, without
+Streamlit's per-session overhead:
+
+    GET /v1/resume  /v1/publications  /v1/projects  /v1/about  /v1  (all four)
+    GET /healthz  /readyz
+
+``?tenant=<id>`` selects a tenant. ``?ref=<branch|tag|sha>&preview_key=...``
+renders another ref through preview.PREVIEWS, gated like the app's previews
+(PORTFOLIO_PREVIEW_KEY / PORTFOLIO_PREVIEW_ENABLED). Bodies are encoded and
+compressed once per content version. Every response carries a strong ETag,
+and ``If-None-Match`` is answered with 304. Missing files are 404; upstream
+and parse failures are 502.
+"""
+import os, sys, json, gzip, asyncio, argparse, hashlib, threading
+from collections import OrderedDict
+from typing import Dict, Any, Callable, List, NamedTuple, Optional, Tuple
+from urllib.parse import parse_qs
+
+try:  # optional: ~20% smaller than gzip for JSON
+    import brotli
+except ImportError:
+    brotli = None
+
+import github_client
+from config import DEFAULT_TENANT
+from github_client import CONTENT, ContentCache, ContentKey, UpstreamError
+from ingest import IngestError
+from loaders import (
+    download_raw_file, download_raw_text, load_projects_from_github, load_publications_from_github,
+    load_resume_from_github,
+)
+from preview import PREVIEWS, PreviewDenied, preview_ref
+from tenants import TENANTS, Tenant
+from readiness import READINESS
+from warmup import warm_until_ready
+
+API_HOST = os.environ.get("PORTFOLIO_API_HOST", "0.0.0.0")
+API_PORT = int(os.environ.get("PORTFOLIO_API_PORT", "8000"))
+API_MAX_AGE = int(os.environ.get("PORTFOLIO_API_MAX_AGE", "60"))
+RESPONSE_CACHE_ENTRIES = 256
+# Previews cost uncached upstream fetches: off unless a key is set (as in the app)
+PREVIEW_KEY = os.environ.get("PORTFOLIO_PREVIEW_KEY", "")
+PREVIEW_ENABLED = os.environ.get("PORTFOLIO_PREVIEW_ENABLED")
+MIN_COMPRESS_BYTES = 512  # smaller bodies are sent as-is
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 5
+
+
+# ---------------------------
+# Encoded bodies, one per content version
+# ---------------------------
+class Encoded(NamedTuple):
+    etag: str  # strong, of the identity body; encodings get a suffix
+    bodies: Dict[str, bytes]  # content-coding ("identity", "gzip", "br") -> body
+
+
+def encode(value: Any) -> Encoded:
+    body = json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    bodies = {"identity": body}
+    if len(body) >= MIN_COMPRESS_BYTES:
+        bodies["gzip"] = gzip.compress(body, GZIP_LEVEL, mtime=0)
+        if brotli is not None:
+            bodies["br"] = brotli.compress(body, quality=BROTLI_QUALITY)
+    return Encoded(hashlib.blake2b(body, digest_size=16).hexdigest(), bodies)
+
+
+class ResponseCache:
+    """Last encoded response per (route, tenant, ref), LRU-bounded; reused while the loaders return the same objects."""
+
+    def __init__(self, max_entries: int = RESPONSE_CACHE_ENTRIES):
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Tuple[str, str, str], Tuple[Any, Encoded]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Tuple[str, str, str], source: Any, build: Callable[[], Any]) -> Encoded:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and (entry[0] is source or entry[0] == source):
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+        encoded = encode(build())
+        with self._lock:
+            self.misses += 1
+            self._entries[key] = (source, encoded)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return encoded
+
+
+RESPONSES = ResponseCache()
+
+
+# ---------------------------
+# Content (blocking loaders, run in a worker thread)
+# ---------------------------
+def projects_json(text: str) -> Dict[str, Any]:
+    items = [line[2:].strip() for line in text.splitlines() if line.startswith("• ")]
+    return {"text": text, "items": items}
+
+
+class NotFound(LookupError):
+    pass
+
+
+def require(cache: ContentCache, owner: str, repo: str, branch: str, path: str) -> bytes:
+    # A missing file is 404; no copy because upstream failed is 502
+    data = download_raw_file(owner, repo, path, branch, cache=cache)
+    if data is None:
+        if cache.missing(ContentKey(owner, repo, branch, path)):
+            raise NotFound(f"{path} not found on {owner}/{repo}@{branch}")
+        raise UpstreamError(f"{path} could not be downloaded from {owner}/{repo}@{branch}")
+    return data
+
+
+def load_section(route: str, tenant: Tenant, ref: Optional[str]) -> Encoded:
+    owner, repo, branch = tenant.owner, tenant.repo, ref or tenant.branch
+    cache = PREVIEWS.cache_for(owner, repo, ref) if ref else CONTENT
+    key = (route, tenant.id, branch)
+
+    def present(path: str) -> bool:
+        # The single-section routes 404 on a missing file; the combined one reports it as null
+        try:
+            require(cache, owner, repo, branch, path)
+        except NotFound:
+            if route != "all":
+                raise
+            return False
+        return True
+
+    if route in ("resume", "all"):
+        require(cache, owner, repo, branch, tenant.resume_path)
+    if route == "resume":
+        resume = load_resume_from_github(owner, repo, tenant.resume_path, branch, cache=cache)
+        return RESPONSES.get(key, resume, resume.to_dict)
+    if route == "publications":
+        present("publications.json")
+        pubs = load_publications_from_github(owner, repo, branch, cache=cache)
+        return RESPONSES.get(key, pubs, lambda: [p.to_dict() for p in pubs])
+    if route == "projects":
+        present(tenant.projects_path)
+        text = load_projects_from_github(owner, repo, branch, path=tenant.projects_path, cache=cache)
+        return RESPONSES.get(key, text, lambda: projects_json(text))
+    if route == "about":
+        present("aboutpage.txt")
+        text = download_raw_text(owner, repo, "aboutpage.txt", branch, cache=cache)
+        return RESPONSES.get(key, text, lambda: {"text": text})
+    resume = load_resume_from_github(owner, repo, tenant.resume_path, branch, cache=cache)
+    pubs = load_publications_from_github(owner, repo, branch, cache=cache) if present("publications.json") else None
+    projects = (
+        load_projects_from_github(owner, repo, branch, path=tenant.projects_path, cache=cache)
+        if present(tenant.projects_path) else None
+    )
+    about = download_raw_text(owner, repo, "aboutpage.txt", branch, cache=cache) if present("aboutpage.txt") else None
+    return RESPONSES.get(key, (resume, pubs, projects, about), lambda: {
+        "resume": resume.to_dict(),
+        "publications": None if pubs is None else [p.to_dict() for p in pubs],
+        "projects": None if projects is None else projects_json(projects),
+        "about": None if about is None else {"text": about},
+    })
+
+
+ROUTES = {"/v1": "all", "/v1/resume": "resume", "/v1/publications": "publications",
+          "/v1/projects": "projects", "/v1/about": "about"}
+
+
+# ---------------------------
+# HTTP helpers
+# ---------------------------
+def pick_encoding(accept: str, available: Dict[str, bytes]) -> str:
+    offered = {}
+    for part in accept.split(","):
+        name, _, params = part.strip().partition(";")
+        q = 1.0
+        if params.strip().startswith("q="):
+            try:
+                q = float(params.strip()[2:])
+            except ValueError:
+                q = 0.0
+        offered[name.strip().lower()] = q
+    for coding in ("br", "gzip"):
+        if coding in available and offered.get(coding, offered.get("*", 0.0)) > 0:
+            return coding
+    return "identity"
+
+
+def etag_for(encoded: Encoded, coding: str) -> str:
+    return f'"{encoded.etag}"' if coding == "identity" else f'"{encoded.etag}-{coding}"'
+
+
+def not_modified(if_none_match: str, encoded: Encoded) -> bool:
+    # Weak comparison (RFC 9110 13.1.2); any representation of this version matches
+    if if_none_match.strip() == "*":
+        return True
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag.startswith("W/"):
+            tag = tag[2:]
+        if tag.strip('"').split("-", 1)[0] == encoded.etag:
+            return True
+    return False
+
+
+async def send(
+    asgi_send, status: int, body: bytes = b"", headers: Optional[List[Tuple[str, str]]] = None, head: bool = False
+):
+    raw = [(k.lower().encode("latin-1"), v.encode("latin-1")) for k, v in headers or []]
+    if status != 304:
+        raw.append((b"content-length", str(len(body)).encode("latin-1")))
+    await asgi_send({"type": "http.response.start", "status": status, "headers": raw})
+    await asgi_send({"type": "http.response.body", "body": b"" if head or status == 304 else body})
+
+
+async def send_json(asgi_send, status: int, value: Any):
+    await send(asgi_send, status, json.dumps(value).encode("utf-8"),
+               [("Content-Type", "application/json"), ("Cache-Control", "no-store")])
+
+
+# ---------------------------
+# ASGI app
+# ---------------------------
+async def app(scope, receive, asgi_send):
+    if scope["type"] == "lifespan":
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                startup()
+                await asgi_send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                await asgi_send({"type": "lifespan.shutdown.complete"})
+                return
+    if scope["type"] != "http":
+        return
+
+    path = scope["path"].rstrip("/") or "/"
+    if scope["method"] not in ("GET", "HEAD"):
+        await send(asgi_send, 405, b"", [("Allow", "GET, HEAD")])
+        return
+    if path == "/healthz":
+        await send_json(asgi_send, 200, {"state": "alive"})
+        return
+    if path == "/readyz":
+        await send_json(asgi_send, 200 if READINESS.ready else 503, READINESS.snapshot())
+        return
+    route = ROUTES.get(path)
+    if route is None:
+        await send_json(asgi_send, 404, {"error": "not found"})
+        return
+
+    query = {k: v[-1] for k, v in parse_qs(scope.get("query_string", b"").decode("latin-1")).items()}
+    tenant = TENANTS.get(query.get("tenant")) or DEFAULT_TENANT
+    try:
+        enabled = None if PREVIEW_ENABLED is None else PREVIEW_ENABLED not in ("", "0", "false")
+        ref = preview_ref(query.get("ref"), tenant.branch, query.get("preview_key"), PREVIEW_KEY, enabled)
+    except PreviewDenied as e:
+        await send_json(asgi_send, 403, {"error": str(e)})
+        return
+
+    try:
+        encoded = await asyncio.get_running_loop().run_in_executor(None, load_section, route, tenant, ref)
+    except NotFound as e:
+        await send_json(asgi_send, 404, {"error": e.args[0]})
+        return
+    except IngestError as e:
+        await send_json(asgi_send, 502, {"error": f"content could not be parsed: {e}"})
+        return
+    except (UpstreamError, RuntimeError) as e:  # RuntimeError: resume not downloadable
+        await send_json(asgi_send, 502, {"error": str(e)})
+        return
+
+    headers = {k.decode("latin-1").lower(): v.decode("latin-1") for k, v in scope.get("headers", [])}
+    coding = pick_encoding(headers.get("accept-encoding", ""), encoded.bodies)
+    response_headers = [
+        ("ETag", etag_for(encoded, coding)),
+        ("Cache-Control", f"public, max-age={API_MAX_AGE}"),
+        ("Vary", "Accept-Encoding"),
+    ]
+    if not_modified(headers.get("if-none-match", ""), encoded):
+        await send(asgi_send, 304, b"", response_headers)
+        return
+    response_headers.append(("Content-Type", "application/json; charset=utf-8"))
+    if coding != "identity":
+        response_headers.append(("Content-Encoding", coding))
+    await send(asgi_send, 200, encoded.bodies[coding], response_headers, head=scope["method"] == "HEAD")
+
+
+_started = threading.Lock()
+_warming: Optional[threading.Thread] = None
+
+
+def startup():
+    # Secrets are not available outside Streamlit; tokens come from the environment (as in warmup.py)
+    global _warming
+    with _started:
+        if _warming is not None:
+            return
+        tokens = [os.environ.get("GITHUB_TOKEN")] + [t for t in os.environ.get("GITHUB_TOKENS", "").split(",") if t]
+        github_client.configure(tokens, background_refresh=os.environ.get("GITHUB_BACKGROUND_REFRESH", "1") != "0")
+        _warming = threading.Thread(target=warm_until_ready, name="warmup", daemon=True)
+        _warming.start()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default=API_HOST)
+    parser.add_argument("--port", type=int, default=API_PORT)
+    parser.add_argument("--workers", type=int, default=1)
+    args = parser.parse_args(argv)
+    try:
+        import uvicorn
+    except ImportError:
+        print("[api] uvicorn is required to serve the API (pip install uvicorn)", file=sys.stderr)
+        return 1
+    uvicorn.run("api:app", host=args.host, port=args.port, workers=args.workers, log_level="warning")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
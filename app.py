@@ -1,7 +1,25 @@
 import streamlit as st
-import requests, io, re, os, base64, json
-from docx import Document
-from typing import Dict, Any, Optional
+import re, os, html, hmac, uuid, random, hashlib
+from typing import Dict, Any, Optional, Tuple
+
+from asset_manifest import ASSETS, AVATARS, AssetRegistry, Avatar, registry_for
+from payload import PayloadMeter
+from profiler import RunProfile
+from events import EVENTS
+import github_client
+import bundle
+from github_client import CONTENT, HEDGED, REFRESHER, TOKENS
+from tenants import TENANTS
+from models import Education, Job, Publication
+from incremental import BLOCKS, FRAGMENTS, RESUME_HISTORY
+import search
+from search import SearchIndex
+from config import DEFAULT_TENANT
+from readiness import READINESS
+from ingest import IngestError
+from loaders import download_raw_text, load_projects_from_github, load_publications_from_github, load_resume_from_github
+from preview import PREVIEWS, PreviewDenied, preview_ref
+from history import HISTORY, HistoryError, Snapshot
 
 # ======================================================
 # MUST BE FIRST STREAMLIT COMMAND (KEEP ONLY ONCE)
@@ -9,239 +27,12 @@ from typing import Dict, Any, Optional
 st.set_page_config(page_title="Akhila — Portfolio", layout="wide")
 
 # ---------------------------
-# CONFIG - CHANGE THESE
+# CONFIG - CHANGE THESE in config.py (repo, resume path, branch, profile image)
 # ---------------------------
-GITHUB_OWNER = "Akhila-A2610"
-GITHUB_REPO = "Portfolio"
-RESUME_PATH_IN_REPO = "Akhila_A_Resume.docx"
-BRANCH = "main"
 
-# Optional local assets (stored in repo)
-PROFILE_IMG = "assets/profile.jpg"
-COMPANY_LOGOS = {
-    "Utah State University": "assets/company_logos/usu.jfif",
-    # "LTIMindtree": "assets/company_logos/ltimindtree.png",
-    # "Tata Consultancy Services": "assets/company_logos/tcs.jfif",
-    "Hitachi": "assets/company_logos/hitachi.png",
-    "Western Union": "assets/company_logos/western union.png",
-    "GE HealthCare": "assets/company_logos/gehealthcare.png",
-
-}
-
-EDU_LOGOS = {
-    "Utah State University": "assets/edu_logos/USU_CS.jpg",
-    "Jawaharlal Nehru Technological University": "assets/edu_logos/JNTUH.jpg",
-}
-
-CERT_LOGOS = {
-    "Databricks Generative AI Fundamentals": "assets/certs_logos/databricks.png",
-    "Databricks Lakehouse Fundamentals": "assets/certs_logos/lakehouse-fundamentals.png",
-    "Microsoft Certified: Azure Data Fundamentals": "assets/certs_logos/azure-data-fundamentals.png"
-}
-
-LINKEDIN_USER = "akhilaa2610"
-
-
-# ---------------------------
-# Helpers: GitHub raw download
-# ---------------------------
-def download_raw_file(
-    owner: str, repo: str, path: str, branch: str = "main", token: Optional[str] = None
-) -> Optional[bytes]:
-    raw_url = f"https://raw.githubusercontent.com/{owner}/{repo}/{branch}/{path}"
-    headers = {}
-    if token:
-        headers["Authorization"] = f"Bearer {token}"
-    r = requests.get(raw_url, headers=headers, timeout=30)
-    if r.status_code == 200:
-        return r.content
-    return None
-
-
-def download_raw_text(
-    owner: str, repo: str, path: str, branch: str = "main", token: Optional[str] = None
-) -> Optional[str]:
-    b = download_raw_file(owner, repo, path, branch, token)
-    if not b:
-        return None
-    try:
-        return b.decode("utf-8")
-    except Exception:
-        return b.decode("utf-8", errors="replace")
-
-
-# ---------------------------
-# Parse .docx (resume)
-# ---------------------------
-def parse_resume_docx_bytes(docx_bytes: bytes) -> Dict[str, Any]:
-    doc = Document(io.BytesIO(docx_bytes))
-    para_lines = [p.text.strip() for p in doc.paragraphs if p.text and p.text.strip()]
-
-    parsed: Dict[str, Any] = {
-        "name": "",
-        "role": "Senior Data Engineer | Data Scientist",
-        "contact_line": "",
-        "summary": "",
-        "publications": [],
-        "experience": {},
-        "education": [],
-        "certifications": [],
-    }
-
-    if not para_lines:
-        return parsed
-
-    parsed["name"] = para_lines[0]
-    if len(para_lines) > 1:
-        parsed["contact_line"] = para_lines[1]
-
-    def clean_bullet(s: str) -> str:
-        return s.replace("•", "").strip()
-
-    HEADINGS = {
-        "PROFESSIONAL SUMMARY": "summary",
-        "PUBLICATIONS": "publications",
-        "PROFESSIONAL EXPERIENCE": "experience",
-        "EDUCATION": "education",
-        "CERTIFICATIONS & ACHIEVEMENTS": "certifications",
-        "CERTIFICATIONS": "certifications",
-        "ACHIEVEMENTS": "certifications",
-        # ignore these if they exist in resume
-        "TECHNICAL SKILLS": "ignore",
-        "SKILLS": "ignore",
-    }
-
-    section: Optional[str] = None
-    current_job: Optional[str] = None
-
-    job_header_re = re.compile(
-        r""".+,\s*.+\s+
-            ((Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)
-            |January|February|March|April|May|June|July|August|September|October|November|December)
-            \s+\d{4}\s*[–-]\s*
-            (Present|
-            ((Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)
-            |January|February|March|April|May|June|July|August|September|October|November|December)
-            \s+\d{4})
-        """,
-        re.IGNORECASE | re.VERBOSE,
-    )
-
-    i = 2
-    while i < len(para_lines):
-        s = para_lines[i]
-        s_u = s.upper().strip()
-
-        if s_u in HEADINGS:
-            section = HEADINGS[s_u]
-            current_job = None
-            i += 1
-            continue
-
-        if section == "ignore":
-            i += 1
-            continue
-
-        if section == "summary":
-            parsed["summary"] += s + "\n"
-            i += 1
-            continue
-
-        if section == "publications":
-            if s.strip().startswith("•"):
-                parsed["publications"].append(clean_bullet(s))
-            else:
-                if parsed["publications"]:
-                    parsed["publications"][-1] += " " + s.strip()
-                else:
-                    parsed["publications"].append(s.strip())
-            i += 1
-            continue
-
-        if section == "experience":
-            if job_header_re.search(s) and "•" not in s:
-                current_job = s.strip()
-                parsed["experience"][current_job] = []
-                i += 1
-                continue
-
-            if current_job and s.strip().startswith("•"):
-                parsed["experience"][current_job].append(clean_bullet(s))
-                i += 1
-                continue
-
-            if current_job and parsed["experience"][current_job]:
-                parsed["experience"][current_job][-1] += " " + s.strip()
-                i += 1
-                continue
-
-            i += 1
-            continue
-
-        if section == "education":
-            parsed["education"].append(s.strip())
-            i += 1
-            continue
-
-        if section == "certifications":
-            if s.strip().startswith("•"):
-                parsed["certifications"].append(clean_bullet(s))
-            else:
-                if parsed["certifications"]:
-                    parsed["certifications"][-1] += " " + s.strip()
-                else:
-                    parsed["certifications"].append(s.strip())
-            i += 1
-            continue
-
-        i += 1
-
-    parsed["summary"] = parsed["summary"].strip()
-    return parsed
-
-
-# ---------------------------
-# Projects loader (projects.docx in repo root)
-# ---------------------------
-def load_projects_from_github(
-    owner: str, repo: str, branch: str = "main", token: Optional[str] = None
-) -> str:
-    projects_path = "projects.docx"
-    content_bytes = download_raw_file(owner, repo, projects_path, branch, token)
-    if not content_bytes:
-        return "projects.docx not found in your GitHub repo root."
-
-    doc = Document(io.BytesIO(content_bytes))
-    paragraphs = [p.text.strip() for p in doc.paragraphs if p.text.strip()]
-    return "\n".join([f"• {p}" for p in paragraphs])
-
-
-# ---------------------------
-# Load resume from GitHub (Streamlit cache)
-# ---------------------------
-@st.cache_data(show_spinner=False)
-def load_resume_from_github(
-    owner: str, repo: str, path: str, branch: str = "main", token: Optional[str] = None
-) -> Dict[str, Any]:
-    content_bytes = download_raw_file(owner, repo, path, branch, token)
-    if content_bytes is None:
-        raise RuntimeError("Could not download resume file from GitHub (check file name/path).")
-    return parse_resume_docx_bytes(content_bytes)
-
-
-# ---------------------------
-# Publications loader (publications.json)
-# ---------------------------
-def load_publications_from_github(
-    owner: str, repo: str, branch: str = "main", token: Optional[str] = None
-) -> list[dict]:
-    b = download_raw_file(owner, repo, "publications.json", branch, token)
-    if not b:
-        return []
-    try:
-        return json.loads(b.decode("utf-8"))
-    except Exception:
-        return []
+# Prebaked content (python bundle.py build-bundle), memory-mapped once per process:
+# seeds the content cache, parsed models, logos and avatar before the first visitor
+BUNDLE = bundle.load_once()
 
 
 # ---------------------------
@@ -304,171 +95,123 @@ def pick_cert_logo(cert_line: str, logo_map: Dict[str, str]) -> Optional[str]:
 # ---------------------------
 # UI helpers 
 # ---------------------------
+# Stylesheet lives in static/portfolio.css. With static serving enabled
+# (.streamlit/config.toml) each rerun only sends a short <link> with a content
+# hash, and the browser keeps the stylesheet cached across reruns/sessions.
+STATIC_DIR = "static"
+STYLESHEET = "portfolio.css"
+
+
+@st.cache_resource(show_spinner=False)
+def load_stylesheet() -> Tuple[str, str]:
+    raw = BUNDLE.blob(f"css:{STYLESHEET}") if BUNDLE else None
+    if raw is None:
+        with open(os.path.join(STATIC_DIR, STYLESHEET), "rb") as f:
+            raw = f.read()
+    return raw.decode("utf-8"), hashlib.sha256(raw).hexdigest()[:12]
+
+
+def static_serving_enabled() -> bool:
+    try:
+        return bool(st.get_option("server.enableStaticServing"))
+    except Exception:
+        return False
+
+
 def css():
-    st.markdown(
-        """
-<style>
-/* Hide Streamlit top chrome */
-header { visibility: hidden; height: 0px; }
-footer { visibility: hidden; height: 0px; }
-[data-testid="stHeader"] { display: none; }
-[data-testid="stToolbar"] { display: none; }
-
-/* Remove default top padding */
-.main .block-container { padding-top: 0rem !important; }
-section.main > div { padding-top: 0rem !important; }
-div.block-container { padding-top: 0rem !important; }
-
-/* Hide accidental code rendering */
-div[data-testid="stMarkdownContainer"] pre { display: none !important; }
-
-/* Theme */
-.stApp { background-color: #0b0f19; color: white; }
-.muted { color: #b9c0d4; }
-
-/* Sticky header */
-.sticky {
-  position: fixed;
-  top: 0; left: 0;
-  width: 100%;
-  background: rgba(11,15,25,0.96);
-  backdrop-filter: blur(10px);
-  border-bottom: 2px solid rgba(135,206,250,0.75);
-  z-index: 9999;
-  padding: 14px 18px;
-}
-.header-row {
-  display:flex;
-  align-items:flex-start;
-  justify-content:space-between;
-  gap: 18px;
-  max-width: 1200px;
-  margin: 0 auto;
-}
-.id-row { display:flex; align-items:center; gap:14px; min-width: 360px; }
-.avatar {
-  width: 74px;
-  height: 74px;
-  border-radius: 50%;
-  object-fit: cover;
-  border: 2px solid rgba(135,206,250,0.75);
-}
-.nav {
-  display:flex;
-  flex-wrap:wrap;
-  gap:10px;
-  justify-content:flex-end;
-  padding-top:6px;
-  max-width:560px;
-}
-.nav a {
-  background:#11a9c0;
-  color:white !important;
-  text-decoration:none !important;
-  padding:10px 14px;
-  border-radius:8px;
-  font-weight:800;
-  font-size:14px;
-  white-space:nowrap;
-}
-.nav a:hover { background:#02839a; }
-
-/* Spacer pushes content below sticky header */
-.spacer { height: 155px; }
-a[id] { scroll-margin-top: 175px; }
-
-/* Section titles (Saichand-style) */
-.section-title {
-  font-size: 34px;
-  font-weight: 900;
-  margin: 22px 0 6px 0;
-}
-.section-sub {
-  color: #b9c0d4;
-  margin-bottom: 10px;
-}
-
-/* Work Experience clickable tiles */
-.company-card {
-  display:flex;
-  flex-direction:column;
-  align-items:center;
-  gap: 10px;
-}
-.company-logo {
-  background: white;
-  border-radius: 12px;
-  padding: 10px;
-}
-
-/* Style Streamlit buttons like top nav */
-div[data-testid="stButton"] > button {
-  background:#11a9c0 !important;
-  color:white !important;
-  border: none !important;
-  border-radius:10px !important;
-  padding:10px 16px !important;
-  font-weight:800 !important;
-  font-size:14px !important;
-  width: 100% !important;
-}
-div[data-testid="stButton"] > button:hover {
-  background:#02839a !important;
-}
-</style>
-""",
-        unsafe_allow_html=True,
-    )
+    css_text, version = load_stylesheet()
+    if static_serving_enabled():
+        st.markdown(
+            f'<link rel="stylesheet" href="app/static/{STYLESHEET}?v={version}">',
+            unsafe_allow_html=True,
+        )
+    else:
+        st.markdown(f"<style>\n{css_text}</style>", unsafe_allow_html=True)
+
+
+def sprite_css(assets: AssetRegistry = ASSETS):
+    # Logo sprite sheet + offset map (content-addressed, so cached by the browser for good)
+    if static_serving_enabled():
+        name = assets.sprite_css_name()
+        if name:
+            st.markdown(f'<link rel="stylesheet" href="app/static/{name}">', unsafe_allow_html=True)
+    else:
+        inline = assets.sprite_css_inline()
+        if inline:
+            st.markdown(f"<style>\n{inline}</style>", unsafe_allow_html=True)
+
+
+LOGO_IMG_STYLE = "width:90px;height:90px;object-fit:contain;display:block;border-radius:14px;"
 
-def render_certifications_as_icons(certs: list[str], cert_logo_map: Dict[str, str]):
+
+def logo_html(
+    assets: AssetRegistry, group: str, path: Optional[str], style: str = LOGO_IMG_STYLE, cls: str = ""
+) -> str:
+    # Sprite cell when the logo is in the current sheet, else the inlined image
+    sprite = assets.sprite_class(group, path)
+    if sprite:
+        return f'<span class="{" ".join(filter(None, (sprite, cls)))}" role="img"></span>'
+    data_uri = assets.data_uri(path)
+    if not data_uri:
+        return ""
+    cls_attr = f' class="{cls}"' if cls else ""
+    style_attr = f' style="{style}"' if style else ""
+    return f'<img{cls_attr} src="{data_uri}" alt=""{style_attr} />'
+
+
+def render_certifications_as_icons(
+    certs: Tuple[str, ...], cert_logo_map: Dict[str, str], assets: AssetRegistry = ASSETS
+):
     if not certs:
         return
 
-    st.markdown("<h2 style='margin: 6px 0 14px 0;'>Certifications</h2>", unsafe_allow_html=True)
-
     # Filter ONLY certifications that have logos
     items = []
+    logo_keys = tuple(cert_logo_map.items())
     for cert in certs:
-        logo_path = pick_cert_logo(cert, cert_logo_map)
-        if logo_path and os.path.exists(logo_path):
+        logo_path = BLOCKS.get("cert_match", (cert, logo_keys), lambda: pick_cert_logo(cert, cert_logo_map))
+        if assets.get(logo_path):
             items.append((cert, logo_path))
 
     if not items:
+        st.markdown("<h2 style='margin: 6px 0 14px 0;'>Certifications</h2>", unsafe_allow_html=True)
         st.write("No certification logos found.")
         return
 
-    cols = st.columns(min(4, len(items)))
-
-    for idx, (cert, logo_path) in enumerate(items):
-        with cols[idx % len(cols)]:
-            st.markdown("<div class='company-card'>", unsafe_allow_html=True)
-
-            data_uri = img_file_to_data_uri(logo_path)
-            if data_uri:
-                st.markdown(
-                    f"""
-                    <div class="company-logo">
-                        <img src="{data_uri}"
-                             style="width:90px;height:90px;
-                                    object-fit:contain;
-                                    border-radius:14px;" />
-                    </div>
-                    """,
-                    unsafe_allow_html=True,
-                )
+    # Whole grid in one element; labels are styled like the Work Experience buttons
+    tiles = []
+    for cert, logo_path in items:
+        label = cert[:28] + ("..." if len(cert) > 28 else "")
+        tiles.append(
+            f'<div class="cert-tile" title="{html.escape(cert)}">'
+            f'<div class="company-logo">{logo_html(assets, "certifications", logo_path)}</div>'
+            f'<span class="job-label">{html.escape(label)}</span>'
+            f'</div>'
+        )
+    st.markdown(
+        "<h2 style='margin: 6px 0 14px 0;'>Certifications</h2>"
+        f'<div class="cert-grid">{"".join(tiles)}</div>',
+        unsafe_allow_html=True,
+    )
 
-            # Label under icon (same as Work Experience)
-            label = cert[:28] + ("..." if len(cert) > 28 else "")
-            st.button(label, key=f"cert_btn_{idx}", use_container_width=True)
+def render_sticky_header(name, role, contact_html, avatar: Optional[Avatar] = None):
+    # Header HTML is rebuilt only when its inputs change (shared by all sessions)
+    version = (name, role, contact_html, avatar.sha256 if avatar else None, avatar.static_name if avatar else None)
+    st.markdown(FRAGMENTS.render("header", version, None, lambda: sticky_header_html(name, role, contact_html, avatar)),
+                unsafe_allow_html=True)
 
-            st.markdown("</div>", unsafe_allow_html=True)
 
-def render_sticky_header(name, role, contact_html, profile_img_b64=None):
+def sticky_header_html(name, role, contact_html, avatar: Optional[Avatar] = None) -> str:
     avatar_html = ""
-    if profile_img_b64:
-        avatar_html = f"<img class='avatar' src='data:image/jpeg;base64,{profile_img_b64}' />"
-
-    html = (
+    if avatar:
+        # Blurred placeholder paints with the header; the real image decodes async
+        src = f"app/static/{avatar.static_name}" if avatar.static_name else avatar.data_uri
+        avatar_html = (
+            f"<img class='avatar' src='{src}' width='74' height='74' loading='lazy' decoding='async' "
+            f"style=\"background-image:url('{avatar.placeholder_uri}');\" />"
+        )
+
+    return (
         f'<div class="sticky">'
         f'  <div class="header-row">'
         f'    <div class="id-row">'
@@ -492,71 +235,107 @@ def render_sticky_header(name, role, contact_html, profile_img_b64=None):
         f'</div>'
         f'<div class="spacer"></div>'
     )
-    st.markdown(html, unsafe_allow_html=True)
 
 
 def section_anchor(anchor_id: str):
     st.markdown(f'<a id="{anchor_id}"></a>', unsafe_allow_html=True)
 
 
-def section_title(title: str, subtitle: str = ""):
-    st.markdown(f"<div class='section-title'>{title}</div>", unsafe_allow_html=True)
-    if subtitle:
-        st.markdown(f"<div class='section-sub'>{subtitle}</div>", unsafe_allow_html=True)
+def render_section(anchor_id: str, title: str, body: str):
+    # Anchor, title and body (markdown/HTML) as a single element; body is a cached string
+    st.markdown(
+        FRAGMENTS.render(
+            "section", body, (anchor_id, title),
+            lambda: f'<a id="{anchor_id}"></a><div class="section-title">{title}</div>\n\n{body}',
+        ),
+        unsafe_allow_html=True,
+    )
 
 
 # ---------------------------
-# Experience with logos 
+# Section bodies (one element per section)
 # ---------------------------
+def summary_markdown(summary_text: str) -> str:
+    summary_text = (summary_text or "").strip()
+    if not summary_text:
+        return "No summary found in the resume."
+    bullets = [s.strip() for s in re.split(r"(?<=[.!?])\s+", summary_text) if s.strip()]
+    return "\n".join([f"- {b}" for b in bullets])
+
+
+def publications_markdown(pubs: Tuple[Publication, ...]) -> str:
+    if not pubs:
+        return "No publications found (publications.json missing or empty)."
+    lines = []
+    for p in pubs:
+        if p.url:
+            lines.append(f"- **[{p.title}]({p.url})**  \n  <span class='muted'>{p.venue}</span>")
+        else:
+            lines.append(f"- **{p.title}**  \n  <span class='muted'>{p.venue}</span>")
+    return "\n".join(lines)
+
+
+def education_html(
+    edu_list: Tuple[Education, ...], edu_logos: Dict[str, str], assets: AssetRegistry = ASSETS
+) -> str:
+    if not edu_list:
+        return "No education found."
+    rows = []
+    for edu in edu_list:
+        logo = logo_html(assets, "education", pick_edu_logo(edu.text, edu_logos), style="", cls="edu-logo")
+        logo = logo or '<div class="edu-logo"></div>'
+        rows.append(f'<div class="edu-row">{logo}<div>• {html.escape(edu.text)}</div></div>')
+    return f'<div class="edu-list">{"".join(rows)}</div>'
 
-def img_file_to_data_uri(path: str) -> Optional[str]:
-    if not path or not os.path.exists(path):
-        return None
 
-    ext = os.path.splitext(path)[1].lower()
-    mime = {
-        ".png": "image/png",
-        ".jpg": "image/jpeg",
-        ".jpeg": "image/jpeg",
-        ".webp": "image/webp",
-        ".gif": "image/gif",
-        ".jfif": "image/jpeg",
-    }.get(ext, "image/png")
-
-    with open(path, "rb") as f:
-        b64 = base64.b64encode(f.read()).decode("utf-8")
-
-    return f"data:{mime};base64,{b64}"
-
-def render_experience_with_logos(experience: Dict[str, list], logo_map: Dict[str, str]):
-    # --- helper: match company name inside job header ---
-    def pick_company_key(job_header: str, logo_map: Dict[str, str]) -> Optional[str]:
-        j = (job_header or "").lower()
-        for k in logo_map.keys():
-            if k.lower() in j:
-                return k
-        return None
+# ---------------------------
+# Experience with logos 
+# ---------------------------
 
-    # --- helper: convert local image to base64 data URI (so HTML <img> works) ---
-    def img_file_to_data_uri(path: str) -> Optional[str]:
-        if not path or not os.path.exists(path):
-            return None
+def experience_items(experience: Tuple[Job, ...], logo_map: Dict[str, str]) -> list[tuple]:
+    # (job, label, logo_path); label is the matched company name when there is one
+    items = []
+    for job in experience:
+        company_key = pick_company_key(job.header, logo_map)
+        logo_path = logo_map.get(company_key) if company_key else None
+        label = company_key if company_key else job.header
+        items.append((job, label, logo_path))
+    return items
 
-        ext = os.path.splitext(path)[1].lower()
-        mime = {
-            ".png": "image/png",
-            ".jpg": "image/jpeg",
-            ".jpeg": "image/jpeg",
-            ".webp": "image/webp",
-            ".gif": "image/gif",
-            ".jfif": "image/jpeg",
-        }.get(ext, "image/png")
 
-        with open(path, "rb") as f:
-            b64 = base64.b64encode(f.read()).decode("utf-8")
+def job_tile_html(job: Job, label: str, logo: str) -> str:
+    logo = f'<div class="company-logo">{logo}</div>' if logo else ""
+    body = (
+        "<ul>" + "".join(f"<li>{html.escape(b)}</li>" for b in job.bullets) + "</ul>"
+        if job.bullets
+        else "<p>No bullet points found.</p>"
+    )
+    return (
+        f'<details name="job">'
+        f'<summary>{logo}<span class="job-label">{html.escape(label)}</span></summary>'
+        f'<div class="job-body"><div class="job-title">{html.escape(job.header)}</div>{body}</div>'
+        f'</details>'
+    )
 
-        return f"data:{mime};base64,{b64}"
 
+def build_experience_details_html(
+    experience: Tuple[Job, ...], logo_map: Dict[str, str], assets: AssetRegistry = ASSETS
+) -> str:
+    # Every job's bullets are in the page; <details name=...> opens one at a time, no rerun.
+    # Tiles are memoized per job block, so a resume edit only rebuilds the jobs it touched.
+    tiles = []
+    for job, label, logo_path in experience_items(experience, logo_map):
+        logo = logo_html(assets, "companies", logo_path)
+        tiles.append(BLOCKS.get("job_tile", (job, label, logo), lambda: job_tile_html(job, label, logo)))
+    return f'<div class="job-grid">{"".join(tiles)}</div>'
+
+
+# Clicks inside a fragment rerun only that fragment, so the stylesheet link,
+# sticky header and other sections are not re-sent over the websocket.
+@st.fragment
+def render_experience_with_logos(
+    experience: Tuple[Job, ...], logo_map: Dict[str, str], mode: str = "buttons", assets: AssetRegistry = ASSETS
+):
     if "selected_job" not in st.session_state:
         st.session_state["selected_job"] = None
 
@@ -566,155 +345,402 @@ def render_experience_with_logos(experience: Dict[str, list], logo_map: Dict[str
     # Title (no card / no "click a company" text)
     st.markdown("<h2 style='margin: 6px 0 14px 0;'>Work Experience</h2>", unsafe_allow_html=True)
 
+    if mode == "details":
+        st.markdown(build_experience_details_html(experience, logo_map, assets), unsafe_allow_html=True)
+        return
+
     # Build items (keep your current label behavior)
-    items = []
-    for job_header in experience.keys():
-        company_key = pick_company_key(job_header, logo_map)
-        logo_path = logo_map.get(company_key) if company_key else None
-        label = company_key if company_key else job_header
-        items.append((job_header, label, logo_path))
+    items = experience_items(experience, logo_map)
 
     cols = st.columns(min(4, len(items)))
 
-    for idx, (job_header, label, logo_path) in enumerate(items):
+    for idx, (job, label, logo_path) in enumerate(items):
         with cols[idx % len(cols)]:
-            st.markdown("<div class='company-card'>", unsafe_allow_html=True)
-
-            # Logo via base64 (prevents broken icon / white bar)
-            data_uri = img_file_to_data_uri(logo_path) if logo_path else None
-            if data_uri:
-                st.markdown(
-                    f"""
-                    <div class="company-logo">
-                      <img src="{data_uri}"
-                           style="width:90px;height:90px;object-fit:contain;display:block;border-radius:14px;" />
-                    </div>
-                    """,
-                    unsafe_allow_html=True,
-                )
+            # Logo from the sprite sheet, or inlined base64 (prevents broken icon / white bar)
+            logo = logo_html(assets, "companies", logo_path)
+            if logo:
+                st.markdown(f'<div class="company-logo">{logo}</div>', unsafe_allow_html=True)
 
             # Button uses your CSS (blue background, white text)
             if st.button(label, key=f"job_btn_{idx}", use_container_width=True):
-                st.session_state["selected_job"] = job_header
-
-            st.markdown("</div>", unsafe_allow_html=True)
+                st.session_state["selected_job"] = job.header
+                EVENTS.record("job_open", session=st.session_state.get("_session_id"), job=job.header)
 
     # Details
     selected = st.session_state.get("selected_job")
     if selected:
-        bullets = experience.get(selected, [])
+        selected_job = next((j for j in experience if j.header == selected), None)
+        bullets = selected_job.bullets if selected_job else ()
         with st.expander(selected, expanded=True):
             if bullets:
-                st.markdown("\n".join([f"- {b}" for b in bullets]))
+                # Keyed by the job's bullets and the selected header (session state)
+                bullets_md = FRAGMENTS.render(
+                    "job_bullets", bullets, selected, lambda: "\n".join([f"- {b}" for b in bullets])
+                )
+                st.markdown(bullets_md)
             else:
                 st.write("No bullet points found.")
             if st.button("Close", key="close_job"):
                 st.session_state["selected_job"] = None
+                EVENTS.record("job_close", session=st.session_state.get("_session_id"), job=selected)
+
+
+# ---------------------------
+# Search (in-process inverted index, see search.py)
+# ---------------------------
+def search_snippet(text: str, terms: Tuple[str, ...], width: int = 160) -> str:
+    lowered = text.lower()
+    start = min((i for i in (lowered.find(t) for t in terms) if i >= 0), default=0)
+    start = max(0, start - width // 4)
+    snippet = html.escape(text[start:start + width])
+    if terms:
+        pattern = re.compile(r"\b(" + "|".join(re.escape(html.escape(t)) for t in terms) + r")", re.IGNORECASE)
+        snippet = pattern.sub(r"<mark>\1</mark>", snippet)
+    return ("…" if start else "") + snippet + ("…" if start + width < len(text) else "")
+
+
+@st.fragment
+def render_search(index: SearchIndex):
+    # Typing reruns only this fragment; the index is shared by every session
+    query = st.text_input("Search", key="search_q", placeholder="Spark, RAG, forecasting…")
+    if not query.strip():
+        return
+    hits = index.search(query, limit=8)
+    if st.session_state.get("_search_logged") != query:
+        st.session_state["_search_logged"] = query
+        EVENTS.record(
+            "search", session=st.session_state.get("_session_id"), q=query[:200],
+            hits=len(hits), sections=sorted({h.doc.section for h in hits}),
+        )
+    if not hits:
+        st.caption("No matches.")
+        return
+    st.markdown(
+        "\n\n".join(
+            f"<a href='#{h.doc.section}'><b>{html.escape(h.doc.title)}</b></a><br>"
+            f"<span class='muted'>{search_snippet(h.doc.text, h.terms)}</span>"
+            for h in hits
+        ),
+        unsafe_allow_html=True,
+    )
+
+# ---------------------------
+# Secrets / payload measurement
+# ---------------------------
+def get_secret(name: str, default: Any = None) -> Any:
+    try:
+        return st.secrets.get(name, default)
+    except Exception:
+        return default
+
+
+def requested_ref(tenant_branch: str) -> Optional[str]:
+    # ?ref=<branch|tag|sha>&preview_key=<PREVIEW_KEY> renders another version of the repo;
+    # off unless PREVIEW_KEY is set (PREVIEW_ENABLED forces it on or off)
+    enabled = get_secret("PREVIEW_ENABLED")
+    try:
+        return preview_ref(
+            st.query_params.get("ref"),
+            tenant_branch,
+            st.query_params.get("preview_key"),
+            str(get_secret("PREVIEW_KEY", "") or ""),
+            None if enabled is None else bool(enabled),
+        )
+    except PreviewDenied as e:
+        st.warning(f"Showing `{tenant_branch}`: {e}")
+        return None
+
+
+def historic_snapshot(version: Optional[str]) -> Tuple[Optional[str], Optional[Snapshot]]:
+    # (full version id, snapshot), or (None, None) when not requested or unreadable
+    if not version or not HISTORY.enabled:
+        return None, None
+    try:
+        version_id = HISTORY.resolve(version)
+        snap = HISTORY.snapshot(version_id)
+    except HistoryError as e:
+        st.warning(e.args[0])
+        return None, None
+    except (OSError, ValueError) as e:
+        st.warning(f"Version {version!r} could not be read: {e}")
+        return None, None
+    st.info(f"Showing recorded version `{version_id[:12]}`")
+    return version_id, snap
+
+
+def start_payload_meter() -> PayloadMeter:
+    # Enabled with ?payload=1 or PAYLOAD_METER = true in secrets
+    enabled = st.query_params.get("payload") == "1" or bool(get_secret("PAYLOAD_METER", False))
+    meter = PayloadMeter(enabled=enabled, budgets=dict(get_secret("payload_budget", {}) or {}))
+    meter.start()
+    return meter
+
+
+def render_payload_report(meter: PayloadMeter):
+    meter.stop()
+    if not meter.enabled:
+        return
+
+    rows = meter.report(st.session_state.get("_payload_prev"))
+    st.session_state["_payload_prev"] = meter.snapshot()
+    meter.warn_over_budget(rows)
+
+    with st.sidebar:
+        st.markdown("**Payload per rerun**")
+        st.dataframe(rows, hide_index=True, use_container_width=True)
+
+
+def start_profile() -> Tuple[Optional[RunProfile], bool]:
+    # ?profile=<PROFILE_KEY> profiles this run and shows hotspots in the sidebar;
+    # PROFILE_SAMPLE_RATE profiles that share of all runs silently (saved only)
+    key = str(get_secret("PROFILE_KEY", "") or "")
+    requested = bool(key) and hmac.compare_digest(st.query_params.get("profile", ""), key)
+    rate = float(get_secret("PROFILE_SAMPLE_RATE", 0) or 0)
+    if not requested and not (rate > 0 and random.random() < rate):
+        return None, False
+    mode = st.query_params.get("profile_mode") or get_secret("PROFILE_MODE", "cprofile")
+    return RunProfile(mode, label="requested" if requested else "sampled"), requested
+
+
+def render_profile_report(profile: RunProfile, show: bool):
+    if profile.skipped:
+        if show:
+            st.sidebar.caption(f"Profile skipped: {profile.skipped}")
+        return
+    try:
+        path = profile.save()
+    except OSError as e:
+        path = f"not saved ({e})"
+    if not show:
+        return
+    with st.sidebar:
+        with st.expander(f"Profile: {profile.duration * 1000:.0f} ms ({profile.mode})", expanded=True):
+            st.caption(os.path.relpath(path) if os.path.exists(path) else path)
+            st.dataframe(profile.hotspots(), hide_index=True, use_container_width=True)
+
+
+def tenant_cache_stats() -> list[dict]:
+    tenants = {(t.owner, t.repo): t.id for t in [DEFAULT_TENANT, *TENANTS.all().values()]}
+    return [
+        {"tenant": tenants.get(repo, "/".join(repo)), **row}
+        for repo, row in CONTENT.repo_stats().items()
+    ]
+
+
+def render_cache_stats():
+    stats = CONTENT.stats()
+    with st.expander("Cache stats", expanded=True):
+        st.markdown(
+            f"Files: **{stats['files']}** ({stats['file_bytes']:,} bytes)  \n"
+            f"Parsed: **{stats['derived']}** ({stats['derived_bytes']:,} bytes)  \n"
+            f"Missing (negative-cached): {stats['missing']}  \n"
+            f"Hits / misses / fallbacks: {stats['hits']} / {stats['misses']} / {stats['fallbacks']}  \n"
+            + "  \n".join(f"Circuit `{host}`: {state}" for host, state in stats["breakers"].items())
+        )
+        st.caption(f"Memory: {stats['bytes']:,} / {stats['max_bytes']:,} bytes, {stats['evictions']} evictions")
+        if stats["entries"]:
+            st.dataframe(stats["entries"], hide_index=True, use_container_width=True)
+        ev = EVENTS.stats()
+        st.caption(f"Event log: {ev['written']} written, {ev['queued']} queued, {ev['dropped']} dropped, "
+                   f"{ev['rotations']} rotations")
+        warm = READINESS.snapshot()
+        if warm["state"] != "idle":
+            st.caption(f"Warmup: {warm['state']} ({warm['warmup_ms'] or '-'} ms, {len(warm['tasks'])} tasks)")
+        if BUNDLE:
+            b = BUNDLE.stats()
+            st.caption(f"Bundle `{b['source']}` version {b['version']} (built {b['built_at']}, {b['entries']} entries)")
+        blocks = BLOCKS.stats()
+        st.caption(f"Block memo: {blocks['entries']} entries, {blocks['hits']} hits / {blocks['misses']} misses")
+        frags = FRAGMENTS.stats()
+        st.caption(f"Fragments: {frags['entries']} entries ({frags['bytes']:,} bytes), "
+                   f"{frags['hits']} hits / {frags['misses']} misses")
+        for source, diff in RESUME_HISTORY.last_diff.items():
+            st.caption(f"Last resume update `{'/'.join(source)}`: {len(diff.changed)} changed, "
+                       f"{len(diff.added)} added, {len(diff.removed)} removed, {diff.unchanged} unchanged")
+        previews = PREVIEWS.stats()
+        if previews["refs"] or previews["evictions"]:
+            st.caption(f"Previews: {previews['refs']} / {previews['max_refs']} refs cached, "
+                       f"{previews['evictions']} evicted, {previews['expirations']} expired")
+            st.dataframe(previews["entries"], hide_index=True, use_container_width=True)
+        hist = HISTORY.stats()
+        st.caption(f"History: {hist['versions']} versions of {hist['sources']} sources, "
+                   f"{hist['objects_written']} objects written, {hist['errors']} errors")
+        st.markdown("**Per tenant**")
+        st.dataframe(tenant_cache_stats(), hide_index=True, use_container_width=True)
+        st.markdown("**GitHub request budget**")
+        st.dataframe(TOKENS.metrics(), hide_index=True, use_container_width=True)
+        hedge = HEDGED.metrics()
+        st.caption(
+            f"Sources: {', '.join(hedge['sources'])}; hedge after {hedge['hedge_delay_ms']} ms; "
+            f"{hedge['hedges']} hedged requests; wins {hedge['wins']}"
+        )
+        refresh = REFRESHER.metrics()
+        st.caption(
+            f"Background refresh: {'on' if refresh['running'] else 'off'}, "
+            f"every {refresh['interval_s'] or '-'} s, {refresh['share']:.0%} of budget, "
+            f"{refresh['refreshed']} files updated"
+        )
+
+
 # ---------------------------
 # Main app
 # ---------------------------
 def main():
+    meter = start_payload_meter()
+    meter.mark("css")
     css()
 
+    meter.mark("other")
+    search_slot = st.sidebar.container()
     with st.sidebar:
         if st.button(" Refresh / Clear cache"):
             st.cache_data.clear()
+            CONTENT.clear()
+            PREVIEWS.clear()
             st.rerun()
+        # ?stats=<STATS_KEY> shows cache internals; off unless STATS_KEY is set
+        stats_key = str(get_secret("STATS_KEY", "") or "")
+        if stats_key and hmac.compare_digest(st.query_params.get("stats", ""), stats_key):
+            render_cache_stats()
+
+    # Tokens are picked per request from the pool (most remaining budget first)
+    github_client.configure(
+        [get_secret("GITHUB_TOKEN")] + list(get_secret("GITHUB_TOKENS", []) or []),
+        share=get_secret("GITHUB_BUDGET_SHARE"),
+        background_refresh=bool(get_secret("GITHUB_BACKGROUND_REFRESH", True)),
+        # e.g. ["api", "https://cdn.jsdelivr.net/gh/{owner}/{repo}@{ref}/{path}", "/srv/mirror"]; a directory
+        # mirror is laid out as <dir>/owner/repo/ref/path
+        mirrors=list(get_secret("GITHUB_MIRRORS", []) or []),
+        max_bytes=int(get_secret("CACHE_MAX_MB", 0) or 0) * 1024 * 1024,
+    )
 
-    token = None
-    try:
-        token = st.secrets.get("GITHUB_TOKEN", None)
-    except Exception:
-        token = None
-
-    resume = load_resume_from_github(GITHUB_OWNER, GITHUB_REPO, RESUME_PATH_IN_REPO, BRANCH, token)
-
-    profile_img_b64 = None
-    if os.path.exists(PROFILE_IMG):
-        with open(PROFILE_IMG, "rb") as img_file:
-            profile_img_b64 = base64.b64encode(img_file.read()).decode()
-
-    linkedin_url = f"https://www.linkedin.com/in/{LINKEDIN_USER}/"
-    github_url = f"https://github.com/{GITHUB_OWNER}"
-    contact_html = make_hyperlinked_contact(resume.get("contact_line", ""), linkedin_url, github_url)
+    # Visitor events go to requests.jsonl (PORTFOLIO_EVENT_LOG) from a background writer
+    EVENTS.enabled = bool(get_secret("EVENT_LOG", True))
+    EVENTS.compress = bool(get_secret("EVENT_LOG_COMPRESS", True))
+
+    tenant = TENANTS.get(st.query_params.get("tenant")) or DEFAULT_TENANT
+    owner, repo, branch = tenant.owner, tenant.repo, tenant.branch
+    assets = registry_for(tenant.manifest)
+    sprite_css(assets)
+
+    # Previews load through their own per-ref cache; production stays in CONTENT
+    cache = CONTENT
+    ref = requested_ref(branch)
+    if ref:
+        branch, cache = ref, PREVIEWS.cache_for(owner, repo, ref)
+        st.info(f"Preview of `{owner}/{repo}@{ref}`")
+
+    # ?version=<id> renders a recorded version from the history store (no download, no parse)
+    HISTORY.enabled = bool(get_secret("CONTENT_HISTORY", True))
+    version_id, snap = historic_snapshot(st.query_params.get("version"))
+    if snap is None:
+        try:
+            resume = load_resume_from_github(owner, repo, tenant.resume_path, branch, cache=cache)
+        except (RuntimeError, IngestError) as e:
+            # Download failed (GitHub down, nothing cached yet) or the file doesn't parse
+            problem = "is invalid" if isinstance(e, IngestError) else "could not be downloaded"
+            latest = HISTORY.latest((owner, repo, branch)) if HISTORY.enabled and not ref else None
+            try:
+                snap = HISTORY.snapshot(latest) if latest else None
+            except (HistoryError, OSError, ValueError):
+                snap = None  # the store is unreadable too
+            if snap is None:
+                st.error(f"`{tenant.resume_path}` on `{branch}` {problem}: {e}")
+                return
+            version_id = latest
+            st.warning(f"`{tenant.resume_path}` {problem}; showing the last recorded version.")
+    if snap is not None:
+        resume = snap.resume
+
+    avatar = AVATARS.get(tenant.profile_img, static=static_serving_enabled()) if tenant.profile_img else None
+
+    linkedin_url = f"https://www.linkedin.com/in/{tenant.linkedin_user}/"
+    github_url = f"https://github.com/{owner}"
+    contact_html = BLOCKS.get(
+        "contact",
+        (resume.contact_line, linkedin_url, github_url),
+        lambda: make_hyperlinked_contact(resume.contact_line, linkedin_url, github_url),
+    )
 
+    meter.mark("header")
     render_sticky_header(
-        name=resume.get("name", "Akhila A"),
-        role=resume.get("role", "Senior Data Engineer | Data Scientist"),
+        name=resume.name or "Akhila A",
+        role=resume.role,
         contact_html=contact_html,
-        profile_img_b64=profile_img_b64,
+        avatar=avatar,
     )
 
     # SUMMARY (no card)
-    section_anchor("summary")
-    section_title("Summary")
-    summary_text = (resume.get("summary", "") or "").strip()
-    if summary_text:
-        bullets = [s.strip() for s in re.split(r"(?<=[.!?])\s+", summary_text) if s.strip()]
-        st.markdown("\n".join([f"- {b}" for b in bullets]))
-    else:
-        st.write("No summary found in the resume.")
+    meter.mark("summary")
+    summary_md = BLOCKS.get("summary", resume.summary, lambda: summary_markdown(resume.summary))
+    render_section("summary", "Summary", summary_md)
 
     # EXPERIENCE
+    meter.mark("experience")
     section_anchor("experience")
-    exp = resume.get("experience", {}) or {}
-    render_experience_with_logos(exp, COMPANY_LOGOS)
+    exp = resume.experience
+    # "details" pre-renders every job and toggles in the browser; "buttons" reruns per click
+    exp_mode = st.query_params.get("exp") or get_secret("EXPERIENCE_MODE", "buttons")
+    if "_session_id" not in st.session_state:
+        st.session_state["_session_id"] = uuid.uuid4().hex
+        EVENTS.record("page_view", session=st.session_state["_session_id"], tenant=tenant.id, exp_mode=exp_mode, ref=ref)
+    render_experience_with_logos(exp, assets.logo_map("companies"), mode=exp_mode, assets=assets)
 
     # PUBLICATIONS (no card)
-    section_anchor("publications")
-    section_title("Publications")
-    pubs = load_publications_from_github(GITHUB_OWNER, GITHUB_REPO, BRANCH, token)
-    if pubs:
-        for p in pubs:
-            title = (p.get("title") or "").strip()
-            venue = (p.get("venue") or "").strip()
-            url = (p.get("url") or "").strip()
-            if url:
-                st.markdown(
-                    f"- **[{title}]({url})**  \n  <span class='muted'>{venue}</span>",
-                    unsafe_allow_html=True,
-                )
-            else:
-                st.markdown(f"- **{title}**  \n  <span class='muted'>{venue}</span>", unsafe_allow_html=True)
-    else:
-        st.write("No publications found (publications.json missing or empty).")
+    meter.mark("publications")
+    pubs = snap.publications if snap else load_publications_from_github(owner, repo, branch, cache=cache)
+    pubs_md = FRAGMENTS.render("publications", pubs, None, lambda: publications_markdown(pubs))
+    render_section("publications", "Publications", pubs_md)
 
     # CERTIFICATIONS (no card)
+    meter.mark("certs")
     section_anchor("certs")
-    certs = resume.get("certifications", []) or []
-    render_certifications_as_icons(certs, CERT_LOGOS)
+    certs = resume.certifications
+    render_certifications_as_icons(certs, assets.logo_map("certifications"), assets)
 
     # EDUCATION (no card, with logos)
-    section_anchor("education")
-    section_title("Education")
-    edu_list = resume.get("education", []) or []
-    if edu_list:
-        for edu in edu_list:
-            c1, c2 = st.columns([1, 6], vertical_alignment="center")
-            with c1:
-                logo_path = pick_edu_logo(edu, EDU_LOGOS)
-                if logo_path and os.path.exists(logo_path):
-                    st.image(logo_path, width=110)
-            with c2:
-                st.markdown(f"- {edu}")
-    else:
-        st.write("No education found.")
+    meter.mark("education")
+    edu_list = resume.education
+    render_section("education", "Education", education_html(edu_list, assets.logo_map("education"), assets))
 
     # PROJECTS (no card)
-    section_anchor("projects")
-    section_title("Projects")
-    projects_text = load_projects_from_github(GITHUB_OWNER, GITHUB_REPO, BRANCH, token)
-    st.markdown(projects_text.replace("\n", "  \n"))
+    meter.mark("projects")
+    projects_text = (
+        snap.projects_text if snap else load_projects_from_github(owner, repo, branch, path=tenant.projects_path, cache=cache)
+    )
+    render_section(
+        "projects", "Projects", FRAGMENTS.render("projects", projects_text, None, lambda: projects_text.replace("\n", "  \n"))
+    )
 
     # ABOUT (no card)
-    section_anchor("about")
-    section_title("About")
-    about_txt = download_raw_text(GITHUB_OWNER, GITHUB_REPO, "aboutpage.txt", BRANCH, token)
-    if about_txt:
-        st.markdown(about_txt.replace("\n", "  \n"))
-    else:
-        st.write("aboutpage.txt not found in your GitHub repo root.")
+    meter.mark("about")
+    about_txt = snap.about_text if snap else download_raw_text(owner, repo, "aboutpage.txt", branch, cache=cache)
+    render_section(
+        "about",
+        "About",
+        FRAGMENTS.render("about", about_txt, None, lambda: about_txt.replace("\n", "  \n"))
+        if about_txt
+        else "aboutpage.txt not found in your GitHub repo root.",
+    )
+
+    # SEARCH (sidebar, filled last so every source is loaded; no-op when content is unchanged)
+    meter.mark("search")
+    if snap is None and not ref:  # previews are throwaway; only production versions are kept
+        HISTORY.record((owner, repo, branch), Snapshot(resume, pubs, projects_text, about_txt))
+    # Historic versions get their own (bounded) indexes so they never touch the live ones
+    index = search.history_index(version_id) if snap else search.index_for((owner, repo, branch))
+    index.sync(search.documents(resume, pubs, projects_text, about_txt), version=(resume, pubs, projects_text, about_txt))
+    with search_slot:
+        render_search(index)
+
+    render_payload_report(meter)
 
 
 if __name__ == "__main__":
-    main()
+    profile, show_profile = start_profile()
+    if profile is None:
+        main()
+    else:
+        with profile:
+            main()
+        render_profile_report(profile, show_profile)
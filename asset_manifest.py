@@ -0,0 +1,466 @@
+import os, io, sys, json, time, base64, hashlib, logging, threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Any, Optional, Tuple
+
+# ---------------------------
+# Asset manifest (assets/manifest.json)
+# ---------------------------
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+MANIFEST_PATH = os.path.join(BASE_DIR, "assets", "manifest.json")
+
+log = logging.getLogger(__name__)
+
+# How often (seconds) renders may trigger an mtime check on the manifest
+MANIFEST_CHECK_INTERVAL = 5.0
+
+MIME_TYPES = {
+    ".png": "image/png",
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".webp": "image/webp",
+    ".gif": "image/gif",
+    ".jfif": "image/jpeg",
+}
+
+
+def guess_mime(path: str) -> str:
+    return MIME_TYPES.get(os.path.splitext(path)[1].lower(), "image/png")
+
+
+@dataclass(frozen=True)
+class Asset:
+    path: str
+    size: int
+    sha256: str
+    mime: str
+    data: bytes
+    data_uri: str
+
+
+def _read_asset(path: str, meta: Dict[str, Any]) -> Optional[Asset]:
+    full_path = os.path.join(BASE_DIR, path)
+    try:
+        with open(full_path, "rb") as f:
+            data = f.read()
+    except OSError:
+        return None
+
+    mime = meta.get("mime") or guess_mime(path)
+    b64 = base64.b64encode(data).decode("utf-8")
+    return Asset(
+        path=path,
+        size=len(data),
+        sha256=meta.get("sha256") or hashlib.sha256(data).hexdigest(),
+        mime=mime,
+        data=data,
+        data_uri=f"data:{mime};base64,{b64}",
+    )
+
+
+class AssetRegistry:
+    """Logo maps and pre-encoded assets described by the manifest.
+
+    The manifest is loaded once and re-read only when its mtime changes; the
+    mtime itself is checked at most every ``check_interval`` seconds, so
+    renders normally touch no files at all.
+    """
+
+    def __init__(self, manifest_path: str = MANIFEST_PATH, check_interval: float = MANIFEST_CHECK_INTERVAL):
+        self.manifest_path = manifest_path
+        self.check_interval = check_interval
+        self._lock = threading.Lock()
+        self._mtime: Optional[float] = None
+        self._checked_at = 0.0
+        self._groups: Dict[str, Dict[str, str]] = {}
+        self._assets: Dict[str, Asset] = {}
+        self._sprite: Dict[str, Any] = {}
+        self._sprite_inline: Optional[str] = None
+
+    def _maybe_reload(self):
+        now = time.monotonic()
+        if self._mtime is not None and now - self._checked_at < self.check_interval:
+            return
+
+        with self._lock:
+            if self._mtime is not None and now - self._checked_at < self.check_interval:
+                return
+            self._checked_at = now
+            try:
+                mtime = os.path.getmtime(self.manifest_path)
+            except OSError:
+                mtime = -1.0
+            if mtime == self._mtime:
+                return
+            self._load(mtime)
+
+    def _load(self, mtime: float):
+        manifest: Dict[str, Any] = {}
+        if mtime >= 0:
+            try:
+                with open(self.manifest_path, "r", encoding="utf-8") as f:
+                    manifest = json.load(f)
+            except (OSError, ValueError):
+                # Keep serving the previous manifest if the new one is half-written
+                return
+
+        assets: Dict[str, Asset] = {}
+        for path, meta in (manifest.get("assets") or {}).items():
+            prev = self._assets.get(path)
+            if prev and meta.get("sha256") and prev.sha256 == meta["sha256"]:
+                assets[path] = prev
+                continue
+            asset = _read_asset(path, meta)
+            if asset:
+                assets[path] = asset
+
+        self._groups = {
+            group: {k: v for k, v in (entries or {}).items() if v in assets}
+            for group, entries in (manifest.get("groups") or {}).items()
+        }
+        self._assets = assets
+        self._sprite = manifest.get("sprite") or {}
+        self._sprite_inline = None
+        self._mtime = mtime
+
+    def preload(
+        self, groups: Dict[str, Dict[str, str]], assets: Dict[str, Asset], sprite: Optional[Dict[str, Any]] = None
+    ):
+        # Pre-encoded assets (e.g. from a bundle); the manifest on disk is only re-read if it changes later.
+        # Without a sprite entry (older bundles) the one in the manifest on disk is kept.
+        if sprite is None:
+            try:
+                with open(self.manifest_path, "r", encoding="utf-8") as f:
+                    sprite = json.load(f).get("sprite")
+            except (OSError, ValueError, AttributeError):
+                sprite = None
+        with self._lock:
+            try:
+                self._mtime = os.path.getmtime(self.manifest_path)
+            except OSError:
+                self._mtime = -1.0
+            self._checked_at = time.monotonic()
+            self._groups = {group: {k: v for k, v in entries.items() if v in assets} for group, entries in groups.items()}
+            self._assets = dict(assets)
+            self._sprite = sprite or {}
+            self._sprite_inline = None
+
+    @property
+    def sprite(self) -> Dict[str, Any]:
+        """The manifest's sprite entry (image, css, entries); empty when no sheet was built."""
+        self._maybe_reload()
+        return self._sprite
+
+    def logo_map(self, group: str) -> Dict[str, str]:
+        self._maybe_reload()
+        return self._groups.get(group, {})
+
+    def get(self, path: Optional[str]) -> Optional[Asset]:
+        if not path:
+            return None
+        self._maybe_reload()
+        return self._assets.get(path)
+
+    def data_uri(self, path: Optional[str]) -> Optional[str]:
+        asset = self.get(path)
+        return asset.data_uri if asset else None
+
+    def sprite_class(self, group: str, path: Optional[str]) -> Optional[str]:
+        # None when there is no sprite or the logo changed since it was built (use data_uri)
+        asset = self.get(path)
+        built = (self._sprite.get("entries") or {}).get(group, {}).get(path)
+        if not asset or built != asset.sha256:
+            return None
+        return f"sprite sprite-{group} sprite-{group}-{asset.sha256[:8]}"
+
+    def sprite_css_name(self) -> Optional[str]:
+        self._maybe_reload()
+        css = self._sprite.get("css")
+        return os.path.basename(css) if css else None
+
+    def sprite_css_inline(self) -> Optional[str]:
+        # For pages without static serving: the sheet goes into the CSS as one data URI
+        self._maybe_reload()
+        if self._sprite_inline is None and self._sprite.get("css"):
+            try:
+                with open(os.path.join(BASE_DIR, self._sprite["css"]), "r", encoding="utf-8") as f:
+                    css = f.read()
+                with open(os.path.join(BASE_DIR, self._sprite["image"]), "rb") as f:
+                    image = f.read()
+            except OSError:
+                return None
+            mime = guess_mime(self._sprite["image"])
+            uri = f"data:{mime};base64,{base64.b64encode(image).decode('utf-8')}"
+            self._sprite_inline = css.replace(os.path.basename(self._sprite["image"]), uri)
+        return self._sprite_inline
+
+
+# One registry per manifest (tenants may bring their own), least recently used dropped first
+MAX_REGISTRIES = 32
+_REGISTRIES: "OrderedDict[str, AssetRegistry]" = OrderedDict()
+_REGISTRIES_LOCK = threading.Lock()
+
+
+def registry_for(manifest_path: Optional[str] = None) -> AssetRegistry:
+    path = os.path.join(BASE_DIR, manifest_path) if manifest_path else MANIFEST_PATH
+    with _REGISTRIES_LOCK:
+        registry = _REGISTRIES.get(path)
+        if registry is None:
+            registry = _REGISTRIES[path] = AssetRegistry(path)
+            while len(_REGISTRIES) > MAX_REGISTRIES:
+                _REGISTRIES.popitem(last=False)
+        _REGISTRIES.move_to_end(path)
+        return registry
+
+
+# Module-level so it survives Streamlit reruns (app.py is re-executed, imports are not)
+ASSETS = registry_for(MANIFEST_PATH)
+
+
+# ---------------------------
+# Profile image pipeline (avatar thumbnail + blurred placeholder)
+# ---------------------------
+AVATAR_PX = 148  # 2x the 74px .avatar box for hi-dpi screens
+PLACEHOLDER_PX = 12
+STATIC_DIR = os.path.join(BASE_DIR, "static")
+
+
+@dataclass(frozen=True)
+class Avatar:
+    sha256: str
+    data: bytes
+    data_uri: str
+    placeholder_uri: str
+    static_name: Optional[str] = None
+
+
+def _jpeg_data_uri(data: bytes) -> str:
+    return "data:image/jpeg;base64," + base64.b64encode(data).decode("utf-8")
+
+
+def build_avatar(raw: bytes) -> Avatar:
+    from PIL import Image, ImageFilter, ImageOps  # ships with streamlit
+
+    img = ImageOps.exif_transpose(Image.open(io.BytesIO(raw))).convert("RGB")
+    thumb = ImageOps.fit(img, (AVATAR_PX, AVATAR_PX), Image.LANCZOS)
+    buf = io.BytesIO()
+    thumb.save(buf, "JPEG", quality=85, optimize=True, progressive=True)
+    data = buf.getvalue()
+
+    tiny = thumb.resize((PLACEHOLDER_PX, PLACEHOLDER_PX), Image.BILINEAR)
+    tiny = tiny.filter(ImageFilter.GaussianBlur(1))
+    buf = io.BytesIO()
+    tiny.save(buf, "JPEG", quality=40)
+
+    return Avatar(
+        sha256=hashlib.sha256(data).hexdigest(),
+        data=data,
+        data_uri=_jpeg_data_uri(data),
+        placeholder_uri=_jpeg_data_uri(buf.getvalue()),
+    )
+
+
+def publish_static(avatar: Avatar, static_dir: str = STATIC_DIR) -> Avatar:
+    # Content-addressed name so browsers can cache it forever
+    name = f"avatar-{avatar.sha256[:12]}.jpg"
+    path = os.path.join(static_dir, name)
+    if not os.path.exists(path):
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(avatar.data)
+        os.replace(tmp_path, path)
+    return Avatar(avatar.sha256, avatar.data, avatar.data_uri, avatar.placeholder_uri, name)
+
+
+class AvatarCache:
+    """Avatars rebuilt only when the source image's (mtime, size) changes."""
+
+    def __init__(self, check_interval: float = MANIFEST_CHECK_INTERVAL):
+        self.check_interval = check_interval
+        self._lock = threading.Lock()
+        self._entries: Dict[Tuple[str, bool], Tuple[float, Any, Optional[Avatar]]] = {}
+
+    def get(self, path: str, static: bool = False) -> Optional[Avatar]:
+        key = (path, static)
+        now = time.monotonic()
+        entry = self._entries.get(key)
+        if entry and now - entry[0] < self.check_interval:
+            return entry[2]
+
+        with self._lock:
+            full_path = os.path.join(BASE_DIR, path)
+            try:
+                file_stat = os.stat(full_path)
+                stamp = (file_stat.st_mtime, file_stat.st_size)
+            except OSError:
+                stamp = None
+
+            entry = self._entries.get(key)
+            if entry and entry[1] == stamp:
+                self._entries[key] = (now, stamp, entry[2])
+                return entry[2]
+
+            avatar = None
+            if stamp:
+                try:
+                    with open(full_path, "rb") as f:
+                        raw = f.read()
+                    avatar = build_avatar(raw)
+                except OSError as e:
+                    log.warning("avatar %s unreadable: %s", path, e)
+                except Exception:
+                    # Unreadable image: keep the header working without an avatar
+                    avatar = None
+                if avatar and static:
+                    try:
+                        avatar = publish_static(avatar)
+                    except OSError as e:
+                        # e.g. read-only static/: the data-URI avatar still renders
+                        log.warning("avatar %s not published to static/: %s", path, e)
+            self._entries[key] = (now, stamp, avatar)
+            return avatar
+
+    def preload(self, path: str, avatar: Avatar):
+        # A prebuilt avatar for the image currently at `path`; rebuilt as usual if the file changes
+        try:
+            file_stat = os.stat(os.path.join(BASE_DIR, path))
+            stamp = (file_stat.st_mtime, file_stat.st_size)
+        except OSError:
+            stamp = None
+        try:
+            published: Optional[Avatar] = publish_static(avatar)
+        except OSError:
+            published = None  # read-only static/: built on first use instead
+        now = time.monotonic()
+        with self._lock:
+            self._entries[(path, False)] = (now, stamp, avatar)
+            if published:
+                self._entries[(path, True)] = (now, stamp, published)
+
+
+AVATARS = AvatarCache()
+
+
+# ---------------------------
+# Logo sprite sheet (built with the manifest)
+# ---------------------------
+# Display size (CSS px) of one logo cell per group; the sheet is drawn at
+# SPRITE_SCALE x for hi-dpi screens and each logo is fitted ("contain") in its cell.
+SPRITE_CELLS = {
+    "companies": (90, 90),
+    "certifications": (90, 90),
+    "education": (110, 95),
+}
+SPRITE_SCALE = 2
+SPRITE_QUALITY = 90
+
+
+def _pct(value: float) -> str:
+    return f"{value:.4f}".rstrip("0").rstrip(".") + "%"
+
+
+def build_sprite(manifest: Dict[str, Any], static_dir: str = STATIC_DIR) -> Optional[Dict[str, Any]]:
+    """Pack every grouped logo into one WebP sheet plus a CSS offset map.
+
+    One row per group; percentage sizes/positions make each class scale with its
+    element, whatever the display size. Files are content-addressed under static/.
+    """
+    from PIL import Image, ImageOps
+
+    rows = []
+    for group, (w, h) in SPRITE_CELLS.items():
+        paths = sorted(set((manifest["groups"].get(group) or {}).values()) & set(manifest["assets"]))
+        if paths:
+            rows.append((group, w * SPRITE_SCALE, h * SPRITE_SCALE, paths))
+    if not rows:
+        return None
+
+    sheet_w = max(cw * len(paths) for _, cw, _, paths in rows)
+    sheet_h = sum(ch for _, _, ch, _ in rows)
+    sheet = Image.new("RGBA", (sheet_w, sheet_h), (0, 0, 0, 0))
+    rules, entries = [], {}
+    y = 0
+    for group, cw, ch, paths in rows:
+        entries[group] = {}
+        for i, path in enumerate(paths):
+            with Image.open(os.path.join(BASE_DIR, path)) as img:
+                logo = ImageOps.contain(ImageOps.exif_transpose(img).convert("RGBA"), (cw, ch), Image.LANCZOS)
+            x = i * cw
+            sheet.paste(logo, (x + (cw - logo.width) // 2, y + (ch - logo.height) // 2), logo)
+            sha = manifest["assets"][path]["sha256"]
+            entries[group][path] = sha
+            rules.append(
+                f".sprite-{group}-{sha[:8]}{{"
+                f"background-size:{_pct(sheet_w / cw * 100)} {_pct(sheet_h / ch * 100)};"
+                f"background-position:{_pct(x / (sheet_w - cw) * 100 if sheet_w > cw else 0)} "
+                f"{_pct(y / (sheet_h - ch) * 100 if sheet_h > ch else 0)};}}"
+            )
+        y += ch
+
+    buf = io.BytesIO()
+    sheet.save(buf, "WEBP", quality=SPRITE_QUALITY, method=6)
+    image = buf.getvalue()
+    digest = hashlib.sha256(image).hexdigest()[:12]
+    image_name, css_name = f"logos-{digest}.webp", f"logos-{digest}.css"
+
+    css = [
+        "/* generated by `python asset_manifest.py`; do not edit */",
+        f".sprite{{display:block;background-image:url({image_name});background-repeat:no-repeat;}}",
+    ]
+    for group, (w, h) in SPRITE_CELLS.items():
+        radius = "border-radius:14px;" if group != "education" else ""
+        css.append(f".sprite-{group}{{width:{w}px;height:{h}px;{radius}}}")
+    css.extend(rules)
+
+    os.makedirs(static_dir, exist_ok=True)
+    for name, data in ((image_name, image), (css_name, ("\n".join(css) + "\n").encode("utf-8"))):
+        path = os.path.join(static_dir, name)
+        with open(path + ".tmp", "wb") as f:
+            f.write(data)
+        os.replace(path + ".tmp", path)
+
+    rel = os.path.relpath(static_dir, BASE_DIR)
+    return {"image": f"{rel}/{image_name}", "css": f"{rel}/{css_name}", "entries": entries}
+
+
+# ---------------------------
+# Manifest builder: python asset_manifest.py
+# ---------------------------
+def build_manifest(manifest_path: str = MANIFEST_PATH) -> Dict[str, Any]:
+    manifest: Dict[str, Any] = {"version": 1, "groups": {}, "assets": {}}
+    if os.path.exists(manifest_path):
+        with open(manifest_path, "r", encoding="utf-8") as f:
+            manifest.update(json.load(f))
+
+    assets: Dict[str, Any] = {}
+    for entries in manifest["groups"].values():
+        for path in entries.values():
+            full_path = os.path.join(BASE_DIR, path)
+            if not os.path.exists(full_path):
+                print(f"missing asset: {path}", file=sys.stderr)
+                continue
+            with open(full_path, "rb") as f:
+                data = f.read()
+            assets[path] = {
+                "size": len(data),
+                "sha256": hashlib.sha256(data).hexdigest(),
+                "mime": guess_mime(path),
+            }
+    manifest["assets"] = assets
+    try:
+        manifest["sprite"] = build_sprite(manifest)
+    except ImportError:
+        print("Pillow not installed: logo sprite not built", file=sys.stderr)
+        manifest.pop("sprite", None)
+
+    tmp_path = manifest_path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+        f.write("\n")
+    os.replace(tmp_path, manifest_path)
+    return manifest
+
+
+if __name__ == "__main__":
+    m = build_manifest()
+    print(f"wrote {MANIFEST_PATH} ({len(m['assets'])} assets)")
@@ -0,0 +1,337 @@
+"""Prebaked content bundle: everything the first render needs, in one file.
+
+    python bundle.py build-bundle --tenant akhila            # fetch from GitHub
+    python bundle.py build-bundle --owner O --repo R --resume resume.docx --from-dir .
+    python bundle.py inspect portfolio.bundle
+
+The app memory-maps the bundle at startup (PORTFOLIO_BUNDLE, default
+./portfolio.bundle) and seeds the content cache, parsed models, asset registry
+and avatar from it, so the first visitor is served without network access,
+docx parsing or image encoding. Cached entries are revalidated against GitHub
+in the background as usual.
+"""
+import os, sys, json, mmap, time, struct, hashlib, logging, argparse, threading
+from typing import Dict, Any, List, Optional
+
+from asset_manifest import BASE_DIR, Asset, Avatar, AVATARS, build_avatar, registry_for
+from github_client import CONTENT, ContentKey, UpstreamError, fetch_raw
+from incremental import RESUME_HISTORY
+from ingest import parse_projects_bytes, parse_publications_json, resume_parser_for
+from loaders import ResumeResult
+from models import Resume, publications_from_json
+from tenants import TENANTS
+
+log = logging.getLogger(__name__)
+
+# ---------------------------
+# File layout
+# ---------------------------
+# magic (8) | format (u32) | index length (u32) | index (JSON) | entry data ...
+# Entry offsets in the index are relative to the start of the entry data.
+MAGIC = b"PFBUNDLE"
+FORMAT_VERSION = 1
+HEADER = struct.Struct("<8sII")
+BUNDLE_PATH = os.environ.get("PORTFOLIO_BUNDLE", os.path.join(BASE_DIR, "portfolio.bundle"))
+STYLESHEET_PATH = os.path.join(BASE_DIR, "static", "portfolio.css")
+ABOUT_PATH = "aboutpage.txt"
+PUBLICATIONS_PATH = "publications.json"
+
+
+class BundleError(ValueError):
+    pass
+
+
+class Bundle:
+    """Read-only view of a bundle file; entry data is sliced out of the mmap on demand."""
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self._mmap) < HEADER.size:
+            raise BundleError(f"{path}: truncated")
+        magic, fmt, index_len = HEADER.unpack_from(self._mmap)
+        if magic != MAGIC:
+            raise BundleError(f"{path}: not a portfolio bundle")
+        if fmt != FORMAT_VERSION:
+            raise BundleError(f"{path}: format {fmt}, expected {FORMAT_VERSION}")
+        self._data_start = HEADER.size + index_len
+        self.index: Dict[str, Any] = json.loads(bytes(self._mmap[HEADER.size:self._data_start]))
+        self.entries: Dict[str, Dict[str, Any]] = self.index["entries"]
+        self.version: str = self.index["version"]
+        self.source: Dict[str, str] = self.index["source"]
+
+    def get(self, name: str) -> Optional[memoryview]:
+        entry = self.entries.get(name)
+        if entry is None:
+            return None
+        start = self._data_start + entry["offset"]
+        return memoryview(self._mmap)[start:start + entry["length"]]
+
+    def blob(self, name: str) -> Optional[bytes]:
+        view = self.get(name)
+        return None if view is None else bytes(view)
+
+    def text(self, name: str) -> Optional[str]:
+        view = self.get(name)
+        return None if view is None else str(view, "utf-8")
+
+    def key(self, path: str) -> ContentKey:
+        return ContentKey(self.source["owner"], self.source["repo"], self.source["ref"], path)
+
+    def install(self):
+        """Seed the process-wide caches that the app reads on its first render."""
+        src = self.source
+        resume_key = self.key(src["resume_path"])
+        raw = self.blob(f"file:{src['resume_path']}")
+        model = self.text("model:resume")
+        if raw is not None and model is not None:
+            resume = RESUME_HISTORY.update(resume_key, Resume.from_dict(json.loads(model)))
+            CONTENT.seed(resume_key, raw, {"resume": ResumeResult(resume)})
+
+        raw = self.blob(f"file:{PUBLICATIONS_PATH}")
+        if raw is not None:
+            pubs = publications_from_json(json.loads(self.text("model:publications") or "[]"))
+            CONTENT.seed(self.key(PUBLICATIONS_PATH), raw, {"publications": pubs})
+
+        raw = self.blob(f"file:{src['projects_path']}")
+        projects = self.text("model:projects")
+        if raw is not None and projects is not None:
+            CONTENT.seed(self.key(src["projects_path"]), raw, {"projects": projects})
+
+        raw = self.blob(f"file:{ABOUT_PATH}")
+        if raw is not None:
+            CONTENT.seed(self.key(ABOUT_PATH), raw)
+
+        assets: Dict[str, Asset] = {}
+        for name, entry in self.entries.items():
+            if name.startswith("asset:"):
+                path = name[len("asset:"):]
+                assets[path] = Asset(
+                    path=path,
+                    size=entry["length"],
+                    sha256=entry["sha256"],
+                    mime=entry["mime"],
+                    data=self.blob(name),
+                    data_uri=self.text(f"asset_uri:{path}"),
+                )
+        if assets:
+            registry_for(self.index.get("manifest")).preload(
+                self.index.get("groups") or {}, assets, self.index.get("sprite")
+            )
+
+        profile_img = src.get("profile_img")
+        avatar = self.entries.get(f"avatar:{profile_img}")
+        if profile_img and avatar:
+            AVATARS.preload(
+                profile_img,
+                Avatar(
+                    sha256=avatar["sha256"],
+                    data=self.blob(f"avatar:{profile_img}"),
+                    data_uri=self.text(f"avatar_uri:{profile_img}"),
+                    placeholder_uri=avatar["placeholder_uri"],
+                ),
+            )
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "path": self.path,
+            "version": self.version,
+            "built_at": self.index.get("built_at"),
+            "source": "/".join((self.source["owner"], self.source["repo"], self.source["ref"])),
+            "entries": len(self.entries),
+            "bytes": len(self._mmap),
+        }
+
+
+# Loaded (and installed) once per process; app.py is re-executed on every rerun
+_LOADED: Dict[str, Optional[Bundle]] = {}
+_LOADED_LOCK = threading.Lock()
+
+
+def load_once(path: str = BUNDLE_PATH) -> Optional[Bundle]:
+    with _LOADED_LOCK:
+        if path in _LOADED:
+            return _LOADED[path]
+        bundle = None
+        if os.path.exists(path):
+            try:
+                t0 = time.perf_counter()
+                bundle = Bundle(path)
+                bundle.install()
+                log.info(
+                    "%s: version %s, %d entries in %.1f ms",
+                    path, bundle.version, len(bundle.entries), (time.perf_counter() - t0) * 1000,
+                )
+            except (OSError, ValueError, KeyError) as e:
+                log.warning("%s: ignored (%s)", path, e)
+                bundle = None
+        _LOADED[path] = bundle
+        return bundle
+
+
+# ---------------------------
+# Builder: python bundle.py build-bundle
+# ---------------------------
+class _Writer:
+    def __init__(self):
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self.chunks: List[bytes] = []
+        self.size = 0
+
+    def add(self, name: str, data: bytes, **meta: Any):
+        self.entries[name] = dict(meta, offset=self.size, length=len(data))
+        self.chunks.append(data)
+        self.size += len(data)
+
+
+def _read_source(path: str, source_dir: Optional[str], key: ContentKey, token: Optional[str]) -> Optional[bytes]:
+    if source_dir:
+        full_path = os.path.join(source_dir, path)
+        if not os.path.isfile(full_path):
+            return None
+        with open(full_path, "rb") as f:
+            return f.read()
+    return fetch_raw(key, token).data
+
+
+def build_bundle(
+    out_path: str,
+    owner: str,
+    repo: str,
+    ref: str,
+    resume_path: str,
+    projects_path: str = "projects.docx",
+    profile_img: str = "",
+    manifest: str = "",
+    source_dir: Optional[str] = None,
+    token: Optional[str] = None,
+) -> Dict[str, Any]:
+    w = _Writer()
+    source = {
+        "owner": owner,
+        "repo": repo,
+        "ref": ref,
+        "resume_path": resume_path,
+        "projects_path": projects_path,
+        "profile_img": profile_img,
+    }
+
+    def read(path: str) -> Optional[bytes]:
+        data = _read_source(path, source_dir, ContentKey(owner, repo, ref, path), token)
+        if data is not None:
+            w.add(f"file:{path}", data)
+        return data
+
+    # Content files and the parsed render model
+    raw = read(resume_path)
+    if raw is None:
+        raise BundleError(f"resume not found: {resume_path}")
+    w.add("model:resume", json.dumps(Resume.from_dict(resume_parser_for(resume_path)(raw)).to_dict()).encode("utf-8"))
+    raw = read(PUBLICATIONS_PATH)
+    if raw is not None:
+        pubs = [p.to_dict() for p in parse_publications_json(raw)]
+        w.add("model:publications", json.dumps(pubs).encode("utf-8"))
+    raw = read(projects_path)
+    if raw is not None:
+        w.add("model:projects", parse_projects_bytes(projects_path, raw).encode("utf-8"))
+    read(ABOUT_PATH)
+
+    # Logos, pre-encoded as data URIs
+    registry = registry_for(manifest or None)
+    groups = {g: registry.logo_map(g) for g in ("companies", "education", "certifications")}
+    for path in sorted({p for entries in groups.values() for p in entries.values()}):
+        asset = registry.get(path)
+        w.add(f"asset:{path}", asset.data, sha256=asset.sha256, mime=asset.mime)
+        w.add(f"asset_uri:{path}", asset.data_uri.encode("ascii"))
+
+    # Resized avatar + blurred placeholder
+    if profile_img and os.path.isfile(os.path.join(BASE_DIR, profile_img)):
+        with open(os.path.join(BASE_DIR, profile_img), "rb") as f:
+            avatar = build_avatar(f.read())
+        w.add(f"avatar:{profile_img}", avatar.data, sha256=avatar.sha256, placeholder_uri=avatar.placeholder_uri)
+        w.add(f"avatar_uri:{profile_img}", avatar.data_uri.encode("ascii"))
+
+    with open(STYLESHEET_PATH, "rb") as f:
+        w.add("css:portfolio.css", f.read())
+
+    payload = b"".join(w.chunks)
+    index = {
+        "format": FORMAT_VERSION,
+        "version": hashlib.sha256(payload).hexdigest()[:16],
+        "built_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "source": source,
+        "manifest": manifest,
+        "groups": groups,
+        "sprite": registry.sprite,  # the sheet itself is served from static/
+        "entries": w.entries,
+    }
+    index_bytes = json.dumps(index, separators=(",", ":")).encode("utf-8")
+
+    tmp_path = out_path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, FORMAT_VERSION, len(index_bytes)))
+        f.write(index_bytes)
+        f.write(payload)
+    os.replace(tmp_path, out_path)
+    return index
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    build = sub.add_parser("build-bundle", help="fetch, parse and encode content into a bundle file")
+    build.add_argument("--out", default=BUNDLE_PATH)
+    build.add_argument("--tenant", help="take the source from tenants.json")
+    build.add_argument("--owner")
+    build.add_argument("--repo")
+    build.add_argument("--ref", default="main")
+    build.add_argument("--resume", help="resume path in the repo (.docx/.json/.md)")
+    build.add_argument("--projects", default="projects.docx")
+    build.add_argument("--profile-img", default="assets/profile.jpg")
+    build.add_argument("--manifest", default="", help="asset manifest (default assets/manifest.json)")
+    build.add_argument("--from-dir", help="read content files from this directory instead of GitHub")
+
+    inspect = sub.add_parser("inspect", help="print a bundle's index")
+    inspect.add_argument("path", nargs="?", default=BUNDLE_PATH)
+    args = parser.parse_args(argv)
+
+    if args.command == "inspect":
+        bundle = Bundle(args.path)
+        print(json.dumps(bundle.stats(), indent=2))
+        for name, entry in sorted(bundle.entries.items()):
+            print(f"  {entry['length']:>9}  {name}")
+        return 0
+
+    if args.tenant:
+        tenant = TENANTS.get(args.tenant)
+        if tenant is None:
+            parser.error(f"unknown tenant: {args.tenant}")
+        args.owner, args.repo, args.ref, args.resume = tenant.owner, tenant.repo, tenant.branch, tenant.resume_path
+        args.projects, args.profile_img, args.manifest = tenant.projects_path, tenant.profile_img, tenant.manifest
+    if not (args.owner and args.repo and args.resume):
+        parser.error("--owner, --repo and --resume (or --tenant) are required")
+
+    try:
+        index = build_bundle(
+            args.out,
+            args.owner,
+            args.repo,
+            args.ref,
+            args.resume,
+            projects_path=args.projects,
+            profile_img=args.profile_img,
+            manifest=args.manifest,
+            source_dir=args.from_dir,
+            token=os.environ.get("GITHUB_TOKEN"),
+        )
+    except (BundleError, UpstreamError) as e:
+        print(f"build-bundle: {e}", file=sys.stderr)
+        return 1
+    print(f"wrote {args.out} (version {index['version']}, {len(index['entries'])} entries)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
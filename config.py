@@ -0,0 +1,31 @@
+from tenants import Tenant
+
+# ---------------------------
+# CONFIG - CHANGE THESE
+# ---------------------------
+GITHUB_OWNER = "Akhila-A2610"
+GITHUB_REPO = "Portfolio"
+# .docx, or a structured source that skips docx parsing: .json (JSON Resume or the
+# resume_cache.json shape) / .md — see ingest.py
+RESUME_PATH_IN_REPO = "Akhila_A_Resume.docx"
+PROJECTS_PATH_IN_REPO = "projects.docx"
+BRANCH = "main"
+
+# Optional local assets (stored in repo)
+PROFILE_IMG = "assets/profile.jpg"
+# Company / education / certification logos live in assets/manifest.json
+# (regenerate with `python asset_manifest.py` after adding a logo)
+
+LINKEDIN_USER = "akhilaa2610"
+
+# Served when no ?tenant=<id> is given (or the id is not in tenants.json)
+DEFAULT_TENANT = Tenant(
+    id="default",
+    owner=GITHUB_OWNER,
+    repo=GITHUB_REPO,
+    resume_path=RESUME_PATH_IN_REPO,
+    projects_path=PROJECTS_PATH_IN_REPO,
+    branch=BRANCH,
+    linkedin_user=LINKEDIN_USER,
+    profile_img=PROFILE_IMG,
+)
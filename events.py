@@ -0,0 +1,149 @@
+import os, json, gzip, time, atexit, shutil, logging, threading
+from collections import deque
+from typing import Dict, Any, Optional
+
+# ---------------------------
+# Visitor event log (requests.jsonl)
+# ---------------------------
+# record() only appends a dict to a deque (atomic under the GIL, no lock), so it
+# costs microseconds on the script thread. A background writer drains the queue
+# in batches, appends JSON lines, and rotates the file by size or age.
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+EVENT_LOG_PATH = os.environ.get("PORTFOLIO_EVENT_LOG", os.path.join(BASE_DIR, "requests.jsonl"))
+FLUSH_INTERVAL = 2.0
+MAX_QUEUE = 100_000  # oldest events are dropped beyond this (writer stalled)
+ROTATE_BYTES = 10 * 1024 * 1024
+ROTATE_AGE = 24 * 3600
+KEEP_ROTATED = 30
+
+log = logging.getLogger(__name__)
+
+
+class EventLog:
+    def __init__(
+        self,
+        path: str = EVENT_LOG_PATH,
+        flush_interval: float = FLUSH_INTERVAL,
+        rotate_bytes: int = ROTATE_BYTES,
+        rotate_age: float = ROTATE_AGE,
+        compress: bool = True,
+        keep: int = KEEP_ROTATED,
+        max_queue: int = MAX_QUEUE,
+    ):
+        self.path = path
+        self.flush_interval = flush_interval
+        self.rotate_bytes = rotate_bytes
+        self.rotate_age = rotate_age
+        self.compress = compress
+        self.keep = keep
+        self.enabled = True
+        self._queue: deque = deque(maxlen=max_queue)
+        self._recorded = 0
+        self.written = 0
+        self.rotations = 0
+        self.errors = 0
+        self._file_started: Optional[float] = None
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+
+    @property
+    def dropped(self) -> int:
+        return max(0, self._recorded - self.written - len(self._queue))
+
+    def record(self, event: str, **fields: Any):
+        if not self.enabled:
+            return
+        fields["event"] = event
+        fields["ts"] = time.time()
+        self._queue.append(fields)
+        self._recorded += 1
+        if self._thread is None:
+            self._start()
+
+    def _start(self):
+        with self._start_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="event-log", daemon=True)
+                self._thread.start()
+                atexit.register(self.flush)
+
+    def _run(self):
+        while True:
+            time.sleep(self.flush_interval)
+            self.flush()
+
+    def flush(self):
+        lines = []
+        while True:
+            try:
+                lines.append(json.dumps(self._queue.popleft(), separators=(",", ":"), default=str))
+            except IndexError:
+                break
+        if not lines:
+            return
+        try:
+            self._maybe_rotate()
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write("\n".join(lines) + "\n")
+            if self._file_started is None:
+                self._file_started = time.time()
+            self.written += len(lines)
+        except OSError as e:
+            self.errors += 1
+            log.warning("%s: %s; dropped %d events", self.path, e, len(lines))
+
+    def _maybe_rotate(self):
+        try:
+            size = os.path.getsize(self.path)
+        except OSError:
+            self._file_started = None
+            return
+        if self._file_started is None:
+            self._file_started = _first_timestamp(self.path) or time.time()
+        if size < self.rotate_bytes and time.time() - self._file_started < self.rotate_age:
+            return
+
+        root, ext = os.path.splitext(self.path)
+        now = time.time()
+        rotated = f"{root}-{time.strftime('%Y%m%d-%H%M%S', time.localtime(now))}-{int(now * 1000) % 1000:03d}{ext}"
+        os.replace(self.path, rotated)
+        self._file_started = None
+        self.rotations += 1
+        if self.compress:
+            with open(rotated, "rb") as src, gzip.open(rotated + ".gz", "wb") as dst:
+                shutil.copyfileobj(src, dst)
+            os.remove(rotated)
+        self._prune(root, ext)
+
+    def _prune(self, root: str, ext: str):
+        directory, prefix = os.path.split(root)
+        prefix += "-"
+        rotated = sorted(
+            os.path.join(directory, n)
+            for n in os.listdir(directory or ".")
+            if n.startswith(prefix) and (n.endswith(ext) or n.endswith(ext + ".gz"))
+        )
+        for path in rotated[:-self.keep] if self.keep > 0 else rotated:
+            os.remove(path)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "path": self.path,
+            "queued": len(self._queue),
+            "written": self.written,
+            "dropped": self.dropped,
+            "rotations": self.rotations,
+            "errors": self.errors,
+        }
+
+
+def _first_timestamp(path: str) -> Optional[float]:
+    # Age of an existing log = timestamp of its first event (survives restarts)
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return float(json.loads(f.readline()).get("ts"))
+    except (OSError, ValueError, TypeError, AttributeError):
+        return None
+
+
+EVENTS = EventLog()
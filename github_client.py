@@ -0,0 +1,732 @@
+import os, time, pickle, hashlib, logging, threading
+from collections import Counter, OrderedDict, deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Dict, Any, Callable, Deque, List, NamedTuple, Optional, Tuple
+from urllib.parse import urlsplit
+
+import requests
+
+log = logging.getLogger(__name__)
+
+# ---------------------------
+# GitHub raw fetch + process-wide content cache
+# ---------------------------
+# Overridable so load tests can point at a local stub (see loadtest.py)
+GITHUB_RAW_BASE = os.environ.get("GITHUB_RAW_BASE", "https://raw.githubusercontent.com").rstrip("/")
+REQUEST_TIMEOUT = (5, 30)  # (connect, read) seconds
+
+# Missing files (404) are remembered this long before asking again
+NEGATIVE_TTL = 60.0
+
+# Circuit breaker: open after this many consecutive failures, probe again after the cooldown
+BREAKER_FAILURES = 3
+BREAKER_COOLDOWN = 30.0
+
+# Hourly request budgets assumed until the API reports its own X-RateLimit-* headers
+UNAUTHENTICATED_LIMIT = 60
+AUTHENTICATED_LIMIT = 5000
+
+# Background revalidation may use at most this share of the remaining budget
+REFRESH_BUDGET_SHARE = 0.5
+REFRESH_MIN_INTERVAL = 300.0
+
+# Global cap for cached files + parsed values across all tenants (LRU eviction)
+CACHE_MAX_BYTES = int(os.environ.get("PORTFOLIO_CACHE_MAX_BYTES", 256 * 1024 * 1024))
+
+
+class ContentKey(NamedTuple):
+    """Identity of a file in a repo. Credentials are deliberately not part of it."""
+
+    owner: str
+    repo: str
+    ref: str
+    path: str
+
+
+class UpstreamError(Exception):
+    """The upstream host failed (timeout, connection error, 5xx) or its circuit is open."""
+
+
+class CircuitOpen(UpstreamError):
+    pass
+
+
+class RateLimited(UpstreamError):
+    pass
+
+
+# ---------------------------
+# Circuit breaker (one per upstream host)
+# ---------------------------
+class CircuitBreaker:
+    CLOSED, OPEN, HALF_OPEN = "closed", "open", "half-open"
+
+    def __init__(self, failure_threshold: int = BREAKER_FAILURES, cooldown: float = BREAKER_COOLDOWN):
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self._probing = False
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+            if self.state == self.OPEN and time.monotonic() - self.opened_at >= self.cooldown:
+                self.state = self.HALF_OPEN
+                self._probing = False
+            if self.state == self.HALF_OPEN and not self._probing:
+                # Exactly one request probes the host; everyone else fails fast
+                self._probing = True
+                return True
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self.state = self.CLOSED
+            self.failures = 0
+            self._probing = False
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            self._probing = False
+            if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+                self.state = self.OPEN
+                self.opened_at = time.monotonic()
+
+
+_BREAKERS: Dict[str, CircuitBreaker] = {}
+_BREAKERS_LOCK = threading.Lock()
+
+
+def breaker_for(url: str) -> CircuitBreaker:
+    host = urlsplit(url).netloc
+    with _BREAKERS_LOCK:
+        return _BREAKERS.setdefault(host, CircuitBreaker())
+
+
+def breaker_states() -> Dict[str, str]:
+    with _BREAKERS_LOCK:
+        return {host: b.state for host, b in _BREAKERS.items()}
+
+
+# ---------------------------
+# Rate-limit budget + token rotation
+# ---------------------------
+class RateBudget:
+    """Remaining requests for one credential, as reported by the X-RateLimit-* headers."""
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.remaining = limit
+        self.reset_at = time.time() + 3600
+        self.requests = 0
+
+    def observe(self, headers: Any, status: int):
+        self.requests += 1
+        now = time.time()
+        if now >= self.reset_at:
+            self.remaining = self.limit
+            self.reset_at = now + 3600
+
+        # Only api.github.com reports a budget; raw.githubusercontent.com sends no X-RateLimit-*
+        # headers and isn't held to these limits, so its responses don't count down
+        if "X-RateLimit-Remaining" in headers:
+            try:
+                self.limit = int(headers.get("X-RateLimit-Limit", self.limit))
+                self.remaining = int(headers["X-RateLimit-Remaining"])
+                self.reset_at = float(headers.get("X-RateLimit-Reset", self.reset_at))
+            except (TypeError, ValueError):
+                pass
+
+        if status == 429 or (status == 403 and self.remaining == 0):
+            self.remaining = 0
+            retry_after = headers.get("Retry-After")
+            if retry_after and str(retry_after).isdigit():
+                self.reset_at = now + int(retry_after)
+
+    @property
+    def exhausted(self) -> bool:
+        return self.remaining <= 0 and time.time() < self.reset_at
+
+
+class TokenPool:
+    """Rotates requests across configured tokens, preferring the one with most budget left."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._budgets: Dict[Optional[str], RateBudget] = {None: RateBudget(UNAUTHENTICATED_LIMIT)}
+
+    def configure(self, tokens: List[str]):
+        with self._lock:
+            for token in tokens:
+                if token and token not in self._budgets:
+                    self._budgets[token] = RateBudget(AUTHENTICATED_LIMIT)
+
+    def pick(self) -> Optional[str]:
+        with self._lock:
+            candidates = [(t, b) for t, b in self._budgets.items() if not b.exhausted]
+            if not candidates:
+                raise RateLimited("GitHub request budget exhausted for all tokens")
+            # Authenticated tokens first, then by remaining budget
+            return max(candidates, key=lambda tb: (tb[0] is not None, tb[1].remaining))[0]
+
+    def observe(self, token: Optional[str], headers: Any, status: int):
+        with self._lock:
+            budget = self._budgets.setdefault(
+                token, RateBudget(AUTHENTICATED_LIMIT if token else UNAUTHENTICATED_LIMIT)
+            )
+            budget.observe(headers, status)
+
+    def remaining_rate(self) -> float:
+        # Requests per second we can spend until the budgets reset
+        now = time.time()
+        with self._lock:
+            return sum(
+                b.remaining / max(1.0, b.reset_at - now) for b in self._budgets.values() if not b.exhausted
+            )
+
+    def metrics(self) -> List[Dict[str, Any]]:
+        now = time.time()
+        with self._lock:
+            return [
+                {
+                    # Position only: not even a suffix of a token reaches the stats panel
+                    "token": f"token {i}" if t else "anonymous",
+                    "limit": b.limit,
+                    "remaining": b.remaining,
+                    "reset_in_s": max(0, int(b.reset_at - now)),
+                    "requests": b.requests,
+                }
+                for i, (t, b) in enumerate(self._budgets.items())
+            ]
+
+
+TOKENS = TokenPool()
+
+
+class Fetched(NamedTuple):
+    data: Optional[bytes]  # None when the file does not exist
+    etag: Optional[str] = None
+    not_modified: bool = False
+
+
+def http_fetch(
+    url: str,
+    token: Optional[str] = None,
+    etag: Optional[str] = None,
+    extra_headers: Optional[Dict[str, str]] = None,
+    authoritative: bool = True,
+) -> Fetched:
+    """GET one file; raises UpstreamError on failures and exhausted budgets.
+
+    Only authoritative sources may report a file as missing; a 404 from a mirror
+    is treated as a failure so it can't poison the negative cache.
+    """
+    breaker = breaker_for(url)
+    if not breaker.allow():
+        raise CircuitOpen(f"circuit open for {urlsplit(url).netloc}")
+
+    headers = dict(extra_headers or {})
+    if token:
+        headers["Authorization"] = f"Bearer {token}"
+    if etag:
+        headers["If-None-Match"] = etag
+    try:
+        r = requests.get(url, headers=headers, timeout=REQUEST_TIMEOUT)
+    except requests.RequestException as e:
+        breaker.record_failure()
+        raise UpstreamError(str(e)) from e
+
+    if token is not None or authoritative:
+        TOKENS.observe(token, r.headers, r.status_code)
+    if r.status_code == 429 or (r.status_code == 403 and r.headers.get("X-RateLimit-Remaining") == "0"):
+        # Throttling is a budget problem, not a host failure: don't trip the breaker
+        breaker.record_success()
+        raise RateLimited(f"rate limited on {url}")
+    if r.status_code >= 500:
+        breaker.record_failure()
+        raise UpstreamError(f"{r.status_code} from {url}")
+
+    breaker.record_success()
+    if r.status_code == 304:
+        return Fetched(None, etag, not_modified=True)
+    if r.status_code == 200:
+        return Fetched(r.content, r.headers.get("ETag"))
+    if not authoritative:
+        raise UpstreamError(f"{r.status_code} from mirror {url}")
+    return Fetched(None)
+
+
+def fetch_raw(key: ContentKey, token: Optional[str] = None, etag: Optional[str] = None) -> Fetched:
+    raw_url = f"{GITHUB_RAW_BASE}/{key.owner}/{key.repo}/{key.ref}/{key.path}"
+    if token is None:
+        token = TOKENS.pick()
+    return http_fetch(raw_url, token, etag)
+
+
+# ---------------------------
+# Alternate sources + hedged fetch
+# ---------------------------
+GITHUB_API_BASE = "https://api.github.com"
+
+# Hedge delay = this percentile of recent primary latencies, clamped to the bounds below
+HEDGE_PERCENTILE = 0.95
+HEDGE_MIN_DELAY = 0.05
+HEDGE_DEFAULT_DELAY = 0.5  # until enough samples are collected
+HEDGE_MIN_SAMPLES = 20
+
+
+class Source(NamedTuple):
+    name: str
+    fetch: Callable[..., Fetched]  # (key, token, etag) -> Fetched
+
+
+def contents_api_source() -> Source:
+    def fetch(key: ContentKey, token: Optional[str] = None, etag: Optional[str] = None) -> Fetched:
+        url = f"{GITHUB_API_BASE}/repos/{key.owner}/{key.repo}/contents/{key.path}?ref={key.ref}"
+        return http_fetch(url, token or TOKENS.pick(), None, {"Accept": "application/vnd.github.raw"})
+
+    return Source("contents-api", fetch)
+
+
+def url_mirror_source(template: str) -> Source:
+    # e.g. https://cdn.jsdelivr.net/gh/{owner}/{repo}@{ref}/{path}
+    def fetch(key: ContentKey, token: Optional[str] = None, etag: Optional[str] = None) -> Fetched:
+        return http_fetch(template.format(**key._asdict()), authoritative=False)
+
+    return Source(urlsplit(template).netloc, fetch)
+
+
+def dir_mirror_source(root: str) -> Source:
+    # Synced copies laid out as root/owner/repo/ref/path, so tenants and refs never mix
+    def fetch(key: ContentKey, token: Optional[str] = None, etag: Optional[str] = None) -> Fetched:
+        path = os.path.normpath(os.path.join(root, key.owner, key.repo, key.ref, key.path))
+        if not path.startswith(os.path.normpath(root) + os.sep):
+            raise UpstreamError(f"path escapes mirror: {'/'.join(key)}")
+        try:
+            with open(path, "rb") as f:
+                return Fetched(f.read())
+        except OSError as e:
+            raise UpstreamError(f"mirror {root}: {e}") from e
+
+    return Source(f"dir:{root}", fetch)
+
+
+def parse_mirror(spec: str) -> Source:
+    """``api`` | ``https://host/...{owner}/{repo}/{ref}/{path}`` | a local ``root/owner/repo/ref/path`` tree."""
+    if spec == "api":
+        return contents_api_source()
+    if spec.startswith(("http://", "https://")):
+        return url_mirror_source(spec)
+    return dir_mirror_source(os.path.expanduser(spec))
+
+
+class HedgedFetcher:
+    """Primary fetch with a hedged request to the next source after an adaptive delay.
+
+    The first successful response wins. Python threads can't be interrupted, so a
+    losing request that already started runs to completion in the pool and its
+    result is dropped; requests not yet started are cancelled.
+    """
+
+    def __init__(self, primary: Source, mirrors: Optional[List[Source]] = None, max_workers: int = 16):
+        self.primary = primary
+        self.mirrors: List[Source] = list(mirrors or [])
+        self.mirror_specs: List[str] = []
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="hedge")
+        self._latencies: Deque[float] = deque(maxlen=200)
+        self._lock = threading.Lock()
+        self.hedges = 0
+        self.wins: Counter = Counter()
+
+    def hedge_delay(self) -> float:
+        with self._lock:
+            samples = sorted(self._latencies)
+        if len(samples) < HEDGE_MIN_SAMPLES:
+            return HEDGE_DEFAULT_DELAY
+        idx = min(len(samples) - 1, int(HEDGE_PERCENTILE * len(samples)))
+        return max(HEDGE_MIN_DELAY, samples[idx])
+
+    def _timed_primary(self, key: ContentKey, token: Optional[str], etag: Optional[str]) -> Fetched:
+        t0 = time.perf_counter()
+        result = self.primary.fetch(key, token, etag)
+        with self._lock:
+            self._latencies.append(time.perf_counter() - t0)
+        return result
+
+    def fetch(self, key: ContentKey, token: Optional[str] = None, etag: Optional[str] = None) -> Fetched:
+        if not self.mirrors:
+            return self._timed_primary(key, token, etag)
+
+        pending: Dict[Future, str] = {
+            self._pool.submit(self._timed_primary, key, token, etag): self.primary.name
+        }
+        backups = list(self.mirrors)
+        last_error: Optional[BaseException] = None
+        delay = self.hedge_delay()
+
+        while pending:
+            done, _ = wait(list(pending), timeout=delay if backups else None, return_when=FIRST_COMPLETED)
+            for fut in done:
+                name = pending.pop(fut)
+                if fut.exception() is None:
+                    for loser in pending:
+                        loser.cancel()
+                    self.wins[name] += 1
+                    return fut.result()
+                last_error = fut.exception()
+
+            # Hedge on timeout, or immediately if everything in flight has failed
+            if backups and (not done or not pending):
+                source = backups.pop(0)
+                self.hedges += 1
+                pending[self._pool.submit(source.fetch, key, token, None)] = source.name
+
+        if isinstance(last_error, UpstreamError):
+            raise last_error
+        raise UpstreamError(str(last_error))
+
+    def metrics(self) -> Dict[str, Any]:
+        return {
+            "sources": [self.primary.name] + [m.name for m in self.mirrors],
+            "hedge_delay_ms": round(self.hedge_delay() * 1000, 1),
+            "hedges": self.hedges,
+            "wins": dict(self.wins),
+        }
+
+
+HEDGED = HedgedFetcher(Source("raw", fetch_raw))
+
+
+# ---------------------------
+# Content cache
+# ---------------------------
+class _Entry(NamedTuple):
+    data: Optional[bytes]
+    fetched_at: float
+    expires_at: Optional[float]  # only set for negative (missing file) entries
+    etag: Optional[str] = None
+
+
+class ContentCache:
+    """One copy per process of each downloaded file and of each value derived from it.
+
+    Keys are ``ContentKey`` values, so sessions with different (or no) tokens share
+    entries. Concurrent misses for the same key wait on a single download/parse.
+    Derived values are shared between sessions and must be treated as read-only.
+
+    Missing files are cached for ``negative_ttl`` seconds. When the upstream fails
+    the last good copy is served (it survives ``clear``), and nothing derived from
+    such a fallback is cached, so recovery is picked up on the next request.
+
+    Files and derived values from every repo (tenant) share one ``max_bytes``
+    budget; the least recently used entries are evicted first.
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[..., Fetched] = fetch_raw,
+        negative_ttl: float = NEGATIVE_TTL,
+        max_bytes: int = CACHE_MAX_BYTES,
+    ):
+        self._fetch = fetch
+        self.negative_ttl = negative_ttl
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._key_locks: Dict[Any, threading.Lock] = {}
+        self._blobs: Dict[ContentKey, _Entry] = {}
+        self._last_good: Dict[ContentKey, bytes] = {}
+        self._derived: Dict[Tuple[str, ContentKey], Tuple[Any, int]] = {}
+        # Derived values built from a last good copy -> digest of those bytes; fresh bytes must match to reuse them
+        self._fallback_digests: Dict[Tuple[str, ContentKey], str] = {}
+        # ("file", key) / ("derived", (name, key)) -> bytes, least recently used first
+        self._lru: "OrderedDict[Tuple[str, Any], int]" = OrderedDict()
+        self.bytes = 0
+        self.evictions = 0
+        self.hits = 0
+        self.misses = 0
+        self.fallbacks = 0
+        self._repo_hits: Counter = Counter()
+        self._repo_misses: Counter = Counter()
+
+    def _key_lock(self, key: Any) -> threading.Lock:
+        with self._lock:
+            return self._key_locks.setdefault(key, threading.Lock())
+
+    def _hit(self, lru_key: Tuple[str, Any], key: ContentKey):
+        self.hits += 1
+        self._repo_hits[(key.owner, key.repo)] += 1
+        with self._lock:
+            if lru_key in self._lru:
+                self._lru.move_to_end(lru_key)
+
+    def _miss(self, key: ContentKey):
+        self.misses += 1
+        self._repo_misses[(key.owner, key.repo)] += 1
+
+    def _account(self, lru_key: Tuple[str, Any], size: int):
+        with self._lock:
+            self.bytes -= self._lru.pop(lru_key, 0)
+            self._lru[lru_key] = size
+            self.bytes += size
+            while self.bytes > self.max_bytes and len(self._lru) > 1:
+                (kind, old_key), old_size = self._lru.popitem(last=False)
+                self.bytes -= old_size
+                self.evictions += 1
+                if kind == "file":
+                    self._blobs.pop(old_key, None)
+                    self._last_good.pop(old_key, None)
+                else:
+                    self._derived.pop(old_key, None)
+                    self._fallback_digests.pop(old_key, None)
+
+    def _cached(self, key: ContentKey) -> Optional[_Entry]:
+        entry = self._blobs.get(key)
+        if entry is None:
+            return None
+        if entry.expires_at is not None and time.monotonic() >= entry.expires_at:
+            return None
+        return entry
+
+    def _get_bytes(self, key: ContentKey, token: Optional[str]) -> Tuple[Optional[bytes], bool]:
+        # Returns (data, fresh); fresh is False when serving the last good copy
+        entry = self._cached(key)
+        if entry is not None:
+            self._hit(("file", key), key)
+            return entry.data, True
+
+        with self._key_lock(key):
+            entry = self._cached(key)
+            if entry is not None:
+                self._hit(("file", key), key)
+                return entry.data, True
+            self._miss(key)
+            try:
+                fetched = self._fetch(key, token)
+            except UpstreamError as e:
+                self.fallbacks += 1
+                if not isinstance(e, (CircuitOpen, RateLimited)):
+                    log.warning("%s: %s; serving last good copy", "/".join(key), e)
+                return self._last_good.get(key), False
+
+            self._store(key, fetched.data, fetched.etag)
+            return fetched.data, True
+
+    def _store(self, key: ContentKey, data: Optional[bytes], etag: Optional[str]):
+        if data is None:
+            self._blobs[key] = _Entry(None, time.time(), time.monotonic() + self.negative_ttl)
+            self._account(("file", key), 0)
+        else:
+            self._blobs[key] = _Entry(data, time.time(), None, etag)
+            self._last_good[key] = data
+            self._account(("file", key), len(data))
+
+    def revalidate(self, key: ContentKey, token: Optional[str] = None) -> bool:
+        """Conditionally re-download a cached file; returns True if its content changed."""
+        with self._key_lock(key):
+            entry = self._blobs.get(key)
+            if entry is None or entry.data is None:
+                return False
+            fetched = self._fetch(key, token, entry.etag)
+            if fetched.not_modified or fetched.data == entry.data:
+                self._blobs[key] = entry._replace(fetched_at=time.time())
+                return False
+            self._store(key, fetched.data, fetched.etag)
+        with self._lock:
+            for dkey in [d for d in self._derived if d[1] == key]:
+                del self._derived[dkey]
+                self._fallback_digests.pop(dkey, None)
+                self.bytes -= self._lru.pop(("derived", dkey), 0)
+        return True
+
+    def seed(self, key: ContentKey, data: bytes, derived: Optional[Dict[str, Any]] = None):
+        """Install a file (and values derived from it) without fetching, e.g. from a bundle.
+
+        Seeded files count as fresh; the refresher revalidates them like any other entry.
+        """
+        with self._key_lock(key):
+            self._store(key, data, None)
+        for name, value in (derived or {}).items():
+            self._put_derived((name, key), value)
+
+    def _put_derived(self, dkey: Tuple[str, ContentKey], value: Any):
+        try:
+            size = len(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+        except Exception:
+            size = 0
+        self._derived[dkey] = (value, size)
+        self._fallback_digests.pop(dkey, None)
+        self._account(("derived", dkey), size)
+
+    def missing(self, key: ContentKey) -> bool:
+        """True while upstream's last answer for ``key`` was "no such file" (negative-cached)."""
+        entry = self._cached(key)
+        return entry is not None and entry.data is None
+
+    def keys(self) -> List[ContentKey]:
+        return [k for k, e in list(self._blobs.items()) if e.data is not None]
+
+    def get_bytes(self, key: ContentKey, token: Optional[str] = None) -> Optional[bytes]:
+        return self._get_bytes(key, token)[0]
+
+    def get_derived(
+        self, name: str, key: ContentKey, build: Callable[[Optional[bytes]], Any], token: Optional[str] = None
+    ) -> Any:
+        dkey = (name, key)
+        entry = self._derived.get(dkey)
+        if entry is not None and dkey not in self._fallback_digests:
+            self._hit(("derived", dkey), key)
+            return entry[0]
+
+        with self._key_lock(dkey):
+            entry = self._derived.get(dkey)
+            if entry is not None and dkey not in self._fallback_digests:
+                self._hit(("derived", dkey), key)
+                return entry[0]
+            data, fresh = self._get_bytes(key, token)
+            if data is None:
+                return build(data)
+            # Values parsed from a last good copy are cached too, tagged with its digest, so an
+            # outage doesn't re-parse on every rerun; bytes with another digest rebuild them
+            digest = hashlib.blake2b(data, digest_size=16).hexdigest()
+            if entry is not None and self._fallback_digests.get(dkey) == digest:
+                value = entry[0]
+                self._hit(("derived", dkey), key)
+            else:
+                value = build(data)
+                self._put_derived(dkey, value)
+            if fresh:
+                self._fallback_digests.pop(dkey, None)
+            else:
+                self._fallback_digests[dkey] = digest
+            return value
+
+    def clear(self):
+        # Last good copies are kept (and stay accounted) so a refresh during an outage still renders
+        with self._lock:
+            self._blobs.clear()
+            self._derived.clear()
+            self._fallback_digests.clear()
+            for lru_key in [k for k in self._lru if k[0] == "derived"]:
+                self.bytes -= self._lru.pop(lru_key)
+
+    def repo_stats(self) -> Dict[Tuple[str, str], Dict[str, int]]:
+        by_repo: Dict[Tuple[str, str], Dict[str, int]] = {}
+        for (kind, k), size in list(self._lru.items()):
+            key = k if kind == "file" else k[1]
+            row = by_repo.setdefault(
+                (key.owner, key.repo), {"files": 0, "file_bytes": 0, "derived": 0, "derived_bytes": 0}
+            )
+            prefix = "file" if kind == "file" else "derived"
+            row["files" if kind == "file" else "derived"] += 1
+            row[f"{prefix}_bytes"] += size
+        for repo, row in by_repo.items():
+            row["hits"] = self._repo_hits[repo]
+            row["misses"] = self._repo_misses[repo]
+        return by_repo
+
+    def stats(self) -> Dict[str, Any]:
+        blobs = list(self._blobs.items())
+        derived = list(self._derived.items())
+        return {
+            "files": sum(1 for _, e in blobs if e.data is not None),
+            "file_bytes": sum(len(e.data or b"") for _, e in blobs),
+            "missing": sum(1 for _, e in blobs if e.data is None),
+            "derived": len(derived),
+            "derived_bytes": sum(size for _, (_, size) in derived),
+            "derived_from_fallback": len(self._fallback_digests),
+            "bytes": self.bytes,
+            "max_bytes": self.max_bytes,
+            "evictions": self.evictions,
+            "hits": self.hits,
+            "misses": self.misses,
+            "fallbacks": self.fallbacks,
+            "breakers": breaker_states(),
+            "entries": [
+                {"path": "/".join(k), "bytes": len(e.data or b""), "missing": e.data is None, "fetched_at": e.fetched_at}
+                for k, e in blobs
+            ],
+        }
+
+
+# ---------------------------
+# Background revalidation paced by the rate-limit budget
+# ---------------------------
+class Refresher:
+    def __init__(
+        self,
+        cache: ContentCache,
+        pool: TokenPool,
+        share: float = REFRESH_BUDGET_SHARE,
+        min_interval: float = REFRESH_MIN_INTERVAL,
+    ):
+        self.cache = cache
+        self.pool = pool
+        self.share = share
+        self.min_interval = min_interval
+        self.interval: Optional[float] = None
+        self.refreshed = 0
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def next_interval(self, n_keys: int) -> float:
+        # Spend at most `share` of what is left until reset; foreground gets the rest
+        rate = self.share * self.pool.remaining_rate()
+        if rate <= 0:
+            return self.min_interval * 4
+        return max(self.min_interval, n_keys / rate)
+
+    def start(self):
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="github-refresher", daemon=True)
+                self._thread.start()
+
+    def _run(self):
+        while True:
+            self.interval = self.next_interval(len(self.cache.keys()))
+            time.sleep(self.interval)
+            for key in self.cache.keys():
+                try:
+                    if self.cache.revalidate(key):
+                        self.refreshed += 1
+                except UpstreamError:
+                    break
+                except Exception as e:
+                    log.warning("refresh of %s failed: %s", "/".join(key), e)
+
+    def metrics(self) -> Dict[str, Any]:
+        return {
+            "running": self._thread is not None,
+            "interval_s": round(self.interval, 1) if self.interval else None,
+            "share": self.share,
+            "refreshed": self.refreshed,
+        }
+
+
+# Module-level so they survive Streamlit reruns and are shared by all sessions
+CONTENT = ContentCache(HEDGED.fetch)
+REFRESHER = Refresher(CONTENT, TOKENS)
+
+
+def configure(
+    tokens: List[str],
+    share: Optional[float] = None,
+    background_refresh: bool = True,
+    mirrors: Optional[List[str]] = None,
+    max_bytes: Optional[int] = None,
+):
+    TOKENS.configure(tokens)
+    if max_bytes:
+        CONTENT.max_bytes = max_bytes
+    if mirrors is not None and mirrors != HEDGED.mirror_specs:
+        HEDGED.mirrors = [parse_mirror(m) for m in mirrors]
+        HEDGED.mirror_specs = list(mirrors)
+    if share is not None:
+        REFRESHER.share = share
+    if background_refresh:
+        REFRESHER.start()
@@ -0,0 +1,296 @@
+"""Versioned history of the parsed portfolio content.
+
+    python history.py list [--source owner/repo@ref]
+    python history.py diff <old> <new>
+
+Every distinct version of a source's parsed content (resume sections,
+publications, projects, about text) is recorded once. Section values are
+stored content-addressed under ``objects/``, so an unchanged section is never
+written twice. Each line of ``versions.jsonl`` holds only the sections that
+changed since the parent version. A version is keyed by its commit SHA when
+the ref is one, otherwise by the hash of its sections, and renders from the
+store alone, with no download and no parse.
+"""
+import os, re, sys, json, time, logging, argparse, hashlib, threading
+from collections import OrderedDict
+from typing import Dict, Any, List, NamedTuple, Optional, Tuple
+
+from incremental import ResumeDiff
+from models import Publication, Resume, publications_from_json
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+HISTORY_DIR = os.environ.get("PORTFOLIO_HISTORY_DIR", os.path.join(BASE_DIR, "history"))
+SNAPSHOT_CACHE = 16  # rebuilt snapshots kept in memory
+
+log = logging.getLogger(__name__)
+
+Source = Tuple[str, str, str]  # (owner, repo, ref)
+_SHA_RE = re.compile(r"^[0-9a-f]{40}$")
+
+
+class Snapshot(NamedTuple):
+    resume: Resume
+    publications: Tuple[Publication, ...]
+    projects_text: str
+    about_text: Optional[str]
+
+
+class HistoryError(KeyError):
+    pass
+
+
+# ---------------------------
+# Snapshot <-> sections
+# ---------------------------
+def _encode(value: Any) -> bytes:
+    return json.dumps(value, ensure_ascii=False, sort_keys=True, separators=(",", ":")).encode("utf-8")
+
+
+def _digest(data: bytes) -> str:
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def snapshot_sections(snap: Snapshot) -> "OrderedDict[str, bytes]":
+    """Section name -> encoded value; job order is the order of the ``job:`` entries."""
+    r = snap.resume
+    sections: "OrderedDict[str, bytes]" = OrderedDict()
+    sections["header"] = _encode([r.name, r.role])
+    sections["contact"] = _encode(r.contact_line)
+    sections["summary"] = _encode(r.summary)
+    sections["publications"] = _encode(list(r.publications))
+    sections["education"] = _encode([e.text for e in r.education])
+    sections["certifications"] = _encode(list(r.certifications))
+    for job in r.experience:
+        sections[f"job:{job.header}"] = _encode(list(job.bullets))
+    sections["doc:publications"] = _encode([p.to_dict() for p in snap.publications])
+    sections["doc:projects"] = _encode(snap.projects_text)
+    sections["doc:about"] = _encode(snap.about_text)
+    return sections
+
+
+def _snapshot_from(values: "OrderedDict[str, Any]") -> Snapshot:
+    name, role = values["header"]
+    resume = Resume.from_dict({
+        "name": name,
+        "role": role,
+        "contact_line": values["contact"],
+        "summary": values["summary"],
+        "publications": values["publications"],
+        "experience": {k[4:]: v for k, v in values.items() if k.startswith("job:")},
+        "education": values["education"],
+        "certifications": values["certifications"],
+    })
+    return Snapshot(
+        resume, publications_from_json(values["doc:publications"]), values["doc:projects"], values["doc:about"]
+    )
+
+
+# ---------------------------
+# Version store
+# ---------------------------
+class ContentHistory:
+    """Append-only version log plus content-addressed section objects on disk."""
+
+    def __init__(self, directory: str = HISTORY_DIR, snapshot_cache: int = SNAPSHOT_CACHE):
+        self.directory = directory
+        self.enabled = True
+        self._log_path = os.path.join(directory, "versions.jsonl")
+        self._lock = threading.Lock()
+        self._loaded = False
+        self.versions: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()  # id -> record (oldest first)
+        self._maps: Dict[str, "OrderedDict[str, str]"] = {}  # id -> section -> object hash
+        self._latest: Dict[Source, str] = {}
+        self._seen: Dict[Source, Snapshot] = {}  # last recorded snapshot per source
+        self._snapshots: "OrderedDict[str, Snapshot]" = OrderedDict()
+        self._snapshot_cache = snapshot_cache
+        self.objects_written = 0
+        self.errors = 0
+
+    def _load(self):
+        if self._loaded:
+            return
+        self._loaded = True
+        try:
+            with open(self._log_path, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        self._apply(json.loads(line))
+                    except (ValueError, KeyError, TypeError):
+                        continue  # torn last line after a crash
+        except OSError:
+            pass
+
+    def _apply(self, rec: Dict[str, Any]):
+        vid, source = rec["id"], tuple(rec["source"])
+        if vid not in self._maps:
+            parent = self._maps.get(rec.get("parent") or "", OrderedDict())
+            sections = OrderedDict((k, h) for k, h in parent.items() if k not in rec.get("removed", ()))
+            sections.update(rec.get("sections", {}))
+            if "order" in rec:
+                sections = OrderedDict((k, sections[k]) for k in rec["order"])
+            self._maps[vid] = sections
+            self.versions[vid] = {k: rec[k] for k in ("id", "source", "ts", "parent", "ref") if k in rec}
+        self._latest[source] = vid
+
+    def _object_path(self, digest: str) -> str:
+        return os.path.join(self.directory, "objects", digest[:2], digest + ".json")
+
+    def _write_object(self, digest: str, data: bytes):
+        path = self._object_path(digest)
+        if os.path.exists(path):
+            return
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+        self.objects_written += 1
+
+    def _read_object(self, digest: str) -> Any:
+        with open(self._object_path(digest), "rb") as f:
+            return json.loads(f.read())
+
+    def record(self, source: Source, snap: Snapshot) -> Optional[str]:
+        """Store ``snap`` as the current version of ``source``; returns its id (None if disabled or on error)."""
+        if not self.enabled:
+            return None
+        # Cached loaders hand back the same objects until the content changes (about text is re-decoded)
+        with self._lock:
+            self._load()
+            seen = self._seen.get(source)
+            if seen is not None and all(a is b or a == b for a, b in zip(seen, snap)) and source in self._latest:
+                return self._latest[source]
+        encoded = snapshot_sections(snap)
+        hashes = OrderedDict((k, _digest(v)) for k, v in encoded.items())
+        ref = source[2]
+        vid = ref if _SHA_RE.match(ref) else _digest(_encode(list(hashes.items())))[:24]
+        with self._lock:
+            self._load()
+            if self._latest.get(source) == vid:
+                self._seen[source] = snap
+                return vid
+            parent = self._latest.get(source)
+            rec: Dict[str, Any] = {"id": vid, "source": list(source), "ts": round(time.time(), 3), "ref": ref}
+            if vid not in self._maps:
+                old = self._maps.get(parent or "", OrderedDict())
+                rec["parent"] = parent
+                rec["sections"] = {k: h for k, h in hashes.items() if old.get(k) != h}
+                rec["removed"] = [k for k in old if k not in hashes]
+                # Replay keeps the parent's order and appends new sections; store the order only if it differs
+                if list(hashes) != [k for k in old if k in hashes] + [k for k in hashes if k not in old]:
+                    rec["order"] = list(hashes)
+            try:
+                for k, digest in rec.get("sections", {}).items():
+                    self._write_object(digest, encoded[k])
+                os.makedirs(self.directory, exist_ok=True)
+                with open(self._log_path, "a", encoding="utf-8") as f:
+                    f.write(json.dumps(rec, separators=(",", ":")) + "\n")
+            except OSError as e:
+                self.errors += 1
+                log.warning("%s: %s", self.directory, e)
+                return None
+            self._apply(rec)
+            self._seen[source] = snap
+            self._remember(vid, snap)
+            return vid
+
+    def _remember(self, vid: str, snap: Snapshot):
+        self._snapshots[vid] = snap
+        self._snapshots.move_to_end(vid)
+        while len(self._snapshots) > self._snapshot_cache:
+            self._snapshots.popitem(last=False)
+
+    def resolve(self, prefix: str) -> str:
+        """Full version id for an id or unambiguous prefix (at least 7 characters)."""
+        with self._lock:
+            self._load()
+            if prefix in self._maps:
+                return prefix
+            matches = [v for v in self._maps if len(prefix) >= 7 and v.startswith(prefix)]
+        if len(matches) != 1:
+            raise HistoryError(f"{'ambiguous' if matches else 'unknown'} version {prefix!r}")
+        return matches[0]
+
+    def snapshot(self, version: str) -> Snapshot:
+        vid = self.resolve(version)
+        with self._lock:
+            snap = self._snapshots.get(vid)
+            if snap is not None:
+                self._snapshots.move_to_end(vid)
+                return snap
+            sections = self._maps[vid]
+        snap = _snapshot_from(OrderedDict((k, self._read_object(h)) for k, h in sections.items()))
+        with self._lock:
+            self._remember(vid, snap)
+        return snap
+
+    def latest(self, source: Source) -> Optional[str]:
+        with self._lock:
+            self._load()
+            return self._latest.get(source)
+
+    def list(self, source: Optional[Source] = None) -> List[Dict[str, Any]]:
+        with self._lock:
+            self._load()
+            rows = [dict(r) for r in self.versions.values() if source is None or tuple(r["source"]) == source]
+        return rows[::-1]
+
+    def diff(self, old: str, new: str) -> ResumeDiff:
+        old_id, new_id = self.resolve(old), self.resolve(new)
+        return ResumeDiff.between(self._maps[old_id], self._maps[new_id])
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "directory": self.directory,
+            "versions": len(self.versions),
+            "sources": len(self._latest),
+            "objects_written": self.objects_written,
+            "cached_snapshots": len(self._snapshots),
+            "errors": self.errors,
+        }
+
+
+HISTORY = ContentHistory()
+
+
+# ---------------------------
+# CLI
+# ---------------------------
+def _parse_source(spec: str) -> Source:
+    repo, _, ref = spec.partition("@")
+    owner, _, name = repo.partition("/")
+    return owner, name, ref or "main"
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Inspect the parsed-content version history.")
+    parser.add_argument("--dir", default=HISTORY_DIR)
+    sub = parser.add_subparsers(dest="command", required=True)
+    ls = sub.add_parser("list", help="versions, newest first")
+    ls.add_argument("--source", help="owner/repo@ref")
+    df = sub.add_parser("diff", help="sections changed between two versions")
+    df.add_argument("old")
+    df.add_argument("new")
+    args = parser.parse_args(argv)
+
+    store = ContentHistory(args.dir)
+    try:
+        if args.command == "list":
+            for row in store.list(_parse_source(args.source) if args.source else None):
+                owner, repo, ref = row["source"]
+                stamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(row["ts"]))
+                print(f"{row['id'][:12]}  {stamp}  {owner}/{repo}@{ref}  parent={(row.get('parent') or '-')[:12]}")
+        else:
+            d = store.diff(args.old, args.new)
+            for label, names in (("added", d.added), ("removed", d.removed), ("changed", d.changed)):
+                for name in names:
+                    print(f"{label:8} {name}")
+            print(f"{d.unchanged} unchanged")
+    except HistoryError as e:
+        print(f"[history] {e.args[0]}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
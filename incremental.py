@@ -0,0 +1,179 @@
+import hashlib, logging, threading
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from typing import Dict, Any, Callable, Hashable, Tuple
+
+from models import Resume
+
+log = logging.getLogger(__name__)
+
+# ---------------------------
+# Section-level hashing / diff between resume versions
+# ---------------------------
+def content_hash(value: Any) -> str:
+    return hashlib.blake2b(repr(value).encode("utf-8"), digest_size=12).hexdigest()
+
+
+def section_hashes(resume: Resume) -> Dict[str, str]:
+    hashes = {
+        "header": content_hash((resume.name, resume.role)),
+        "contact": content_hash(resume.contact_line),
+        "summary": content_hash(resume.summary),
+        "publications": content_hash(resume.publications),
+        "education": content_hash(resume.education),
+        "certifications": content_hash(resume.certifications),
+    }
+    for job in resume.experience:
+        hashes[f"job:{job.header}"] = content_hash(job.bullets)
+    return hashes
+
+
+@dataclass(frozen=True)
+class ResumeDiff:
+    added: Tuple[str, ...] = ()
+    removed: Tuple[str, ...] = ()
+    changed: Tuple[str, ...] = ()
+    unchanged: int = 0
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed or self.changed)
+
+    @classmethod
+    def between(cls, old: Dict[str, str], new: Dict[str, str]) -> "ResumeDiff":
+        return cls(
+            added=tuple(k for k in new if k not in old),
+            removed=tuple(k for k in old if k not in new),
+            changed=tuple(k for k in new if k in old and old[k] != new[k]),
+            unchanged=sum(1 for k in new if old.get(k) == new[k]),
+        )
+
+
+class ResumeHistory:
+    """Keeps the previous parse per source so a new version can share unchanged blocks.
+
+    Unchanged jobs and sections are swapped for the previous objects, so anything
+    memoized on them (see ``BlockMemo``) stays warm; only changed blocks miss.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._last: Dict[Hashable, Tuple[Resume, Dict[str, str]]] = {}
+        self.last_diff: Dict[Hashable, ResumeDiff] = {}
+
+    def forget(self, match: Callable[[Hashable], bool]):
+        with self._lock:
+            for source in [s for s in self._last if match(s)]:
+                del self._last[source]
+                self.last_diff.pop(source, None)
+
+    def update(self, source: Hashable, resume: Resume) -> Resume:
+        hashes = section_hashes(resume)
+        with self._lock:
+            prev = self._last.get(source)
+            if prev is not None:
+                old, old_hashes = prev
+                diff = ResumeDiff.between(old_hashes, hashes)
+                if diff:
+                    log.debug("%s: changed %s", source, diff.changed + diff.added + diff.removed)
+                resume = _share_unchanged(old, resume, old_hashes, hashes)
+                self.last_diff[source] = diff
+            self._last[source] = (resume, hashes)
+        return resume
+
+
+def _share_unchanged(old: Resume, new: Resume, old_hashes: Dict[str, str], hashes: Dict[str, str]) -> Resume:
+    old_jobs = {job.header: job for job in old.experience}
+    jobs = tuple(
+        old_jobs[job.header]
+        if job.header in old_jobs and old_hashes.get(f"job:{job.header}") == hashes[f"job:{job.header}"]
+        else job
+        for job in new.experience
+    )
+    fields = {"experience": jobs}
+    for name in ("summary", "contact_line", "publications", "education", "certifications"):
+        section = "contact" if name == "contact_line" else name
+        if old_hashes.get(section) == hashes[section]:
+            fields[name] = getattr(old, name)
+    return replace(new, **fields)
+
+
+RESUME_HISTORY = ResumeHistory()
+
+
+# ---------------------------
+# Memo for per-block derived outputs (HTML, markdown, logo matches)
+# ---------------------------
+class BlockMemo:
+    """LRU of outputs keyed by (kind, block); blocks are frozen records, tuples or strings."""
+
+    def __init__(self, max_entries: int = 4096):
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Tuple[str, Hashable], Any]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, kind: str, block: Hashable, compute: Callable[[], Any]) -> Any:
+        key = (kind, block)
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+        value = compute()
+        with self._lock:
+            self.misses += 1
+            self._entries[key] = value
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return value
+
+    def stats(self) -> Dict[str, int]:
+        return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+BLOCKS = BlockMemo()
+
+
+# ---------------------------
+# Rendered fragments (HTML / markdown strings)
+# ---------------------------
+class FragmentCache(BlockMemo):
+    """Rendered strings keyed by (kind, content version, relevant session state), shared by sessions.
+
+    The content version is the cached content object itself (frozen records, tuples,
+    strings): every rerun passes the same shared object, so a lookup is an identity
+    hit and a content change yields a new key. Evicts least recently used entries
+    beyond ``max_entries`` or ``max_bytes`` of rendered text.
+    """
+
+    def __init__(self, max_entries: int = 2048, max_bytes: int = 16 * 1024 * 1024):
+        super().__init__(max_entries)
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self._sizes: Dict[Tuple[str, Hashable], int] = {}
+
+    def render(self, kind: str, version: Hashable, state: Hashable, build: Callable[[], str]) -> str:
+        key = (kind, (version, state))
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+        value = build()
+        size = len(value)
+        with self._lock:
+            self.misses += 1
+            self.bytes += size - self._sizes.get(key, 0)
+            self._entries[key] = value
+            self._sizes[key] = size
+            while len(self._entries) > 1 and (len(self._entries) > self.max_entries or self.bytes > self.max_bytes):
+                old_key, _ = self._entries.popitem(last=False)
+                self.bytes -= self._sizes.pop(old_key, 0)
+        return value
+
+    def stats(self) -> Dict[str, int]:
+        return dict(super().stats(), bytes=self.bytes)
+
+
+FRAGMENTS = FragmentCache()
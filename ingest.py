@@ -0,0 +1,460 @@
+import io, os, re, json
+from typing import Dict, Any, Callable, List, Optional, Tuple
+
+try:  # optional: several times faster than the stdlib parser
+    import orjson
+except ImportError:
+    orjson = None
+
+from models import DEFAULT_ROLE, Publication, publications_from_json
+
+# ---------------------------
+# Content ingestion by file extension
+# ---------------------------
+# Every resume parser returns the dict shape of resume_cache.json["content"]
+# (experience: {header: [bullets]}), which Resume.from_dict turns into the model.
+# Structured sources (.json / .md) skip docx unzipping and XML parsing entirely;
+# anything else falls back to the .docx parser.
+
+
+class IngestError(ValueError):
+    """Structured source that does not match the expected schema."""
+
+
+def loads_json(b: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(b)
+    return json.loads(b.decode("utf-8"))
+
+
+# ---------------------------
+# Schema validation (resume_cache.json shape)
+# ---------------------------
+RESUME_FIELDS: Dict[str, type] = {
+    "name": str,
+    "role": str,
+    "contact_line": str,
+    "summary": str,
+    "publications": list,
+    "experience": dict,
+    "education": list,
+    "certifications": list,
+}
+
+
+def _str_list(value: List[Any], field: str) -> List[str]:
+    if not all(isinstance(v, str) for v in value):
+        raise IngestError(f"resume: '{field}' must be a list of strings")
+    return value
+
+
+def validate_resume_dict(d: Any) -> Dict[str, Any]:
+    if not isinstance(d, dict):
+        raise IngestError("resume: expected a JSON object")
+    parsed: Dict[str, Any] = {"role": DEFAULT_ROLE}
+    for field, kind in RESUME_FIELDS.items():
+        value = d.get(field)
+        if value is None:
+            continue
+        if not isinstance(value, kind):
+            raise IngestError(f"resume: '{field}' must be a {'object' if kind is dict else kind.__name__}")
+        if kind is list:
+            value = _str_list(value, field)
+        parsed[field] = value
+    for header, bullets in (parsed.get("experience") or {}).items():
+        # A bullet list, or one newline-separated string (as resume_cache.json stores it)
+        if not isinstance(bullets, str):
+            if not isinstance(bullets, list):
+                raise IngestError(f"resume: experience '{header}' must be a list or string")
+            _str_list(bullets, f"experience.{header}")
+    if not parsed.get("name"):
+        raise IngestError("resume: 'name' is required")
+    return parsed
+
+
+# ---------------------------
+# JSON: resume_cache.json shape, or JSON Resume (https://jsonresume.org/schema)
+# ---------------------------
+MONTHS = "Jan Feb Mar Apr May Jun Jul Aug Sep Oct Nov Dec".split()
+
+
+def _month_year(date: Optional[str]) -> str:
+    # "2021-01-15" / "2021-01" / "2021" -> "Jan 2021" / "2021"
+    if date is not None and not isinstance(date, str):
+        raise IngestError(f"JSON Resume: dates must be strings, got {date!r}")
+    parts = (date or "").split("-")
+    if len(parts) >= 2 and parts[1].isdigit() and 1 <= int(parts[1]) <= 12:
+        return f"{MONTHS[int(parts[1]) - 1]} {parts[0]}"
+    return parts[0]
+
+
+def _date_range(item: Dict[str, Any]) -> str:
+    start = _month_year(item.get("startDate"))
+    if not start:
+        return ""
+    return f"{start} – {_month_year(item.get('endDate')) or 'Present'}"
+
+
+def _objects(d: Dict[str, Any], field: str) -> List[Dict[str, Any]]:
+    items = d.get(field) or []
+    if not isinstance(items, list) or not all(isinstance(x, dict) for x in items):
+        raise IngestError(f"JSON Resume: '{field}' must be a list of objects")
+    return items
+
+
+def _strings(item: Dict[str, Any], *fields: str) -> List[str]:
+    # The non-empty values of ``fields``, in order
+    values = [item.get(f) for f in fields]
+    for field, value in zip(fields, values):
+        if value is not None and not isinstance(value, str):
+            raise IngestError(f"JSON Resume: '{field}' must be a string")
+    return [v for v in values if v]
+
+
+def from_json_resume(d: Dict[str, Any]) -> Dict[str, Any]:
+    basics = d.get("basics") or {}
+    if not isinstance(basics, dict):
+        raise IngestError("JSON Resume: 'basics' must be an object")
+
+    contact = _strings(basics, "email", "phone")
+    # Network names stay plain words so make_hyperlinked_contact can link them
+    contact += [x for p in _objects(basics, "profiles") for x in _strings(p, "network")]
+
+    experience: Dict[str, List[str]] = {}
+    for job in _objects(d, "work"):
+        header = ", ".join(_strings(job, "position", "name", "location"))
+        dates = _date_range(job)
+        header = f"{header}  {dates}" if dates else header
+        highlights = job.get("highlights") or []
+        if not isinstance(highlights, list):
+            raise IngestError("JSON Resume: 'highlights' must be a list")
+        experience[header] = _strings(job, "summary") + highlights  # strings checked by validate_resume_dict
+
+    education = []
+    for edu in _objects(d, "education"):
+        degree = " in ".join(_strings(edu, "studyType", "area"))
+        line = " – ".join(x for x in (degree, *_strings(edu, "institution")) if x)
+        if edu.get("score"):
+            line += f" (GPA: {edu['score']})"
+        education.append(line)
+
+    publications = [
+        ", ".join(x for x in (*_strings(p, "name", "publisher"), _month_year(p.get("releaseDate"))) if x)
+        for p in _objects(d, "publications")
+    ]
+    certifications = [x for c in _objects(d, "certificates") for x in _strings(c, "name")]
+    certifications += [x for a in _objects(d, "awards") for x in _strings(a, "title")]
+
+    return validate_resume_dict({
+        "name": basics.get("name") or "",
+        "role": basics.get("label") or DEFAULT_ROLE,
+        "contact_line": " | ".join(contact),
+        "summary": basics.get("summary") or "",
+        "publications": publications,
+        "experience": experience,
+        "education": education,
+        "certifications": certifications,
+    })
+
+
+def parse_resume_json_bytes(b: bytes) -> Dict[str, Any]:
+    try:
+        d = loads_json(b)
+    except ValueError as e:
+        raise IngestError(f"resume: invalid JSON ({e})") from e
+    if isinstance(d, dict) and "basics" in d:
+        return from_json_resume(d)
+    if isinstance(d, dict) and isinstance(d.get("content"), dict):
+        d = d["content"]  # resume_cache.json wraps the dict with last_updated
+    return validate_resume_dict(d)
+
+
+# ---------------------------
+# Markdown
+# ---------------------------
+# # Name
+# Role line (optional)
+# email | phone | LinkedIn | GitHub
+# ## Summary / Experience (### job header, - bullets) / Publications / Education / Certifications
+MD_HEADINGS = {
+    "summary": "summary",
+    "professional summary": "summary",
+    "experience": "experience",
+    "professional experience": "experience",
+    "publications": "publications",
+    "education": "education",
+    "certifications": "certifications",
+    "certifications & achievements": "certifications",
+    "achievements": "certifications",
+}
+MD_BULLET_RE = re.compile(r"^\s*(?:[-*+•]|\d+\.)\s+")
+
+
+def parse_resume_markdown_bytes(b: bytes) -> Dict[str, Any]:
+    parsed: Dict[str, Any] = {
+        "name": "",
+        "role": DEFAULT_ROLE,
+        "contact_line": "",
+        "summary": "",
+        "publications": [],
+        "experience": {},
+        "education": [],
+        "certifications": [],
+    }
+    section: Optional[str] = None
+    current_job: Optional[str] = None
+    preamble: List[str] = []
+    continues = False  # the previous line was a list item that this line may continue
+
+    for raw in b.decode("utf-8", errors="replace").splitlines():
+        line = raw.strip()
+        if not line:
+            continues = False
+            continue
+        if line.startswith("### ") and section == "experience":
+            current_job = line[4:].strip()
+            parsed["experience"][current_job] = []
+            continues = False
+            continue
+        if line.startswith("## "):
+            section = MD_HEADINGS.get(line[3:].strip().lower(), "ignore")
+            current_job = None
+            continue
+        if line.startswith("# ") and not parsed["name"]:
+            parsed["name"] = line[2:].strip()
+            continue
+
+        bullet = MD_BULLET_RE.match(line)
+        text = line[bullet.end():] if bullet else line
+        if section is None:
+            preamble.append(line)
+        elif section == "summary":
+            parsed["summary"] += line + "\n"
+        elif section == "experience" and current_job:
+            items = parsed["experience"][current_job]
+            if bullet or not (continues and items):
+                items.append(text)
+            else:
+                items[-1] += " " + text
+        elif section in ("publications", "education", "certifications"):
+            items = parsed[section]
+            if bullet or not (continues and items):
+                items.append(text)
+            else:
+                items[-1] += " " + text
+        continues = bool(bullet) or continues
+
+    # Before the first section: an optional role line, then the contact line
+    for line in preamble:
+        if "@" in line or "|" in line:
+            parsed["contact_line"] = line
+        else:
+            parsed["role"] = line
+    parsed["summary"] = parsed["summary"].strip()
+    return validate_resume_dict(parsed)
+
+
+# ---------------------------
+# .docx (fallback)
+# ---------------------------
+def parse_resume_docx_bytes(docx_bytes: bytes) -> Dict[str, Any]:
+    from docx import Document  # only deployments that publish .docx need python-docx
+
+    doc = Document(io.BytesIO(docx_bytes))
+    para_lines = [p.text.strip() for p in doc.paragraphs if p.text and p.text.strip()]
+
+    parsed: Dict[str, Any] = {
+        "name": "",
+        "role": "Senior Data Engineer | Data Scientist",
+        "contact_line": "",
+        "summary": "",
+        "publications": [],
+        "experience": {},
+        "education": [],
+        "certifications": [],
+    }
+
+    if not para_lines:
+        return parsed
+
+    parsed["name"] = para_lines[0]
+    if len(para_lines) > 1:
+        parsed["contact_line"] = para_lines[1]
+
+    def clean_bullet(s: str) -> str:
+        return s.replace("•", "").strip()
+
+    HEADINGS = {
+        "PROFESSIONAL SUMMARY": "summary",
+        "PUBLICATIONS": "publications",
+        "PROFESSIONAL EXPERIENCE": "experience",
+        "EDUCATION": "education",
+        "CERTIFICATIONS & ACHIEVEMENTS": "certifications",
+        "CERTIFICATIONS": "certifications",
+        "ACHIEVEMENTS": "certifications",
+        # ignore these if they exist in resume
+        "TECHNICAL SKILLS": "ignore",
+        "SKILLS": "ignore",
+    }
+
+    section: Optional[str] = None
+    current_job: Optional[str] = None
+
+    job_header_re = re.compile(
+        r""".+,\s*.+\s+
+            ((Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)
+            |January|February|March|April|May|June|July|August|September|October|November|December)
+            \s+\d{4}\s*[–-]\s*
+            (Present|
+            ((Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)
+            |January|February|March|April|May|June|July|August|September|October|November|December)
+            \s+\d{4})
+        """,
+        re.IGNORECASE | re.VERBOSE,
+    )
+
+    i = 2
+    while i < len(para_lines):
+        s = para_lines[i]
+        s_u = s.upper().strip()
+
+        if s_u in HEADINGS:
+            section = HEADINGS[s_u]
+            current_job = None
+            i += 1
+            continue
+
+        if section == "ignore":
+            i += 1
+            continue
+
+        if section == "summary":
+            parsed["summary"] += s + "\n"
+            i += 1
+            continue
+
+        if section == "publications":
+            if s.strip().startswith("•"):
+                parsed["publications"].append(clean_bullet(s))
+            else:
+                if parsed["publications"]:
+                    parsed["publications"][-1] += " " + s.strip()
+                else:
+                    parsed["publications"].append(s.strip())
+            i += 1
+            continue
+
+        if section == "experience":
+            if job_header_re.search(s) and "•" not in s:
+                current_job = s.strip()
+                parsed["experience"][current_job] = []
+                i += 1
+                continue
+
+            if current_job and s.strip().startswith("•"):
+                parsed["experience"][current_job].append(clean_bullet(s))
+                i += 1
+                continue
+
+            if current_job and parsed["experience"][current_job]:
+                parsed["experience"][current_job][-1] += " " + s.strip()
+                i += 1
+                continue
+
+            i += 1
+            continue
+
+        if section == "education":
+            parsed["education"].append(s.strip())
+            i += 1
+            continue
+
+        if section == "certifications":
+            if s.strip().startswith("•"):
+                parsed["certifications"].append(clean_bullet(s))
+            else:
+                if parsed["certifications"]:
+                    parsed["certifications"][-1] += " " + s.strip()
+                else:
+                    parsed["certifications"].append(s.strip())
+            i += 1
+            continue
+
+        i += 1
+
+    parsed["summary"] = parsed["summary"].strip()
+    return parsed
+
+
+RESUME_PARSERS: Dict[str, Callable[[bytes], Dict[str, Any]]] = {
+    ".json": parse_resume_json_bytes,
+    ".md": parse_resume_markdown_bytes,
+    ".markdown": parse_resume_markdown_bytes,
+    ".docx": parse_resume_docx_bytes,
+}
+
+
+def resume_parser_for(path: str) -> Callable[[bytes], Dict[str, Any]]:
+    return RESUME_PARSERS.get(os.path.splitext(path)[1].lower(), parse_resume_docx_bytes)
+
+
+# ---------------------------
+# Projects (one paragraph per project)
+# ---------------------------
+def _projects_from_docx(b: bytes) -> List[str]:
+    from docx import Document
+
+    doc = Document(io.BytesIO(b))
+    return [p.text.strip() for p in doc.paragraphs if p.text.strip()]
+
+
+def _projects_from_json(b: bytes) -> List[str]:
+    try:
+        d = loads_json(b)
+    except ValueError as e:
+        raise IngestError(f"projects: invalid JSON ({e})") from e
+    if isinstance(d, dict):
+        d = d.get("projects")
+    if not isinstance(d, list):
+        raise IngestError("projects: expected a list (or {\"projects\": [...]})")
+    # Strings, or JSON Resume project objects
+    if not all(isinstance(p, (str, dict)) for p in d):
+        raise IngestError("projects: items must be strings or objects")
+    return [p if isinstance(p, str) else " – ".join(_strings(p, "name", "description")) for p in d]
+
+
+def _projects_from_text(b: bytes) -> List[str]:
+    lines = (MD_BULLET_RE.sub("", line).strip() for line in b.decode("utf-8", errors="replace").splitlines())
+    return [line for line in lines if line and not line.startswith("#")]
+
+
+PROJECT_PARSERS: Dict[str, Callable[[bytes], List[str]]] = {
+    ".json": _projects_from_json,
+    ".md": _projects_from_text,
+    ".markdown": _projects_from_text,
+    ".txt": _projects_from_text,
+    ".docx": _projects_from_docx,
+}
+
+
+def parse_projects_bytes(path: str, content_bytes: Optional[bytes]) -> str:
+    if not content_bytes:
+        return f"{path} not found in your GitHub repo root."
+    parse = PROJECT_PARSERS.get(os.path.splitext(path)[1].lower(), _projects_from_docx)
+    try:
+        projects = parse(content_bytes)
+    except IngestError as e:
+        return f"{path} could not be read: {e}"
+    return "\n".join([f"• {p}" for p in projects])
+
+
+# ---------------------------
+# Publications (publications.json)
+# ---------------------------
+def parse_publications_json(b: Optional[bytes]) -> Tuple[Publication, ...]:
+    if not b:
+        return ()
+    try:
+        return publications_from_json(loads_json(b))
+    except Exception:
+        return ()
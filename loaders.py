@@ -0,0 +1,91 @@
+from typing import NamedTuple, Optional, Tuple
+
+from github_client import CONTENT, ContentCache, ContentKey
+from incremental import RESUME_HISTORY
+from ingest import IngestError, parse_projects_bytes, parse_publications_json, resume_parser_for
+from models import Publication, Resume
+
+# Content loaders, importable without Streamlit (app.py, warmup.py). Everything goes
+# through the process-wide ContentCache, so every caller shares the same entries;
+# previews of other refs pass their own cache (see preview.py).
+
+# ---------------------------
+# Helpers: GitHub raw download
+# ---------------------------
+# Cached per (owner, repo, ref, path); the token is only used if a download is needed
+def download_raw_file(
+    owner: str, repo: str, path: str, branch: str = "main", token: Optional[str] = None,
+    cache: ContentCache = CONTENT,
+) -> Optional[bytes]:
+    return cache.get_bytes(ContentKey(owner, repo, branch, path), token)
+
+
+def download_raw_text(
+    owner: str, repo: str, path: str, branch: str = "main", token: Optional[str] = None,
+    cache: ContentCache = CONTENT,
+) -> Optional[str]:
+    b = download_raw_file(owner, repo, path, branch, token, cache)
+    if not b:
+        return None
+    try:
+        return b.decode("utf-8")
+    except Exception:
+        return b.decode("utf-8", errors="replace")
+
+
+# ---------------------------
+# Projects loader (projects.docx / .md / .json / .txt in repo root)
+# ---------------------------
+def load_projects_from_github(
+    owner: str, repo: str, branch: str = "main", token: Optional[str] = None, path: str = "projects.docx",
+    cache: ContentCache = CONTENT,
+) -> str:
+    return cache.get_derived(
+        "projects", ContentKey(owner, repo, branch, path), lambda b: parse_projects_bytes(path, b), token
+    )
+
+
+# ---------------------------
+# Load resume from GitHub (process-wide content cache)
+# ---------------------------
+class ResumeResult(NamedTuple):
+    """The cached outcome of parsing a resume: the model, or why the file doesn't parse."""
+
+    resume: Optional[Resume]
+    error: Optional[str] = None
+
+
+def load_resume_from_github(
+    owner: str, repo: str, path: str, branch: str = "main", token: Optional[str] = None,
+    cache: ContentCache = CONTENT,
+) -> Resume:
+    key = ContentKey(owner, repo, branch, path)
+    parse = resume_parser_for(path)  # by extension; .docx is the fallback
+
+    def build(content_bytes: Optional[bytes]) -> ResumeResult:
+        if content_bytes is None:
+            raise RuntimeError("Could not download resume file from GitHub (check file name/path).")
+        try:
+            parsed = parse(content_bytes)
+        except IngestError as e:
+            return ResumeResult(None, str(e))  # cached like a parse, so a bad file isn't re-parsed on every rerun
+        # Unchanged sections/jobs reuse the previous version's objects (and their memoized output)
+        return ResumeResult(RESUME_HISTORY.update(key, Resume.from_dict(parsed)))
+
+    # Frozen Resume shared by every session (no per-hit copy)
+    result = cache.get_derived("resume", key, build, token)
+    if result.error is not None:
+        raise IngestError(result.error)
+    return result.resume
+
+
+# ---------------------------
+# Publications loader (publications.json)
+# ---------------------------
+def load_publications_from_github(
+    owner: str, repo: str, branch: str = "main", token: Optional[str] = None,
+    cache: ContentCache = CONTENT,
+) -> Tuple[Publication, ...]:
+    return cache.get_derived(
+        "publications", ContentKey(owner, repo, branch, "publications.json"), parse_publications_json, token
+    )
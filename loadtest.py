@@ -0,0 +1,269 @@
+"""Load test: N concurrent sessions against one Streamlit server and a local GitHub raw stub.
+
+    python loadtest.py --sessions 200 --concurrency 50 --clicks 3
+
+Starts ``streamlit run app.py`` with GITHUB_RAW_BASE pointing at the stub, then
+drives the sessions over Streamlit's websocket (``/_stcore/stream``) the way a
+browser does: an initial run, then ``job_btn_*`` clicks. All sessions share the
+server's caches, so the upstream hit counts show what concurrent sessions cost
+GitHub. Latencies are from sending a run to its ``script_finished`` message.
+"""
+import os, sys, time, socket, asyncio, argparse, threading, statistics, subprocess, urllib.request
+from collections import Counter
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from typing import Dict, Any, List, Optional, Tuple
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+APP_PATH = os.path.join(BASE_DIR, "app.py")
+
+
+# ---------------------------
+# Stub for raw.githubusercontent.com
+# ---------------------------
+class RawStubServer:
+    """Serves /{owner}/{repo}/{ref}/{path} from a local directory and counts hits."""
+
+    def __init__(self, content_dir: str, latency_ms: float = 0.0):
+        self.content_dir = content_dir
+        self.latency = latency_ms / 1000.0
+        self.hits: Counter = Counter()
+        self._lock = threading.Lock()
+
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                parts = self.path.split("?", 1)[0].lstrip("/").split("/", 3)
+                path = parts[3] if len(parts) == 4 else ""
+                with stub._lock:
+                    stub.hits[path] += 1
+                if stub.latency:
+                    time.sleep(stub.latency)
+
+                full_path = os.path.normpath(os.path.join(stub.content_dir, path))
+                inside = os.path.commonpath([stub.content_dir, full_path]) == stub.content_dir
+                if not path or not inside or not os.path.isfile(full_path):
+                    self.send_response(404)
+                    self.end_headers()
+                    return
+                with open(full_path, "rb") as f:
+                    body = f.read()
+                self.send_response(200)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.httpd.server_address[1]}"
+
+    def __enter__(self) -> "RawStubServer":
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+# ---------------------------
+# Streamlit server
+# ---------------------------
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(port: int, raw_base: str, timeout: float) -> subprocess.Popen:
+    env = dict(os.environ, GITHUB_RAW_BASE=raw_base)
+    proc = subprocess.Popen(
+        [
+            sys.executable, "-m", "streamlit", "run", APP_PATH,
+            "--server.headless", "true",
+            "--server.address", "127.0.0.1",
+            "--server.port", str(port),
+            "--browser.gatherUsageStats", "false",
+        ],
+        env=env,
+        stdout=subprocess.DEVNULL,
+    )
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if proc.poll() is not None:
+            raise RuntimeError(f"streamlit exited with status {proc.returncode}")
+        try:
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/_stcore/health", timeout=2) as r:
+                if r.status == 200:
+                    return proc
+        except OSError:
+            pass
+        time.sleep(0.2)
+    proc.terminate()
+    raise RuntimeError(f"streamlit not up after {timeout:.0f} s")
+
+
+def rss_bytes(pid: int) -> Optional[int]:
+    # Resident memory of the server process (Linux only)
+    try:
+        with open(f"/proc/{pid}/status", "r") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    return None
+
+
+# ---------------------------
+# Simulated sessions
+# ---------------------------
+class Session:
+    """One browser tab: a websocket to /_stcore/stream speaking Streamlit's protobuf messages."""
+
+    def __init__(self, url: str, timeout: float):
+        self.url = url
+        self.timeout = timeout
+        self.conn = None
+        self.buttons: List[str] = []  # widget ids of the job_btn_* buttons in the last run
+
+    async def connect(self):
+        from tornado.websocket import websocket_connect
+
+        self.conn = await websocket_connect(self.url, subprotocols=["streamlit"])
+
+    async def run(self, click: Optional[str] = None) -> float:
+        """Sends one rerun (optionally clicking button ``click``); returns seconds until it finished."""
+        from streamlit.proto.BackMsg_pb2 import BackMsg
+        from streamlit.proto.ClientState_pb2 import ClientState
+        from streamlit.proto.WidgetStates_pb2 import WidgetState, WidgetStates
+
+        widgets = WidgetStates(widgets=[WidgetState(id=click, trigger_value=True)] if click else [])
+        msg = BackMsg(rerun_script=ClientState(query_string="", widget_states=widgets))
+        t0 = time.perf_counter()
+        await self.conn.write_message(msg.SerializeToString(), binary=True)
+        await asyncio.wait_for(self._until_finished(), self.timeout)
+        return time.perf_counter() - t0
+
+    async def _until_finished(self):
+        from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+
+        buttons: List[str] = []
+        error: Optional[str] = None
+        while True:
+            data = await self.conn.read_message()
+            if data is None:
+                raise ConnectionError("server closed the session")
+            msg = ForwardMsg()
+            msg.ParseFromString(data)
+            kind = msg.WhichOneof("type")
+            if kind == "delta" and msg.delta.WhichOneof("type") == "new_element":
+                element = msg.delta.new_element
+                if element.WhichOneof("type") == "button" and "job_btn_" in element.button.id:
+                    buttons.append(element.button.id)
+                elif element.WhichOneof("type") == "exception" and error is None:
+                    error = f"{element.exception.type}: {element.exception.message}"
+            elif kind == "script_finished":
+                if msg.script_finished == ForwardMsg.FINISHED_EARLY_FOR_RERUN:
+                    continue
+                self.buttons = buttons
+                if error:
+                    raise RuntimeError(error)
+                return
+
+    def close(self):
+        if self.conn is not None:
+            self.conn.close()
+
+
+async def run_session(url: str, clicks: int, timeout: float, gate: asyncio.Semaphore, live: List[Session]):
+    # Any failure is reported in the result, never raised
+    result: Dict[str, Any] = {"load": None, "clicks": [], "error": None}
+    session = Session(url, timeout)
+    async with gate:
+        try:
+            await session.connect()
+            live.append(session)  # kept open until the end for memory accounting
+            result["load"] = await session.run()
+            for i in range(min(clicks, len(session.buttons)) if session.buttons else 0):
+                result["clicks"].append(await session.run(session.buttons[i % len(session.buttons)]))
+        except Exception as e:
+            result["error"] = f"{type(e).__name__}: {e}"
+    return result
+
+
+async def run_sessions(
+    url: str, n: int, concurrency: int, clicks: int, timeout: float
+) -> Tuple[List[Dict[str, Any]], List[Session]]:
+    gate = asyncio.Semaphore(concurrency)
+    live: List[Session] = []
+    results = await asyncio.gather(*(run_session(url, clicks, timeout, gate, live) for _ in range(n)))
+    return list(results), live
+
+
+def percentiles(samples: List[float]) -> Dict[str, Optional[float]]:
+    if not samples:
+        return {"p50": None, "p95": None, "p99": None}
+    if len(samples) == 1:
+        return {"p50": samples[0], "p95": samples[0], "p99": samples[0]}
+    q = statistics.quantiles(samples, n=100, method="inclusive")
+    return {"p50": q[49], "p95": q[94], "p99": q[98]}
+
+
+def fmt_ms(v: Optional[float]) -> str:
+    return "-" if v is None else f"{v * 1000:.1f} ms"
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=100)
+    parser.add_argument("--concurrency", type=int, default=20, help="sessions running at once")
+    parser.add_argument("--clicks", type=int, default=2, help="job_btn_* clicks per session")
+    parser.add_argument("--stub-latency-ms", type=float, default=0.0)
+    parser.add_argument("--content-dir", default=BASE_DIR, help="directory served as the repo contents")
+    parser.add_argument("--timeout", type=float, default=60.0)
+    args = parser.parse_args(argv)
+
+    with RawStubServer(os.path.abspath(args.content_dir), args.stub_latency_ms) as stub:
+        port = _free_port()
+        server = start_server(port, stub.url, args.timeout)
+        try:
+            rss_before = rss_bytes(server.pid)
+            t0 = time.perf_counter()
+            url = f"ws://127.0.0.1:{port}/_stcore/stream"
+            results, live = asyncio.run(run_sessions(url, args.sessions, args.concurrency, args.clicks, args.timeout))
+            elapsed = time.perf_counter() - t0
+            rss_after = rss_bytes(server.pid)
+            for session in live:
+                session.close()
+        finally:
+            server.terminate()
+            server.wait(timeout=10)
+
+    loads = [r["load"] for r in results if r["load"] is not None and not r["error"]]
+    clicks = [c for r in results for c in r["clicks"]]
+    errors = [r["error"] for r in results if r["error"]]
+    runs = len(loads) + len(clicks)
+    upstream = sum(stub.hits.values())
+
+    print(f"sessions:     {args.sessions} ({args.concurrency} concurrent, one server, {len(errors)} errors)")
+    for label, samples in (("initial load", loads), ("job click", clicks)):
+        p = percentiles(samples)
+        print(f"{label + ':':<14}p50 {fmt_ms(p['p50'])}  p95 {fmt_ms(p['p95'])}  p99 {fmt_ms(p['p99'])}")
+    print(f"throughput:   {runs / elapsed:.1f} script runs/s over {elapsed:.1f} s")
+    print(f"upstream:     {upstream} requests for {runs} script runs ({upstream / max(1, runs):.3f} per run)")
+    for path, n in stub.hits.most_common():
+        print(f"  {n:>6}  {path}")
+    if rss_before is not None and rss_after is not None:
+        grown = rss_after - rss_before
+        per_session = grown / max(1, len(live)) / 1024
+        print(f"memory:       server RSS +{grown / 1024 / 1024:.1f} MiB, {per_session:.1f} KiB per live session")
+    for err, n in Counter(errors).most_common(5):
+        print(f"error ({n}x): {err}", file=sys.stderr)
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
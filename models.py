@@ -0,0 +1,94 @@
+import sys
+from dataclasses import dataclass
+from typing import Dict, Any, Iterable, Optional, Tuple
+
+# ---------------------------
+# Parsed content model
+# ---------------------------
+# Frozen + __slots__: cached instances are shared by every session without copies,
+# and each record is a handful of pointers instead of a per-instance dict.
+# Repeated short strings (job headers, venues, roles) are interned.
+DEFAULT_ROLE = "Senior Data Engineer | Data Scientist"
+
+
+def _intern(s: Optional[str]) -> str:
+    return sys.intern((s or "").strip())
+
+
+def _bullets(value: Any) -> Tuple[str, ...]:
+    # A list of bullets, or one newline-separated string (resume_cache.json shape)
+    if isinstance(value, str):
+        value = value.splitlines()
+    return tuple(s.strip() for s in value or () if s and s.strip())
+
+
+@dataclass(frozen=True, slots=True)
+class Job:
+    header: str
+    bullets: Tuple[str, ...] = ()
+
+
+@dataclass(frozen=True, slots=True)
+class Publication:
+    title: str
+    venue: str = ""
+    url: str = ""
+
+    @classmethod
+    def from_dict(cls, d: Dict[str, Any]) -> "Publication":
+        return cls(
+            title=(d.get("title") or "").strip(),
+            venue=_intern(d.get("venue")),
+            url=(d.get("url") or "").strip(),
+        )
+
+    def to_dict(self) -> Dict[str, str]:
+        return {"title": self.title, "venue": self.venue, "url": self.url}
+
+
+@dataclass(frozen=True, slots=True)
+class Education:
+    text: str
+
+
+@dataclass(frozen=True, slots=True)
+class Resume:
+    name: str = ""
+    role: str = DEFAULT_ROLE
+    contact_line: str = ""
+    summary: str = ""
+    publications: Tuple[str, ...] = ()
+    experience: Tuple[Job, ...] = ()
+    education: Tuple[Education, ...] = ()
+    certifications: Tuple[str, ...] = ()
+
+    @classmethod
+    def from_dict(cls, d: Dict[str, Any]) -> "Resume":
+        # Accepts the parser's dict (experience: {header: [bullets]})
+        experience = d.get("experience") or {}
+        return cls(
+            name=_intern(d.get("name")),
+            role=_intern(d.get("role") or DEFAULT_ROLE),
+            contact_line=(d.get("contact_line") or "").strip(),
+            summary=(d.get("summary") or "").strip(),
+            publications=tuple(d.get("publications") or ()),
+            experience=tuple(Job(_intern(header), _bullets(bullets)) for header, bullets in experience.items()),
+            education=tuple(Education(_intern(e)) for e in d.get("education") or ()),
+            certifications=tuple(_intern(c) for c in d.get("certifications") or ()),
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "role": self.role,
+            "contact_line": self.contact_line,
+            "summary": self.summary,
+            "publications": list(self.publications),
+            "experience": {job.header: list(job.bullets) for job in self.experience},
+            "education": [e.text for e in self.education],
+            "certifications": list(self.certifications),
+        }
+
+
+def publications_from_json(items: Iterable[Dict[str, Any]]) -> Tuple[Publication, ...]:
+    return tuple(Publication.from_dict(p) for p in items if isinstance(p, dict))
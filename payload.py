@@ -0,0 +1,109 @@
+import logging
+from typing import Dict, Any, List, Optional
+
+log = logging.getLogger(__name__)
+
+# ---------------------------
+# Payload meter: bytes pushed to the browser per section, per rerun
+# ---------------------------
+# Budgets in bytes of serialized ForwardMsg deltas. Override any of them with a
+# [payload_budget] table in .streamlit/secrets.toml.
+DEFAULT_BUDGETS: Dict[str, int] = {
+    "css": 2_000,
+    "header": 8_000,
+    "summary": 4_000,
+    "experience": 60_000,
+    "publications": 4_000,
+    "certs": 150_000,
+    "education": 70_000,
+    "projects": 8_000,
+    "about": 4_000,
+    "search": 1_000,
+    "total": 300_000,
+}
+
+
+class PayloadMeter:
+    """Counts the serialized size of every delta enqueued during one script run.
+
+    Sizes are attributed to whatever section was last passed to ``mark``. When
+    disabled, ``mark`` is a no-op and nothing is hooked.
+    """
+
+    def __init__(self, enabled: bool = False, budgets: Optional[Dict[str, int]] = None):
+        self.enabled = enabled
+        self.budgets = dict(DEFAULT_BUDGETS, **(budgets or {}))
+        self.sizes: Dict[str, int] = {}
+        self.counts: Dict[str, int] = {}
+        self._section = "other"
+        self._restore = None
+
+    def start(self) -> bool:
+        if not self.enabled:
+            return False
+        try:
+            from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+            ctx = get_script_run_ctx()
+            # Unwrap a hook left behind by a run that ended early (st.rerun / exception)
+            original = getattr(ctx._enqueue, "_payload_original", ctx._enqueue)
+        except Exception:
+            # Internal hook unavailable (no runtime / different Streamlit version)
+            self.enabled = False
+            return False
+
+        def _enqueue(msg):
+            try:
+                size = msg.ByteSize()
+            except Exception:
+                size = 0
+            self.sizes[self._section] = self.sizes.get(self._section, 0) + size
+            self.counts[self._section] = self.counts.get(self._section, 0) + 1
+            original(msg)
+
+        _enqueue._payload_original = original
+        ctx._enqueue = _enqueue
+        self._restore = (ctx, original)
+        return True
+
+    def stop(self):
+        if self._restore:
+            ctx, original = self._restore
+            ctx._enqueue = original
+            self._restore = None
+
+    def mark(self, section: str):
+        if self.enabled:
+            self._section = section
+
+    @property
+    def total(self) -> int:
+        return sum(self.sizes.values())
+
+    def report(self, previous: Optional[Dict[str, int]] = None) -> List[Dict[str, Any]]:
+        previous = previous or {}
+        sizes = self.snapshot()
+        counts = dict(self.counts, total=sum(self.counts.values()))
+        rows = []
+        for section, size in sizes.items():
+            budget = self.budgets.get(section)
+            rows.append(
+                {
+                    "section": section,
+                    "bytes": size,
+                    "elements": counts.get(section, 0),
+                    "budget": budget,
+                    "delta": size - previous[section] if section in previous else None,
+                    "over_budget": bool(budget is not None and size > budget),
+                }
+            )
+        return rows
+
+    def snapshot(self) -> Dict[str, int]:
+        return dict(self.sizes, total=self.total)
+
+    def warn_over_budget(self, rows: List[Dict[str, Any]]):
+        # Written to the server log so CI / smoke runs can grep for regressions
+        for row in rows:
+            if row["over_budget"]:
+                log.warning("%s: %d bytes exceeds budget %d", row["section"], row["bytes"], row["budget"])
@@ -0,0 +1,126 @@
+import os, re, hmac, time, threading
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional, Tuple
+
+import search
+from github_client import ContentCache, fetch_raw
+from incremental import RESUME_HISTORY
+
+# ---------------------------
+# Preview rendering of other refs (?ref=<branch|tag|sha>)
+# ---------------------------
+# Every previewed ref gets its own small ContentCache, so previews never evict the
+# production entries in github_client.CONTENT. At most PREVIEW_MAX_REFS refs stay
+# cached; the least recently viewed one is dropped (with its search index and
+# resume history). Branches and tags move, so their caches expire after
+# PREVIEW_TTL; a full commit SHA is immutable and is kept until evicted.
+PREVIEW_MAX_REFS = int(os.environ.get("PORTFOLIO_PREVIEW_MAX_REFS", "8"))
+PREVIEW_MAX_BYTES = int(os.environ.get("PORTFOLIO_PREVIEW_MAX_BYTES", 32 * 1024 * 1024))
+PREVIEW_TTL = 120.0
+
+_REF_RE = re.compile(r"^[A-Za-z0-9][A-Za-z0-9._/-]{0,199}$")
+_SHA_RE = re.compile(r"^[0-9a-f]{40}$")
+
+RepoRef = Tuple[str, str, str]  # (owner, repo, ref)
+
+
+def valid_ref(ref: Optional[str]) -> bool:
+    return bool(ref) and bool(_REF_RE.match(ref)) and ".." not in ref and not ref.endswith((".", "/", ".lock"))
+
+
+def is_commit_sha(ref: str) -> bool:
+    return bool(_SHA_RE.match(ref))
+
+
+class PreviewDenied(ValueError):
+    pass
+
+
+def preview_ref(
+    ref: Optional[str], production: str, supplied_key: Optional[str], key: str, enabled: Optional[bool] = None
+) -> Optional[str]:
+    """The ref to render, or None for production; raises PreviewDenied for refs that may not be previewed.
+
+    Every new ref costs uncached upstream fetches from the shared token budget, so
+    previews are off unless a key is configured (or ``enabled`` opts in without one).
+    """
+    if not ref or ref == production:
+        return None
+    if not (bool(key) if enabled is None else enabled):
+        raise PreviewDenied("previews are disabled")
+    if key and not hmac.compare_digest(supplied_key or "", key):
+        raise PreviewDenied("a valid preview key is required")
+    if not valid_ref(ref):
+        raise PreviewDenied(f"invalid ref {ref!r}")
+    return ref
+
+
+class PreviewCaches:
+    """One bounded ContentCache per previewed (owner, repo, ref), least recently used evicted first."""
+
+    def __init__(self, max_refs: int = PREVIEW_MAX_REFS, max_bytes: int = PREVIEW_MAX_BYTES, ttl: float = PREVIEW_TTL):
+        self.max_refs = max_refs
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._caches: "OrderedDict[RepoRef, Tuple[float, ContentCache]]" = OrderedDict()
+        self.evictions = 0
+        self.expirations = 0
+
+    def cache_for(self, owner: str, repo: str, ref: str) -> ContentCache:
+        key = (owner, repo, ref)
+        now = time.time()
+        dropped: List[RepoRef] = []
+        with self._lock:
+            entry = self._caches.get(key)
+            if entry is not None and not is_commit_sha(ref) and now - entry[0] > self.ttl:
+                del self._caches[key]
+                dropped.append(key)
+                self.expirations += 1
+                entry = None
+            if entry is None:
+                # Raw source only: the hedged mirrors serve the production branch, not arbitrary refs
+                entry = (now, ContentCache(fetch_raw, max_bytes=self.max_bytes))
+                self._caches[key] = entry
+            self._caches.move_to_end(key)
+            while len(self._caches) > max(1, self.max_refs):
+                dropped.append(self._caches.popitem(last=False)[0])
+                self.evictions += 1
+        for repo_ref in dropped:
+            _forget(repo_ref)
+        return entry[1]
+
+    def clear(self):
+        with self._lock:
+            dropped = list(self._caches)
+            self._caches.clear()
+        for repo_ref in dropped:
+            _forget(repo_ref)
+
+    def stats(self) -> Dict[str, Any]:
+        now = time.time()
+        rows = []
+        for (owner, repo, ref), (created, cache) in list(self._caches.items()):
+            rows.append({
+                "ref": f"{owner}/{repo}@{ref}",
+                "bytes": cache.bytes,
+                "hits": cache.hits,
+                "misses": cache.misses,
+                "age_s": round(now - created),
+            })
+        return {
+            "refs": len(rows),
+            "max_refs": self.max_refs,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "entries": rows,
+        }
+
+
+def _forget(repo_ref: RepoRef):
+    # Anything else keyed by this ref would otherwise outlive its cache
+    search.drop_index(repo_ref)
+    RESUME_HISTORY.forget(lambda source: tuple(source[:3]) == repo_ref)
+
+
+PREVIEWS = PreviewCaches()
@@ -0,0 +1,170 @@
+import os, sys, json, time, cProfile, pstats, threading
+from collections import Counter
+from typing import Dict, Any, List, Optional, Tuple
+
+# ---------------------------
+# Opt-in run profiler
+# ---------------------------
+# "cprofile" is deterministic (every call, saved as .pstats for snakeviz/pstats);
+# "sample" walks the script thread's stack every SAMPLE_INTERVAL seconds and is
+# saved as speedscope JSON (https://www.speedscope.app).
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+PROFILE_DIR = os.environ.get("PORTFOLIO_PROFILE_DIR", os.path.join(BASE_DIR, "profiles"))
+PROFILE_KEEP = 50  # newest profiles kept in PROFILE_DIR
+SAMPLE_INTERVAL = 0.001
+MODES = ("cprofile", "sample")
+
+# One deterministic profiler per process: on 3.12+ a second enable() raises
+# ValueError("Another profiling tool is already active")
+_CPROFILE_LOCK = threading.Lock()
+
+Frame = Tuple[str, str, int]  # (function, file, first line)
+
+
+def _frame_key(code) -> Frame:
+    return (code.co_name, code.co_filename, code.co_firstlineno)
+
+
+def _short(frame: Frame) -> str:
+    name, filename, line = frame
+    return f"{name} ({os.path.basename(filename)}:{line})"
+
+
+class StackSampler:
+    """Samples one thread's Python stack from a background thread."""
+
+    def __init__(self, thread_id: int, interval: float = SAMPLE_INTERVAL):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks: Counter = Counter()  # root->leaf tuple of frames -> seconds
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="profile-sampler", daemon=True)
+
+    def _run(self):
+        last = time.perf_counter()
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            now = time.perf_counter()
+            if frame is not None:
+                stack = []
+                while frame is not None:
+                    stack.append(_frame_key(frame.f_code))
+                    frame = frame.f_back
+                self.stacks[tuple(reversed(stack))] += now - last
+            last = now
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+
+class RunProfile:
+    """Profiles one script run: ``with RunProfile("sample"): main()``."""
+
+    def __init__(self, mode: str = "cprofile", label: str = "run"):
+        self.mode = mode if mode in MODES else "cprofile"
+        self.label = label
+        self.started_at = time.time()
+        self.duration = 0.0
+        self._cprofile: Optional[cProfile.Profile] = None
+        self._sampler: Optional[StackSampler] = None
+        self.skipped: Optional[str] = None  # why nothing was profiled
+
+    def __enter__(self) -> "RunProfile":
+        self._t0 = time.perf_counter()
+        if self.mode == "sample":
+            self._sampler = StackSampler(threading.get_ident())
+            self._sampler.start()
+        elif not _CPROFILE_LOCK.acquire(blocking=False):
+            self.skipped = "another cProfile run is active"
+        else:
+            profile = cProfile.Profile()
+            try:
+                profile.enable()
+            except ValueError as e:  # a profiler outside this module (debugger, coverage)
+                _CPROFILE_LOCK.release()
+                self.skipped = str(e)
+            else:
+                self._cprofile = profile
+        return self
+
+    def __exit__(self, *exc):
+        if self._cprofile is not None:
+            self._cprofile.disable()
+            _CPROFILE_LOCK.release()
+        if self._sampler is not None:
+            self._sampler.stop()
+        self.duration = time.perf_counter() - self._t0
+        return False
+
+    def hotspots(self, n: int = 15) -> List[Dict[str, Any]]:
+        """Functions with the most self time."""
+        rows: List[Dict[str, Any]] = []
+        if self._cprofile is not None:
+            for (filename, line, name), (_, calls, self_t, total_t, _) in pstats.Stats(self._cprofile).stats.items():
+                rows.append({"function": _short((name, filename, line)), "self_ms": self_t * 1000,
+                             "total_ms": total_t * 1000, "calls": calls})
+        elif self._sampler is not None:
+            self_t: Counter = Counter()
+            total_t: Counter = Counter()
+            for stack, seconds in self._sampler.stacks.items():
+                self_t[stack[-1]] += seconds
+                for frame in set(stack):
+                    total_t[frame] += seconds
+            rows = [{"function": _short(f), "self_ms": self_t[f] * 1000, "total_ms": t * 1000, "calls": None}
+                    for f, t in total_t.items()]
+        rows.sort(key=lambda r: r["self_ms"], reverse=True)
+        for row in rows:
+            row["self_ms"] = round(row["self_ms"], 2)
+            row["total_ms"] = round(row["total_ms"], 2)
+        return rows[:n]
+
+    def _speedscope(self) -> Dict[str, Any]:
+        frames: Dict[Frame, int] = {}
+        samples, weights = [], []
+        for stack, seconds in self._sampler.stacks.items():
+            samples.append([frames.setdefault(f, len(frames)) for f in stack])
+            weights.append(seconds)
+        return {
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "shared": {"frames": [{"name": n, "file": f, "line": l} for n, f, l in frames]},
+            "profiles": [{
+                "type": "sampled",
+                "name": self.label,
+                "unit": "seconds",
+                "startValue": 0,
+                "endValue": sum(weights),
+                "samples": samples,
+                "weights": weights,
+            }],
+        }
+
+    def save(self, directory: str = PROFILE_DIR, keep: int = PROFILE_KEEP) -> str:
+        os.makedirs(directory, exist_ok=True)
+        stamp = time.strftime("%Y%m%d-%H%M%S", time.localtime(self.started_at))
+        base = os.path.join(directory, f"{stamp}-{int(self.started_at * 1000) % 1000:03d}-{self.label}")
+        if self._cprofile is not None:
+            path = base + ".pstats"
+            self._cprofile.dump_stats(path)
+        else:
+            path = base + ".speedscope.json"
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(self._speedscope(), f)
+        rotate(directory, keep)
+        return path
+
+
+def rotate(directory: str, keep: int = PROFILE_KEEP):
+    try:
+        names = [n for n in os.listdir(directory) if n.endswith((".pstats", ".speedscope.json"))]
+    except OSError:
+        return
+    paths = sorted((os.path.join(directory, n) for n in names), key=os.path.getmtime)
+    for path in paths[:-keep] if keep > 0 else paths:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
@@ -0,0 +1,59 @@
+import time, threading
+from typing import Dict, Any, Optional
+
+# ---------------------------
+# Readiness state
+# ---------------------------
+# Its own module so warmup.py run as __main__ and the app it starts (which
+# imports this, not warmup) share one READINESS.
+class Readiness:
+    """Warmup progress shared by the health server and the app's stats panel."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.state = "idle"  # idle -> warming -> ready | degraded
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self.tasks: Dict[str, Dict[str, Any]] = {}
+        # Set by warmup.py when it also runs the Streamlit server: not ready until it listens
+        self.server_expected = False
+        self.server_up = False
+
+    @property
+    def ready(self) -> bool:
+        return self.state == "ready" and (self.server_up or not self.server_expected)
+
+    def begin(self):
+        with self._lock:
+            self.state = "warming"
+            self.started_at = self.started_at or time.time()
+
+    def record(self, name: str, seconds: float, error: Optional[str] = None, required: bool = False):
+        with self._lock:
+            self.tasks[name] = {"ok": error is None, "ms": round(seconds * 1000, 1), "error": error, "required": required}
+
+    def finish(self):
+        with self._lock:
+            failed = [t for t in self.tasks.values() if t["required"] and not t["ok"]]
+            self.state = "degraded" if failed else "ready"
+            self.finished_at = time.time()
+
+    def expect_server(self):
+        self.server_expected = True
+
+    def server_started(self):
+        self.server_up = True
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            took = self.finished_at - self.started_at if self.started_at and self.finished_at else None
+            return {
+                "state": self.state,
+                "ready": self.ready,
+                "server": "up" if self.server_up else ("starting" if self.server_expected else None),
+                "warmup_ms": round(took * 1000, 1) if took is not None else None,
+                "tasks": dict(self.tasks),
+            }
+
+
+READINESS = Readiness()
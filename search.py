@@ -0,0 +1,192 @@
+import re, math, bisect, threading
+from collections import Counter
+from dataclasses import dataclass
+from typing import Dict, Hashable, Iterable, List, Optional, Tuple
+
+from models import Publication, Resume
+
+# ---------------------------
+# In-process full-text search (inverted index, prefix matching, BM25 ranking)
+# ---------------------------
+TOKEN_RE = re.compile(r"[a-z0-9]+[+#]*")
+STOPWORDS = frozenset(
+    "a an and are as at be by for from in into is it of on or the to with using via over".split()
+)
+BM25_K1 = 1.2
+BM25_B = 0.75
+PREFIX_WEIGHT = 0.6  # prefix-only matches score lower than exact terms
+MIN_PREFIX = 2
+
+
+def tokenize(text: str) -> List[str]:
+    return [t for t in TOKEN_RE.findall((text or "").lower()) if t not in STOPWORDS]
+
+
+@dataclass(frozen=True, slots=True)
+class Doc:
+    id: str
+    section: str  # anchor id: experience, projects, publications, about
+    title: str
+    text: str
+
+
+@dataclass(frozen=True, slots=True)
+class Hit:
+    doc: Doc
+    score: float
+    terms: Tuple[str, ...]
+
+
+class SearchIndex:
+    """Inverted index kept in sync with the current documents.
+
+    ``sync`` only indexes added/changed documents and drops removed ones, so a
+    content update costs proportional to what changed. Queries touch only the
+    posting lists of the query terms (plus a bisect over the sorted vocabulary
+    for prefixes).
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._docs: Dict[str, Doc] = {}
+        self._doc_terms: Dict[str, Counter] = {}
+        self._doc_len: Dict[str, int] = {}
+        self._postings: Dict[str, Dict[str, int]] = {}
+        self._vocab: List[str] = []
+        self._vocab_dirty = False
+        self._total_len = 0
+        self.version: Optional[Hashable] = None
+
+    def _add(self, doc: Doc):
+        terms = Counter(tokenize(f"{doc.title} {doc.text}"))
+        self._docs[doc.id] = doc
+        self._doc_terms[doc.id] = terms
+        self._doc_len[doc.id] = sum(terms.values())
+        self._total_len += self._doc_len[doc.id]
+        for term, tf in terms.items():
+            postings = self._postings.get(term)
+            if postings is None:
+                postings = self._postings[term] = {}
+                self._vocab_dirty = True
+            postings[doc.id] = tf
+
+    def _remove(self, doc_id: str):
+        self._docs.pop(doc_id, None)
+        self._total_len -= self._doc_len.pop(doc_id, 0)
+        for term in self._doc_terms.pop(doc_id, {}):
+            postings = self._postings.get(term)
+            if postings is not None:
+                postings.pop(doc_id, None)
+                if not postings:
+                    del self._postings[term]
+                    self._vocab_dirty = True
+
+    def sync(self, docs: Iterable[Doc], version: Optional[Hashable] = None) -> Tuple[int, int]:
+        """Make the index hold exactly ``docs``; returns (indexed, removed)."""
+        with self._lock:
+            if version is not None and version == self.version:
+                return 0, 0
+            incoming = {d.id: d for d in docs}
+            removed = [doc_id for doc_id in self._docs if doc_id not in incoming]
+            changed = [d for d in incoming.values() if self._docs.get(d.id) != d]
+            for doc_id in removed:
+                self._remove(doc_id)
+            for doc in changed:
+                self._remove(doc.id)
+                self._add(doc)
+            self.version = version
+            return len(changed), len(removed)
+
+    def _expand(self, token: str) -> List[Tuple[str, float]]:
+        matches = [(token, 1.0)] if token in self._postings else []
+        if len(token) >= MIN_PREFIX:
+            if self._vocab_dirty:
+                self._vocab = sorted(self._postings)
+                self._vocab_dirty = False
+            i = bisect.bisect_left(self._vocab, token)
+            while i < len(self._vocab) and self._vocab[i].startswith(token):
+                if self._vocab[i] != token:
+                    matches.append((self._vocab[i], PREFIX_WEIGHT))
+                i += 1
+        return matches
+
+    def search(self, query: str, limit: int = 10) -> List[Hit]:
+        tokens = tokenize(query)
+        if not tokens:
+            return []
+        with self._lock:
+            n_docs = len(self._docs)
+            if not n_docs:
+                return []
+            avg_len = self._total_len / n_docs
+            scores: Dict[str, float] = {}
+            matched: Dict[str, set] = {}
+
+            for i, token in enumerate(tokens):
+                seen_this_token = set()
+                for term, weight in self._expand(token):
+                    postings = self._postings[term]
+                    idf = math.log(1 + (n_docs - len(postings) + 0.5) / (len(postings) + 0.5))
+                    for doc_id, tf in postings.items():
+                        norm = tf + BM25_K1 * (1 - BM25_B + BM25_B * self._doc_len[doc_id] / avg_len)
+                        scores[doc_id] = scores.get(doc_id, 0.0) + weight * idf * tf * (BM25_K1 + 1) / norm
+                        seen_this_token.add(doc_id)
+                        matched.setdefault(doc_id, set()).add(term)
+                # Every query token must match (exactly or by prefix)
+                if i == 0:
+                    candidates = seen_this_token
+                else:
+                    candidates &= seen_this_token
+
+            ranked = sorted(candidates, key=lambda d: scores[d], reverse=True)[:limit]
+            return [Hit(self._docs[d], scores[d], tuple(sorted(matched[d]))) for d in ranked]
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+
+# One index per portfolio source, shared by all sessions
+_INDEXES: Dict[Hashable, SearchIndex] = {}
+_INDEXES_LOCK = threading.Lock()
+
+
+def index_for(source: Hashable) -> SearchIndex:
+    with _INDEXES_LOCK:
+        return _INDEXES.setdefault(source, SearchIndex())
+
+
+def drop_index(source: Hashable):
+    with _INDEXES_LOCK:
+        _INDEXES.pop(source, None)
+
+
+# Recorded versions (?version=) get an index each; only the most recently viewed few are kept
+HISTORY_INDEXES = 4
+
+
+def history_index(version_id: str) -> SearchIndex:
+    key = ("history", version_id)
+    with _INDEXES_LOCK:
+        index = _INDEXES.pop(key, None)
+        _INDEXES[key] = index = index if index is not None else SearchIndex()  # re-inserted as newest
+        kept = [k for k in _INDEXES if isinstance(k, tuple) and k[:1] == ("history",)]
+        for k in kept[:-HISTORY_INDEXES]:
+            del _INDEXES[k]
+        return index
+
+
+def documents(resume: Resume, publications: Iterable[Publication], projects_text: str, about_text: str) -> List[Doc]:
+    docs = []
+    for job in resume.experience:
+        for i, bullet in enumerate(job.bullets):
+            docs.append(Doc(f"job:{job.header}:{i}", "experience", job.header, bullet))
+    for i, pub in enumerate(publications):
+        docs.append(Doc(f"pub:{i}", "publications", pub.title, pub.venue))
+    # Project paragraphs come bulleted from parse_projects_docx_bytes; anything else is a placeholder
+    for i, line in enumerate((projects_text or "").splitlines()):
+        if line.startswith("• "):
+            docs.append(Doc(f"project:{i}", "projects", "Projects", line[2:]))
+    for i, para in enumerate(p.strip() for p in (about_text or "").split("\n\n")):
+        if para:
+            docs.append(Doc(f"about:{i}", "about", "About", para))
+    return docs
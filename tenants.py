@@ -0,0 +1,69 @@
+import os, json, threading
+from dataclasses import dataclass, fields
+from typing import Dict, Any, Optional
+
+# ---------------------------
+# Tenants (tenants.json): several portfolios served by one process
+# ---------------------------
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+TENANTS_PATH = os.environ.get("PORTFOLIO_TENANTS", os.path.join(BASE_DIR, "tenants.json"))
+
+
+@dataclass(frozen=True)
+class Tenant:
+    id: str
+    owner: str
+    repo: str
+    resume_path: str  # .docx, .json or .md (see ingest.py)
+    branch: str = "main"
+    linkedin_user: str = ""
+    profile_img: str = ""
+    projects_path: str = "projects.docx"
+    manifest: str = ""  # asset manifest path; empty = the default assets/manifest.json
+
+
+class TenantRegistry:
+    """Tenant configs from a JSON file, re-read when its mtime changes."""
+
+    def __init__(self, path: str = TENANTS_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        self._mtime: Optional[float] = None
+        self._tenants: Dict[str, Tenant] = {}
+
+    def _maybe_reload(self):
+        try:
+            mtime = os.path.getmtime(self.path)
+        except OSError:
+            mtime = -1.0
+        if mtime == self._mtime:
+            return
+
+        with self._lock:
+            tenants: Dict[str, Tenant] = {}
+            if mtime >= 0:
+                try:
+                    with open(self.path, "r", encoding="utf-8") as f:
+                        raw: Dict[str, Any] = json.load(f)
+                except (OSError, ValueError):
+                    return
+                known = {f.name for f in fields(Tenant)}
+                for tenant_id, cfg in raw.items():
+                    cfg = {k: v for k, v in (cfg or {}).items() if k in known and k != "id"}
+                    if cfg.get("owner") and cfg.get("repo") and cfg.get("resume_path"):
+                        tenants[tenant_id] = Tenant(id=tenant_id, **cfg)
+            self._tenants = tenants
+            self._mtime = mtime
+
+    def get(self, tenant_id: Optional[str]) -> Optional[Tenant]:
+        if not tenant_id:
+            return None
+        self._maybe_reload()
+        return self._tenants.get(tenant_id)
+
+    def all(self) -> Dict[str, Tenant]:
+        self._maybe_reload()
+        return dict(self._tenants)
+
+
+TENANTS = TenantRegistry()
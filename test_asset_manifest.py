@@ -0,0 +1,34 @@
+import json
+
+from asset_manifest import Asset, AssetRegistry
+
+SHA = "8919964d" + "0" * 56
+PATH = "assets/company_logos/acme.png"
+SPRITE = {
+    "image": "static/logos-test.webp",
+    "css": "static/logos-test.css",
+    "entries": {"companies": {PATH: SHA}},
+}
+
+
+def _asset() -> Asset:
+    return Asset(path=PATH, size=3, sha256=SHA, mime="image/png", data=b"png", data_uri="data:image/png;base64,cG5n")
+
+
+def _registry(tmp_path, manifest):
+    path = tmp_path / "manifest.json"
+    path.write_text(json.dumps(manifest), encoding="utf-8")
+    return AssetRegistry(str(path))
+
+
+def test_preload_keeps_bundled_sprite(tmp_path):
+    registry = _registry(tmp_path, {"groups": {}, "assets": {}})
+    registry.preload({"companies": {"Acme": PATH}}, {PATH: _asset()}, SPRITE)
+    assert registry.sprite_class("companies", PATH) == "sprite sprite-companies sprite-companies-8919964d"
+    assert registry.sprite_css_name() == "logos-test.css"
+
+
+def test_preload_without_sprite_uses_manifest_on_disk(tmp_path):
+    registry = _registry(tmp_path, {"groups": {}, "assets": {}, "sprite": SPRITE})
+    registry.preload({"companies": {"Acme": PATH}}, {PATH: _asset()})
+    assert registry.sprite_class("companies", PATH) == "sprite sprite-companies sprite-companies-8919964d"
@@ -0,0 +1,208 @@
+"""Warm the process-wide caches at process start and report readiness.
+
+    python warmup.py [--health-port 8502] [--wait] [streamlit run options...]
+
+Starts a small health server, warms every tenant (config.DEFAULT_TENANT plus
+tenants.json) concurrently, and runs the Streamlit server in the same process,
+so app.py renders from the caches that were just filled. Point the load
+balancer's readiness probe at ``/readyz`` (503 until warm) and its liveness
+probe at ``/healthz``. ``/readyz`` turns 200 only once the caches are warm
+and the Streamlit server answers its own health check.
+"""
+import os, sys, json, time, logging, argparse, threading, urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from typing import Any, Callable, List, Optional, Tuple
+
+import github_client
+import search
+from asset_manifest import AVATARS, registry_for
+from config import DEFAULT_TENANT
+from readiness import READINESS, Readiness
+from loaders import download_raw_text, load_projects_from_github, load_publications_from_github, load_resume_from_github
+from tenants import TENANTS, Tenant
+
+log = logging.getLogger(__name__)
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+APP_PATH = os.path.join(BASE_DIR, "app.py")
+HEALTH_HOST = os.environ.get("PORTFOLIO_HEALTH_HOST", "0.0.0.0")
+HEALTH_PORT = int(os.environ.get("PORTFOLIO_HEALTH_PORT", "8502"))
+STREAMLIT_PORT = 8501
+SERVER_POLL_INTERVAL = 0.5
+WARMUP_WORKERS = 8
+# Failed required tasks (a tenant's resume) are retried until they succeed
+RETRY_INTERVAL = 15.0
+ASSET_GROUPS = ("companies", "education", "certifications")
+
+
+# ---------------------------
+# Warmup
+# ---------------------------
+def static_serving_enabled() -> bool:
+    try:
+        from streamlit import config as st_config
+
+        return bool(st_config.get_option("server.enableStaticServing"))
+    except Exception:
+        return False
+
+
+def tenant_tasks(tenant: Tenant, static: bool) -> List[Tuple[str, Callable[[], Any], bool]]:
+    owner, repo, branch = tenant.owner, tenant.repo, tenant.branch
+    registry = registry_for(tenant.manifest)
+    tasks = [
+        ("resume", lambda: load_resume_from_github(owner, repo, tenant.resume_path, branch), True),
+        ("publications", lambda: load_publications_from_github(owner, repo, branch), False),
+        ("projects", lambda: load_projects_from_github(owner, repo, branch, path=tenant.projects_path), False),
+        ("about", lambda: download_raw_text(owner, repo, "aboutpage.txt", branch), False),
+        ("assets", lambda: [registry.logo_map(group) for group in ASSET_GROUPS], False),
+    ]
+    if tenant.profile_img:
+        tasks.append(("avatar", lambda: AVATARS.get(tenant.profile_img, static=static), False))
+    return [(f"{tenant.id}:{name}", fn, required) for name, fn, required in tasks]
+
+
+def index_tenant(tenant: Tenant):
+    # Same documents and version as app.py, so the first search is a no-op sync
+    owner, repo, branch = tenant.owner, tenant.repo, tenant.branch
+    resume = load_resume_from_github(owner, repo, tenant.resume_path, branch)
+    pubs = load_publications_from_github(owner, repo, branch)
+    projects_text = load_projects_from_github(owner, repo, branch, path=tenant.projects_path)
+    about_txt = download_raw_text(owner, repo, "aboutpage.txt", branch)
+    search.index_for((owner, repo, branch)).sync(
+        search.documents(resume, pubs, projects_text, about_txt), version=(resume, pubs, projects_text, about_txt)
+    )
+
+
+def _run(name: str, fn: Callable[[], Any], required: bool, readiness: Readiness) -> bool:
+    t0 = time.perf_counter()
+    try:
+        fn()
+    except Exception as e:
+        readiness.record(name, time.perf_counter() - t0, f"{type(e).__name__}: {e}", required)
+        return False
+    readiness.record(name, time.perf_counter() - t0, None, required)
+    return True
+
+
+def warm(
+    tenants: Optional[List[Tenant]] = None, workers: int = WARMUP_WORKERS, readiness: Readiness = READINESS
+) -> bool:
+    """Fill the caches for every tenant concurrently; returns True when all required tasks succeeded."""
+    if tenants is None:
+        tenants = [DEFAULT_TENANT, *TENANTS.all().values()]
+    static = static_serving_enabled()
+    readiness.begin()
+    tasks = [task for tenant in tenants for task in tenant_tasks(tenant, static)]
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        list(pool.map(lambda task: _run(*task, readiness), tasks))
+        # Search needs every source of a tenant, so it runs after the loads (from cache)
+        list(pool.map(lambda t: _run(f"{t.id}:search", lambda: index_tenant(t), False, readiness), tenants))
+    readiness.finish()
+    return readiness.ready
+
+
+def warm_until_ready(
+    tenants: Optional[List[Tenant]] = None, workers: int = WARMUP_WORKERS, retry_interval: float = RETRY_INTERVAL
+):
+    while not warm(tenants, workers):
+        failed = [n for n, t in READINESS.tasks.items() if t["required"] and not t["ok"]]
+        log.warning("not ready (%s); retrying in %.0f s", ", ".join(failed), retry_interval)
+        time.sleep(retry_interval)
+    log.info("ready in %s ms", READINESS.snapshot()["warmup_ms"])
+
+
+# ---------------------------
+# Health server: /healthz (liveness), /readyz (readiness)
+# ---------------------------
+class HealthServer:
+    def __init__(self, host: str = HEALTH_HOST, port: int = HEALTH_PORT, readiness: Readiness = READINESS):
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                path = self.path.split("?", 1)[0]
+                if path == "/healthz":
+                    status, body = 200, {"state": "alive"}
+                elif path == "/readyz":
+                    body = readiness.snapshot()
+                    status = 200 if readiness.ready else 503
+                else:
+                    status, body = 404, {"error": "not found"}
+                data = json.dumps(body).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.send_header("Cache-Control", "no-store")
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer((host, port), Handler)
+        self.url = f"http://{host}:{self.httpd.server_address[1]}"
+
+    def start(self) -> "HealthServer":
+        threading.Thread(target=self.httpd.serve_forever, name="health", daemon=True).start()
+        return self
+
+
+def streamlit_option(streamlit_args: List[str], name: str, default: str) -> str:
+    # "--server.port 8501" or "--server.port=8501", then STREAMLIT_SERVER_PORT, then the default
+    flag = f"--{name}"
+    for i, arg in enumerate(streamlit_args):
+        if arg.startswith(flag + "="):
+            return arg.split("=", 1)[1]
+        if arg == flag and i + 1 < len(streamlit_args):
+            return streamlit_args[i + 1]
+    return os.environ.get("STREAMLIT_" + name.upper().replace(".", "_"), default)
+
+
+def wait_for_server(url: str, readiness: Readiness = READINESS, interval: float = SERVER_POLL_INTERVAL):
+    # Streamlit's CLI blocks and has no started callback; poll its health endpoint instead
+    while True:
+        try:
+            with urllib.request.urlopen(url, timeout=2) as r:
+                if r.status == 200:
+                    readiness.server_started()
+                    log.info("streamlit is up at %s", url)
+                    return
+        except OSError:
+            pass
+        time.sleep(interval)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--health-host", default=HEALTH_HOST)
+    parser.add_argument("--health-port", type=int, default=HEALTH_PORT)
+    parser.add_argument("--workers", type=int, default=WARMUP_WORKERS)
+    parser.add_argument("--wait", action="store_true", help="start Streamlit only once warm")
+    args, streamlit_args = parser.parse_known_args(argv)
+    logging.basicConfig(level=logging.INFO, format="[%(name)s] %(message)s")
+
+    # Secrets are not available outside Streamlit; tokens come from the environment here
+    tokens = [os.environ.get("GITHUB_TOKEN")] + [t for t in os.environ.get("GITHUB_TOKENS", "").split(",") if t]
+    github_client.configure(tokens, background_refresh=False)
+
+    READINESS.expect_server()
+    host = streamlit_option(streamlit_args, "server.address", "") or "127.0.0.1"
+    port = streamlit_option(streamlit_args, "server.port", str(STREAMLIT_PORT))
+    threading.Thread(
+        target=wait_for_server, args=(f"http://{host}:{port}/_stcore/health",), name="server-probe", daemon=True
+    ).start()
+    health = HealthServer(args.health_host, args.health_port).start()
+    log.info("health checks on %s/readyz", health.url)
+    warmer = threading.Thread(target=warm_until_ready, kwargs={"workers": args.workers}, name="warmup", daemon=True)
+    warmer.start()
+    if args.wait:
+        warmer.join()
+
+    from streamlit.web import cli as stcli
+
+    sys.argv = ["streamlit", "run", APP_PATH, *streamlit_args]
+    return stcli.main()
+
+
+if __name__ == "__main__":
+    sys.exit(main())